@@ -74,7 +74,7 @@ from . utils.registration import get_core, get_prefs, get_tools, get_pie_menus,
 from . utils.registration import register_classes, unregister_classes, register_keymaps, unregister_keymaps, register_icons, unregister_icons, register_msgbus, unregister_msgbus
 from . utils.system import verify_update, install_update
 from . ui.menus import asset_browser_bookmark_buttons, asset_browser_metadata, object_context_menu, mesh_context_menu, add_object_buttons, material_pick_button, outliner_group_toggles, extrude_menu, group_origin_adjustment_toggle, render_menu, render_buttons, asset_browser_update_thumbnail
-from . handlers import load_post, undo_pre, depsgraph_update_post, render_start, render_end
+from . handlers import scheduler, load_post, undo_pre, depsgraph_update_post, render_start, render_end
 from time import time
 
 def update_check():
@@ -314,6 +314,7 @@ def unregister():
         bpy.types.SpaceView3D.draw_handler_remove(screencastHUD, 'WINDOW')
 
     bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    scheduler.unregister()
 
     bpy.app.handlers.render_init.remove(render_start)
     bpy.app.handlers.render_cancel.remove(render_end)
@@ -1,8 +1,11 @@
 import bpy
 import os
+import gzip
+import shutil
+from threading import Lock, Thread
 from bpy.app.handlers import persistent
 from time import time
-from . utils.application import delay_execution, set_prop_safe
+from . utils.application import DepsgraphScheduler, delay_execution, set_prop_safe
 from . utils.asset import validate_assetbrowser_bookmarks
 from . utils.draw import draw_axes_HUD, draw_focus_HUD, draw_surface_slide_HUD, draw_screen_cast_HUD, draw_group_poses_VIEW3D
 from . utils.group import get_pose_batches, process_group_poses, select_group_children, set_group_pose, set_pose_uuid
@@ -15,6 +18,27 @@ from . utils.view import sync_light_visibility
 
 global_debug = False
 
+scheduler = DepsgraphScheduler("MACHIN3tools")
+
+def is_state_changed(changes):
+    if changes is None:
+        return True
+
+    return changes['active_changed'] or changes['scene'] or bool(changes['other']) or 'COLLECTION' in changes['id_types']
+
+def is_active_changed(changes, geometry=False):
+    if changes is None or changes['active_changed'] or changes['scene']:
+        return True
+
+    active = changes['active']
+    return active in changes['other'] or (geometry and active in changes['edited'])
+
+def is_group_changed(changes):
+    if changes is None or changes['active_changed'] or changes['scene'] or 'COLLECTION' in changes['id_types']:
+        return True
+
+    return any(obj.type == 'EMPTY' and obj.M3.is_group_empty for obj in changes['other'])
+
 axesHUD = None
 prev_axes_objects = []
 
@@ -477,6 +501,35 @@ def manage_lights_increase():
 
                     adjust_lights_for_rendering(mode='INCREASE', debug=debug)
 
+undo_save_changes = 0
+undo_save_last_changes = None
+undo_save_last_time = 0
+undo_save_snapshot = 0
+undo_save_compressor = None
+undo_save_generations = {}
+undo_save_lock = Lock()
+
+def compress_undo_save(rawpath, filepath, generation):
+    tmppath = filepath + '.tmp'
+
+    try:
+        with open(rawpath, 'rb') as raw, gzip.open(tmppath, 'wb', compresslevel=1) as compressed:
+            shutil.copyfileobj(raw, compressed, 1024 * 1024)
+
+        with undo_save_lock:
+
+            # don't replace a newer save, written while this one was compressed
+            if undo_save_generations.get(filepath) == generation:
+                os.replace(tmppath, filepath)
+
+    except OSError as e:
+        print(f"WARNING: Undo Save compression of {filepath} failed: {e}")
+
+    finally:
+        for path in [rawpath, tmppath]:
+            if os.path.exists(path):
+                os.remove(path)
+
 def pre_undo_save():
     global global_debug
 
@@ -491,7 +544,7 @@ def pre_undo_save():
         m3 = scene.M3
 
         if m3.use_undo_save:
-            global last_active_operator
+            global last_active_operator, undo_save_last_changes, undo_save_last_time, undo_save_snapshot, undo_save_compressor
 
             C = bpy.context
 
@@ -506,6 +559,19 @@ def pre_undo_save():
                     first_redo = True
 
             if C.active_operator is None or first_redo:
+
+                if undo_save_changes == undo_save_last_changes:
+                    if debug:
+                        print("    skipping, nothing changed since the last save")
+                    return
+
+                p = get_prefs()
+
+                if time() - undo_save_last_time < p.save_pie_undo_save_interval:
+                    if debug:
+                        print("    skipping, last save is too recent")
+                    return
+
                 temp_dir = get_temp_dir(bpy.context)
 
                 if temp_dir:
@@ -523,7 +589,13 @@ def pre_undo_save():
                         filename = "startup.blend"
 
                     name, ext = os.path.splitext(filename)
-                    filepath = os.path.join(temp_dir, name + '_undosave' + ext)
+
+                    if p.save_pie_undo_save_snapshots > 1:
+                        undo_save_snapshot = undo_save_snapshot % p.save_pie_undo_save_snapshots + 1
+                        filepath = os.path.join(temp_dir, f"{name}_undosave_{undo_save_snapshot}{ext}")
+
+                    else:
+                        filepath = os.path.join(temp_dir, name + '_undosave' + ext)
 
                     if debug:
                         print("     to temp folder:", filepath)
@@ -531,7 +603,30 @@ def pre_undo_save():
                     if debug:
                         start = time()
 
-                    bpy.ops.wm.save_as_mainfile(filepath=filepath, check_existing=True, copy=True, compress=True)
+                    compression = p.save_pie_undo_save_compression
+
+                    if compression == 'BACKGROUND' and undo_save_compressor and undo_save_compressor.is_alive():
+                        if debug:
+                            print("     still compressing the previous save, saving uncompressed")
+
+                        compression = 'NONE'
+
+                    with undo_save_lock:
+                        generation = undo_save_generations.get(filepath, 0) + 1
+                        undo_save_generations[filepath] = generation
+
+                        if compression == 'BACKGROUND':
+                            rawpath = os.path.join(temp_dir, name + '_undosave_raw' + ext)
+                            bpy.ops.wm.save_as_mainfile(filepath=rawpath, check_existing=False, copy=True, compress=False)
+
+                            undo_save_compressor = Thread(target=compress_undo_save, args=(rawpath, filepath, generation), daemon=True)
+                            undo_save_compressor.start()
+
+                        else:
+                            bpy.ops.wm.save_as_mainfile(filepath=filepath, check_existing=True, copy=True, compress=compression == 'SAVE')
+
+                    undo_save_last_changes = undo_save_changes
+                    undo_save_last_time = time()
 
                     if debug:
                         print("     save time:", time() - start)
@@ -638,8 +733,13 @@ def render_end(scene):
         delay_execution(manage_lights_increase)
 
 @persistent
-def depsgraph_update_post(scene):
-    global global_debug
+def depsgraph_update_post(scene, depsgraph):
+    global global_debug, undo_save_changes
+
+    undo_save_changes += 1
+
+    scheduler.debug = global_debug
+    changes = scheduler.get_changes(depsgraph)
 
     if global_debug:
         print()
@@ -651,38 +751,38 @@ def depsgraph_update_post(scene):
         if global_debug:
             print(" managing axes HUD")
 
-        delay_execution(manage_axes_HUD)
+        scheduler.schedule(manage_axes_HUD, is_state_changed(changes))
 
     if p.activate_focus:
         if global_debug:
             print(" managing focus HUD")
 
-        delay_execution(manage_focus_HUD)
+        scheduler.schedule(manage_focus_HUD, is_state_changed(changes))
 
     if p.activate_surface_slide:
         if global_debug:
             print(" managing surface slide HUD")
 
-        delay_execution(manage_surface_slide_HUD)
+        scheduler.schedule(manage_surface_slide_HUD, is_active_changed(changes, geometry=True))
 
     if p.activate_save_pie and p.show_screencast:
         if global_debug:
             print(" managing screen cast HUD")
 
-        delay_execution(manage_screen_cast_HUD)
+        scheduler.schedule(manage_screen_cast_HUD, is_state_changed(changes))
 
     if p.activate_group:
         if global_debug:
             print(" managing group")
 
-        delay_execution(manage_group)
+        scheduler.schedule(manage_group, is_group_changed(changes))
 
     if global_debug:
         print(" managing group poses VIEW3D")
 
-    delay_execution(manage_group_poses_VIEW3D)
+    scheduler.schedule(manage_group_poses_VIEW3D, is_group_changed(changes))
 
     if global_debug:
         print(" managing asset drop cleanup")
 
-    delay_execution(manage_asset_drop_cleanup)
+    scheduler.schedule(manage_asset_drop_cleanup)
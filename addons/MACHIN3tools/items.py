@@ -33,6 +33,10 @@ matcap_background_type_items = [("THEME", "Theme", ""),
                                 ("WORLD", "World", ""),
                                 ("VIEWPORT", "Viewport", "")]
 
+undo_save_compression_items = [("NONE", "None", "Store uncompressed Snapshots, fastest"),
+                               ("SAVE", "On Save", "Compress while saving, blocks the UI the longest"),
+                               ("BACKGROUND", "Background", "Save uncompressed, then compress the written file in a background thread")]
+
 smartvert_mode_items = [("MERGE", "Merge", ""),
                         ("CONNECT", "Connect Paths", "")]
 
@@ -6,7 +6,7 @@ from bl_ui.space_statusbar import STATUSBAR_HT_header as statusbar
 from mathutils import Vector, Matrix, Quaternion
 from mathutils.geometry import intersect_line_plane, intersect_point_line, intersect_line_line, distance_point_to_plane
 from math import radians, degrees
-from .. utils.draw import draw_point, draw_vector, draw_line, draw_points, draw_lines, draw_label
+from .. utils.draw import draw_point, draw_vector, draw_line, draw_points, draw_lines, draw_label, clear_batch_cache
 from .. utils.math import average_locations, get_loc_matrix, get_face_center
 from .. utils.property import step_enum
 from .. utils.registration import get_prefs
@@ -221,7 +221,7 @@ class TransformEdgeConstrained(bpy.types.Operator):
             draw_lines(self.slide_coords, mx=self.mx, color=(0.5, 1, 0.5), width=2, alpha=0.3)
 
         if self.original_edge_coords:
-            draw_lines(self.original_edge_coords, mx=self.mx, color=(1, 1, 1), width=1, alpha=0.1)
+            draw_lines(self.original_edge_coords, mx=self.mx, color=(1, 1, 1), width=1, alpha=0.1, key=self.batch_key, version=len(self.original_edge_coords))
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -290,6 +290,8 @@ class TransformEdgeConstrained(bpy.types.Operator):
 
         statusbar.draw = self.bar_orig
 
+        clear_batch_cache(self.batch_key)
+
         if self.objmode:
             bpy.ops.object.mode_set(mode='OBJECT')
 
@@ -326,6 +328,7 @@ class TransformEdgeConstrained(bpy.types.Operator):
 
         self.slide_coords = []
         self.original_edge_coords = []
+        self.batch_key = f"edge_constraint_{id(self)}"
         self.init_debug_coords()
 
         self.bm = bmesh.from_edit_mesh(self.active.data)
@@ -2,7 +2,7 @@ import bpy
 from bpy.props import BoolProperty, EnumProperty
 from bpy_extras.view3d_utils import region_2d_to_location_3d, region_2d_to_origin_3d, region_2d_to_vector_3d
 from mathutils import Vector
-from .. utils.draw import draw_vector, draw_circle, draw_point, draw_label, draw_bbox, draw_cross_3d
+from .. utils.draw import draw_vector, draw_circle, draw_point, draw_label, draw_bbox, draw_cross_3d, clear_batch_cache
 from .. utils.math import compare_matrix
 from .. utils.modifier import get_mod_obj, move_mod, remove_mod
 from .. utils.object import get_eval_bbox
@@ -197,11 +197,11 @@ class Mirror(bpy.types.Operator):
 
             if self.mirror_obj.type == 'MESH':
                 bbox = get_eval_bbox(self.mirror_obj)
-                draw_bbox(bbox, mx=mx, color=yellow, corners=0.1, width=2 * self.scale, alpha=0.5)
+                draw_bbox(bbox, mx=mx, color=yellow, corners=0.1, width=2 * self.scale, alpha=0.5, key=self.batch_key, version=self.mirror_obj.name)
 
             elif self.mirror_obj.type == 'EMPTY':
                 loc = mx.inverted_safe() @ mx.to_translation()
-                draw_cross_3d(loc, mx=mx, color=blue, width=2 * self.scale, length=2 * self.cursor_empty_zoom, alpha=1)
+                draw_cross_3d(loc, mx=mx, color=blue, width=2 * self.scale, length=2 * self.cursor_empty_zoom, alpha=1, key=self.batch_key, version=(self.mirror_obj.name, self.cursor_empty_zoom))
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -329,6 +329,8 @@ class Mirror(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        clear_batch_cache(self.batch_key)
+
         finish_status(self)
 
         self.active.select_set(True)
@@ -356,6 +358,7 @@ class Mirror(bpy.types.Operator):
             self.flick_distance = get_prefs().mirror_flick_distance * self.scale
 
             self.mirror_obj = None
+            self.batch_key = f"mirror_{id(self)}"
             self.mirror_mods = self.get_mirror_mods([self.active])
             self.sel_mirror_mods = self.get_mirror_mods(self.sel)
             self.cursor_empty = self.get_matching_cursor_empty(context)
@@ -4,7 +4,7 @@ from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_
 import bmesh
 from mathutils import Vector
 from mathutils.geometry import intersect_point_line, intersect_line_line, intersect_line_plane
-from .. utils.draw import draw_lines, draw_point, draw_tris
+from .. utils.draw import draw_lines, draw_point, draw_tris, clear_batch_cache
 from .. utils.graph import get_shortest_path
 from .. utils.math import average_locations, get_center_between_verts, get_face_center
 from .. utils.property import step_enum
@@ -108,25 +108,25 @@ class SmartVert(bpy.types.Operator):
 
     def draw_VIEW3D(self):
         if self.coords:
-            draw_lines(self.coords, mx=self.mx, color=(0.5, 1, 0.5), width=2, alpha=0.5)
+            draw_lines(self.coords, mx=self.mx, color=(0.5, 1, 0.5), width=2, alpha=0.5, key=f"{self.batch_key}_slide", version=self.draw_version)
 
         if self.is_snapping:
             if self.snap_element == 'EDGE':
                 if self.snap_coords:
-                    draw_lines(self.snap_coords, color=(1, 0, 0), width=3, alpha=0.75)
+                    draw_lines(self.snap_coords, color=(1, 0, 0), width=3, alpha=0.75, key=f"{self.batch_key}_snap", version=self.draw_version)
 
                 if self.snap_proximity_coords:
-                    draw_lines(self.snap_proximity_coords, mx=self.mx, color=(1, 0, 0), width=1, alpha=0.3)
+                    draw_lines(self.snap_proximity_coords, mx=self.mx, color=(1, 0, 0), width=1, alpha=0.3, key=f"{self.batch_key}_proximity", version=self.draw_version)
 
                 if self.snap_ortho_coords:
-                    draw_lines(self.snap_ortho_coords, mx=self.mx, color=(1, 0.7, 0), width=1, alpha=0.3)
+                    draw_lines(self.snap_ortho_coords, mx=self.mx, color=(1, 0.7, 0), width=1, alpha=0.3, key=f"{self.batch_key}_ortho", version=self.draw_version)
 
             elif self.snap_element == 'FACE':
                 if self.snap_tri_coords:
-                    draw_tris(self.snap_tri_coords, color=(1, 0, 0), alpha=0.1)
+                    draw_tris(self.snap_tri_coords, color=(1, 0, 0), alpha=0.1, key=f"{self.batch_key}_snap", version=self.draw_version)
 
                 if self.snap_ortho_coords:
-                    draw_lines(self.snap_ortho_coords, mx=self.mx, color=(1, 0.7, 0), width=1, alpha=0.3)
+                    draw_lines(self.snap_ortho_coords, mx=self.mx, color=(1, 0.7, 0), width=1, alpha=0.3, key=f"{self.batch_key}_ortho", version=self.draw_version)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -237,6 +237,9 @@ class SmartVert(bpy.types.Operator):
     def finish(self, context):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        for name in ['slide', 'snap', 'proximity', 'ortho']:
+            clear_batch_cache(f"{self.batch_key}_{name}")
+
         finish_status(self)
 
         self.S.finish()
@@ -395,6 +398,9 @@ class SmartVert(bpy.types.Operator):
                 self.distance = 0
                 self.coords = []
 
+                self.batch_key = f"smart_vert_{id(self)}"
+                self.draw_version = 0
+
                 self.S = Snap(context, alternative=[self.active], debug=False)
 
                 self.is_snapping = False
@@ -652,6 +658,8 @@ class SmartVert(bpy.types.Operator):
 
             self.coords.extend([v.co, target.co])
 
+        self.draw_version += 1
+
         if self.can_flatten:
 
             if self.flatten:
@@ -690,6 +698,8 @@ class SmartVert(bpy.types.Operator):
         self.snap_proximity_coords = []
         self.snap_ortho_coords = []
 
+        self.draw_version += 1
+
         if isinstance(closest[0], bmesh.types.BMEdge):
             self.snap_element = 'EDGE'
 
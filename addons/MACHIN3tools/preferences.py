@@ -8,7 +8,7 @@ from . utils.draw import draw_split_row, draw_empty_split_row
 from . utils.registration import activate, get_path, get_name, get_addon
 from . utils.system import get_bl_info_from_file, remove_folder, get_update_files
 from . utils.ui import find_kmi_from_idname, get_icon, draw_keymap_items, get_keymap_item, get_user_keymap_items
-from . items import preferences_tabs, matcap_background_type_items
+from . items import preferences_tabs, matcap_background_type_items, undo_save_compression_items
 from . registration import keys
 
 decalmachine = None
@@ -351,6 +351,9 @@ class MACHIN3toolsPreferences(bpy.types.AddonPreferences):
         screencast_use_skribe: BoolProperty(name="Use SKRIBE (external, preferred)", default=True)
         screencast_use_screencast_keys: BoolProperty(name="Use Screencast Keys (addon)", default=True)
     save_pie_use_undo_save: BoolProperty(name="Make Pre-Undo Saving available in the Pie", default=False)
+    save_pie_undo_save_interval: FloatProperty(name="Minimum Interval", description="Minimum Time in Seconds between two Pre-Undo Saves", default=5, min=0, step=100)
+    save_pie_undo_save_snapshots: IntProperty(name="Snapshots", description="Number of rotating Pre-Undo Save Snapshots kept in the Temp Folder", default=3, min=1, max=20)
+    save_pie_undo_save_compression: EnumProperty(name="Compression", items=undo_save_compression_items, default="BACKGROUND")
 
     shading_pie_show: BoolProperty(name="Show Shading Pie", default=False)
     overlay_solid: BoolProperty(name="Show Overlays in Solid Shading by default", description="For a newly created scene, or a .blend file where where it wasn't set before, show Overlays for Solid shaded 3D views", default=True)
@@ -1101,6 +1104,11 @@ class MACHIN3toolsPreferences(bpy.types.AddonPreferences):
                 column = bb.column(align=True)
                 draw_split_row(self, column, prop='save_pie_use_undo_save', label='Make Pre-Undo Saving available in the Pie', info='Useful if you notice Undo causing crashes')
 
+                if self.save_pie_use_undo_save:
+                    draw_split_row(self, column, prop='save_pie_undo_save_interval', label='Minimum Seconds between two Saves, unchanged Scenes are never saved twice')
+                    draw_split_row(self, column, prop='save_pie_undo_save_snapshots', label='Rotating Snapshots kept in the Temp Folder')
+                    draw_split_row(self, column, prop='save_pie_undo_save_compression', label='Compression')
+
                 kmi = get_keymap_item('Window', 'machin3.save_versioned_startup_file')
 
                 if kmi:
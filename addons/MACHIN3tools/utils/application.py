@@ -1,6 +1,8 @@
 import bpy
 import bpy_types
 import bpy_restrict_state
+from time import perf_counter
+from traceback import print_exc
 
 def delay_execution(func, delay=0, persistent=False):
     if bpy.app.timers.is_registered(func):
@@ -8,6 +10,100 @@ def delay_execution(func, delay=0, persistent=False):
 
     bpy.app.timers.register(func, first_interval=delay, persistent=persistent)
 
+class DepsgraphScheduler:
+    def __init__(self, name):
+        self.name = name
+        self.debug = False
+
+        self.queue = {}
+        self.timings = {}
+        self.active = None
+
+        self.tick_func = self.tick
+
+    def get_changes(self, depsgraph):
+        if depsgraph is None:
+            return None
+
+        changes = {'id_types': set(), 'transformed': set(), 'edited': set(), 'other': set(), 'scene': False, 'active': None, 'active_changed': False}
+
+        scene_updated = False
+
+        for update in depsgraph.updates:
+            id = update.id.original
+            changes['id_types'].add(id.id_type)
+
+            if id.id_type == 'OBJECT':
+                if update.is_updated_transform:
+                    changes['transformed'].add(id)
+
+                if update.is_updated_geometry:
+                    changes['edited'].add(id)
+
+                if not (update.is_updated_transform or update.is_updated_geometry):
+                    changes['other'].add(id)
+
+            elif id.id_type == 'SCENE':
+                scene_updated = True
+
+        changes['scene'] = scene_updated and not (changes['transformed'] or changes['edited'])
+
+        view_layer = depsgraph.view_layer
+        active = view_layer.objects.active if view_layer else None
+
+        changes['active'] = active
+        changes['active_changed'] = (active.name if active else None) != self.active
+
+        self.active = active.name if active else None
+
+        return changes
+
+    def schedule(self, func, relevant=True):
+        if not relevant:
+            return
+
+        self.queue[func] = None
+
+        if not bpy.app.timers.is_registered(self.tick_func):
+            bpy.app.timers.register(self.tick_func, first_interval=0)
+
+    def tick(self):
+        queue = list(self.queue)
+        self.queue.clear()
+
+        for func in queue:
+            start = perf_counter()
+
+            try:
+                func()
+
+            except Exception:
+                print(f"WARNING: {self.name} {func.__name__} failed:")
+                print_exc()
+
+            duration = perf_counter() - start
+            timing = self.timings.setdefault(func.__name__, {'count': 0, 'last': 0, 'avg': 0, 'max': 0})
+
+            timing['count'] += 1
+            timing['last'] = duration
+            timing['avg'] += (duration - timing['avg']) / timing['count']
+            timing['max'] = max(timing['max'], duration)
+
+            if self.debug:
+                print(f" {self.name} {func.__name__}: {duration * 1000:.3f}ms, avg: {timing['avg'] * 1000:.3f}ms, max: {timing['max'] * 1000:.3f}ms")
+
+    def get_timings(self):
+        return {name: dict(timing) for name, timing in self.timings.items()}
+
+    def reset_timings(self):
+        self.timings.clear()
+
+    def unregister(self):
+        self.queue.clear()
+
+        if bpy.app.timers.is_registered(self.tick_func):
+            bpy.app.timers.unregister(self.tick_func)
+
 def is_context_safe(context):
     if type(context) == bpy_types.Context:
         return True
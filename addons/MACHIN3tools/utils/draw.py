@@ -1,6 +1,7 @@
 import bpy
 from mathutils import Vector, Matrix, Quaternion
 from math import sin, cos, pi
+import numpy as np
 import gpu
 from gpu_extras.batch import batch_for_shader
 import blf
@@ -17,9 +18,51 @@ def get_builtin_shader_name(name, prefix='3D'):
     else:
         return f"{prefix}_{name}"
 
+shaders = {}
+batches = {}
+
+def get_shader(name):
+    shader = shaders.get(name)
+
+    if shader is None:
+        shader = gpu.shader.from_builtin(name)
+        shaders[name] = shader
+
+    return shader
+
+def get_cached_batch(key, version=None):
+    if key is not None and key in batches:
+        batch_version, batch = batches[key]
+
+        if batch_version == version:
+            return batch
+
+def cache_batch(key, version, batch):
+    if key is not None:
+        batches[key] = (version, batch)
+
+    return batch
+
+def clear_batch_cache(key=None):
+    if key is None:
+        batches.clear()
+
+    else:
+        for k in [k for k in batches if k[0] == key]:
+            del batches[k]
+
+def draw_batch(batch, shader, mx=None):
+    if mx is None or mx == Matrix():
+        batch.draw(shader)
+
+    else:
+        with gpu.matrix.push_pop():
+            gpu.matrix.multiply_matrix(mx)
+            batch.draw(shader)
+
 def draw_point(co, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, modal=True, screen=False):
     def draw():
-        shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR'))
+        shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR'))
         shader.bind()
         shader.uniform_float("color", (*color, alpha))
 
@@ -27,8 +70,8 @@ def draw_point(co, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, mod
         gpu.state.blend_set('ALPHA' if alpha < 1 else 'NONE')
         gpu.state.point_size_set(size)
 
-        batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co]})
-        batch.draw(shader)
+        batch = batch_for_shader(shader, 'POINTS', {"pos": [co]})
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -39,9 +82,9 @@ def draw_point(co, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, mod
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, modal=True, screen=False):
+def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, modal=True, screen=False, key=None, version=None):
     def draw():
-        shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR'))
+        shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR'))
         shader.bind()
         shader.uniform_float("color", (*color, alpha))
 
@@ -49,19 +92,18 @@ def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alph
         gpu.state.blend_set('ALPHA' if alpha < 1 else 'NONE')
         gpu.state.point_size_set(size)
 
-        if indices:
-            if mx != Matrix():
-                batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co for co in coords]}, indices=indices)
-            else:
-                batch = batch_for_shader(shader, 'POINTS', {"pos": coords}, indices=indices)
+        batch_key = (key, 'POINTS') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
 
-        else:
-            if mx != Matrix():
-                batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co for co in coords]})
+        if batch is None:
+            if indices:
+                batch = batch_for_shader(shader, 'POINTS', {"pos": coords}, indices=indices)
             else:
                 batch = batch_for_shader(shader, 'POINTS', {"pos": coords})
 
-        batch.draw(shader)
+            cache_batch(batch_key, version, batch)
+
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -72,24 +114,29 @@ def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alph
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_line(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, width=1, xray=True, modal=True, screen=False):
+def draw_line(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, width=1, xray=True, modal=True, screen=False, key=None, version=None):
     def draw():
-        nonlocal indices
-
-        if indices is None:
-            indices = [(i, i + 1) for i in range(0, len(coords)) if i < len(coords) - 1]
-
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        batch.draw(shader)
+        batch_key = (key, 'LINE') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
+
+        if batch is None:
+            line_indices = indices
+
+            if line_indices is None:
+                line_indices = np.arange(max(len(coords) - 1, 0), dtype=np.int32)[:, None] + np.array((0, 1), dtype=np.int32)
+
+            batch = cache_batch(batch_key, version, batch_for_shader(shader, 'LINES', {"pos": coords}, indices=line_indices))
+
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -100,24 +147,29 @@ def draw_line(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, width
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_lines(coords, indices=None, mx=Matrix(), color=(1, 1, 1), width=1, alpha=1, xray=True, modal=True, screen=False):
+def draw_lines(coords, indices=None, mx=Matrix(), color=(1, 1, 1), width=1, alpha=1, xray=True, modal=True, screen=False, key=None, version=None):
     def draw():
-        nonlocal indices
-
-        if not indices:
-            indices = [(i, i + 1) for i in range(0, len(coords), 2)]
-
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        batch.draw(shader)
+        batch_key = (key, 'LINES') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
+
+        if batch is None:
+            line_indices = indices
+
+            if not line_indices:
+                line_indices = np.arange(len(coords) // 2 * 2, dtype=np.int32).reshape(-1, 2)
+
+            batch = cache_batch(batch_key, version, batch_for_shader(shader, 'LINES', {"pos": coords}, indices=line_indices))
+
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -140,7 +192,7 @@ def draw_vector(vector, origin=Vector((0, 0, 0)), mx=Matrix(), color=(1, 1, 1),
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+        shader = get_shader('POLYLINE_SMOOTH_COLOR')
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
@@ -175,7 +227,7 @@ def draw_vectors(vectors, origins, mx=Matrix(), color=(1, 1, 1), width=1, alpha=
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+        shader = get_shader('POLYLINE_SMOOTH_COLOR')
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
@@ -218,22 +270,20 @@ def draw_circle(loc=Vector(), rot=Quaternion(), radius=100, segments='AUTO', wid
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
         if len(loc) == 2:
-            mx = Matrix()
-            mx.col[3] = loc.resized(4)
-            batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
+            mx = Matrix.Translation(loc.to_3d())
 
         else:
             mx = Matrix.LocRotScale(loc, rot, Vector.Fill(3, 1))
-            batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
 
-        batch.draw(shader)
+        batch = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -244,29 +294,34 @@ def draw_circle(loc=Vector(), rot=Quaternion(), radius=100, segments='AUTO', wid
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_cross_3d(co, mx=Matrix(), color=(1, 1, 1), width=1, length=1, alpha=1, xray=True, modal=True):
+def draw_cross_3d(co, mx=Matrix(), color=(1, 1, 1), width=1, length=1, alpha=1, xray=True, modal=True, key=None, version=None):
     def draw():
-        x = Vector((1, 0, 0))
-        y = Vector((0, 1, 0))
-        z = Vector((0, 0, 1))
-
-        coords = [(co - x) * length, (co + x) * length,
-                  (co - y) * length, (co + y) * length,
-                  (co - z) * length, (co + z) * length]
-
-        indices = [(0, 1), (2, 3), (4, 5)]
-
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        batch.draw(shader)
+        batch_key = (key, 'CROSS') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
+
+        if batch is None:
+            x = Vector((1, 0, 0))
+            y = Vector((0, 1, 0))
+            z = Vector((0, 0, 1))
+
+            coords = [(co - x) * length, (co + x) * length,
+                      (co - y) * length, (co + y) * length,
+                      (co - z) * length, (co + z) * length]
+
+            indices = [(0, 1), (2, 3), (4, 5)]
+
+            batch = cache_batch(batch_key, version, batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices))
+
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -274,23 +329,23 @@ def draw_cross_3d(co, mx=Matrix(), color=(1, 1, 1), width=1, length=1, alpha=1,
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_tris(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, xray=True, modal=True):
+def draw_tris(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, xray=True, modal=True, key=None, version=None):
     def draw():
 
-        shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR'))
+        shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR'))
         shader.bind()
         shader.uniform_float("color", (*color, alpha))
 
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA' if alpha < 1 else 'NONE')
 
-        if mx != Matrix():
-            batch = batch_for_shader(shader, 'TRIS', {"pos": [mx @ co for co in coords]}, indices=indices)
+        batch_key = (key, 'TRIS') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
 
-        else:
-            batch = batch_for_shader(shader, 'TRIS', {"pos": coords}, indices=indices)
+        if batch is None:
+            batch = cache_batch(batch_key, version, batch_for_shader(shader, 'TRIS', {"pos": coords}, indices=indices))
 
-        batch.draw(shader)
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -306,7 +361,7 @@ def draw_mesh_wire(batch, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=Tr
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
@@ -324,46 +379,51 @@ def draw_mesh_wire(batch, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=Tr
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_bbox(bbox, mx=Matrix(), color=(1, 1, 1), corners=0, width=1, alpha=1, xray=True, modal=True):
+def draw_bbox(bbox, mx=Matrix(), color=(1, 1, 1), corners=0, width=1, alpha=1, xray=True, modal=True, key=None, version=None):
     def draw():
-        if corners:
-            length = corners
-
-            coords = [bbox[0], bbox[0] + (bbox[1] - bbox[0]) * length, bbox[0] + (bbox[3] - bbox[0]) * length, bbox[0] + (bbox[4] - bbox[0]) * length,
-                      bbox[1], bbox[1] + (bbox[0] - bbox[1]) * length, bbox[1] + (bbox[2] - bbox[1]) * length, bbox[1] + (bbox[5] - bbox[1]) * length,
-                      bbox[2], bbox[2] + (bbox[1] - bbox[2]) * length, bbox[2] + (bbox[3] - bbox[2]) * length, bbox[2] + (bbox[6] - bbox[2]) * length,
-                      bbox[3], bbox[3] + (bbox[0] - bbox[3]) * length, bbox[3] + (bbox[2] - bbox[3]) * length, bbox[3] + (bbox[7] - bbox[3]) * length,
-                      bbox[4], bbox[4] + (bbox[0] - bbox[4]) * length, bbox[4] + (bbox[5] - bbox[4]) * length, bbox[4] + (bbox[7] - bbox[4]) * length,
-                      bbox[5], bbox[5] + (bbox[1] - bbox[5]) * length, bbox[5] + (bbox[4] - bbox[5]) * length, bbox[5] + (bbox[6] - bbox[5]) * length,
-                      bbox[6], bbox[6] + (bbox[2] - bbox[6]) * length, bbox[6] + (bbox[5] - bbox[6]) * length, bbox[6] + (bbox[7] - bbox[6]) * length,
-                      bbox[7], bbox[7] + (bbox[3] - bbox[7]) * length, bbox[7] + (bbox[4] - bbox[7]) * length, bbox[7] + (bbox[6] - bbox[7]) * length]
-
-            indices = [(0, 1), (0, 2), (0, 3),
-                       (4, 5), (4, 6), (4, 7),
-                       (8, 9), (8, 10), (8, 11),
-                       (12, 13), (12, 14), (12, 15),
-                       (16, 17), (16, 18), (16, 19),
-                       (20, 21), (20, 22), (20, 23),
-                       (24, 25), (24, 26), (24, 27),
-                       (28, 29), (28, 30), (28, 31)]
-
-        else:
-            coords = bbox
-            indices = [(0, 1), (1, 2), (2, 3), (3, 0),
-                       (4, 5), (5, 6), (6, 7), (7, 4),
-                       (0, 4), (1, 5), (2, 6), (3, 7)]
-
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        batch.draw(shader)
+        batch_key = (key, 'BBOX') if key is not None else None
+        batch = get_cached_batch(batch_key, version)
+
+        if batch is None:
+            if corners:
+                length = corners
+
+                coords = [bbox[0], bbox[0] + (bbox[1] - bbox[0]) * length, bbox[0] + (bbox[3] - bbox[0]) * length, bbox[0] + (bbox[4] - bbox[0]) * length,
+                          bbox[1], bbox[1] + (bbox[0] - bbox[1]) * length, bbox[1] + (bbox[2] - bbox[1]) * length, bbox[1] + (bbox[5] - bbox[1]) * length,
+                          bbox[2], bbox[2] + (bbox[1] - bbox[2]) * length, bbox[2] + (bbox[3] - bbox[2]) * length, bbox[2] + (bbox[6] - bbox[2]) * length,
+                          bbox[3], bbox[3] + (bbox[0] - bbox[3]) * length, bbox[3] + (bbox[2] - bbox[3]) * length, bbox[3] + (bbox[7] - bbox[3]) * length,
+                          bbox[4], bbox[4] + (bbox[0] - bbox[4]) * length, bbox[4] + (bbox[5] - bbox[4]) * length, bbox[4] + (bbox[7] - bbox[4]) * length,
+                          bbox[5], bbox[5] + (bbox[1] - bbox[5]) * length, bbox[5] + (bbox[4] - bbox[5]) * length, bbox[5] + (bbox[6] - bbox[5]) * length,
+                          bbox[6], bbox[6] + (bbox[2] - bbox[6]) * length, bbox[6] + (bbox[5] - bbox[6]) * length, bbox[6] + (bbox[7] - bbox[6]) * length,
+                          bbox[7], bbox[7] + (bbox[3] - bbox[7]) * length, bbox[7] + (bbox[4] - bbox[7]) * length, bbox[7] + (bbox[6] - bbox[7]) * length]
+
+                indices = [(0, 1), (0, 2), (0, 3),
+                           (4, 5), (4, 6), (4, 7),
+                           (8, 9), (8, 10), (8, 11),
+                           (12, 13), (12, 14), (12, 15),
+                           (16, 17), (16, 18), (16, 19),
+                           (20, 21), (20, 22), (20, 23),
+                           (24, 25), (24, 26), (24, 27),
+                           (28, 29), (28, 30), (28, 31)]
+
+            else:
+                coords = bbox
+                indices = [(0, 1), (1, 2), (2, 3), (3, 0),
+                           (4, 5), (5, 6), (6, 7), (7, 4),
+                           (0, 4), (1, 5), (2, 6), (3, 7)]
+
+            batch = cache_batch(batch_key, version, batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices))
+
+        draw_batch(batch, shader, mx)
 
     if modal:
         draw()
@@ -485,48 +545,69 @@ def draw_axes_HUD(context, objects):
 
         axes = [(Vector((1, 0, 0)), red), (Vector((0, 1, 0)), green), (Vector((0, 0, 1)), blue)]
 
-        for axis, color in axes:
-            coords = []
+        origins = []
+        rotations = []
+        factors = []
+
+        cursor_origin = None
+
+        for obj in objects:
+
+            if obj == 'CURSOR':
 
-            for obj in objects:
+                if not show_hyper_cursor:
+                    mx = context.scene.cursor.matrix
 
-                if obj == 'CURSOR':
+                    cursor_origin = mx.to_translation()
+                    cursor_rot = mx.to_quaternion().to_matrix()
+                    cursor_factor = get_zoom_factor(context, cursor_origin, scale=300, ignore_obj_scale=True) if screenspace else 1
 
-                    if not show_hyper_cursor:
-                        mx = context.scene.cursor.matrix
-                        rot = mx.to_quaternion()
-                        origin = mx.to_translation()
+            elif str(obj) != '<bpy_struct, Object invalid>':
+                mx = obj.matrix_world
+                origin = mx.to_translation()
 
-                        factor = get_zoom_factor(context, origin, scale=300, ignore_obj_scale=True) if screenspace else 1
+                origins.append(origin)
+                rotations.append(mx.to_quaternion().to_matrix())
+                factors.append(get_zoom_factor(context, origin, scale=300, ignore_obj_scale=True) if screenspace else 1)
 
-                        if show_cursor and screenspace:
-                            coords.append(origin + (rot @ axis).normalized() * 0.1 * scale * factor * 0.8)
-                            coords.append(origin + (rot @ axis).normalized() * 0.1 * scale * factor * 1.2)
+        if origins:
+            origins = np.array(origins, dtype=np.float32)
+            rotations = np.array(rotations, dtype=np.float32)
+            lengths = np.array(factors, dtype=np.float32) * size * scale
 
-                        else:
-                            coords.append(origin + (rot @ axis).normalized() * size * scale * factor * 0.9)
-                            coords.append(origin + (rot @ axis).normalized() * size * scale * factor)
+        if cursor_origin is not None:
+            cursor_length = cursor_factor * scale
+
+            if show_cursor and screenspace:
+                cursor_fractions = np.array((0.8, 1.2), dtype=np.float32) * 0.1
+            else:
+                cursor_fractions = np.array((0.9, 1, 0.1, 0.7), dtype=np.float32) * size
+
+        for idx, (axis, color) in enumerate(axes):
+            coords = []
 
-                            coords.append(origin + (rot @ axis).normalized() * size * scale * factor * 0.1)
-                            coords.append(origin + (rot @ axis).normalized() * size * scale * factor * 0.7)
+            if cursor_origin is not None:
+                direction = np.array((cursor_rot.col[idx]).normalized(), dtype=np.float32)
+                coords.append(np.array(cursor_origin, dtype=np.float32) + direction * (cursor_fractions * cursor_length)[:, None])
 
-                elif str(obj) != '<bpy_struct, Object invalid>':
-                    mx = obj.matrix_world
-                    rot = mx.to_quaternion()
-                    origin = mx.to_translation()
+            if len(origins):
+                directions = rotations[:, :, idx]
+                directions /= np.linalg.norm(directions, axis=1)[:, None]
 
-                    factor = get_zoom_factor(context, origin, scale=300, ignore_obj_scale=True) if screenspace else 1
+                segments = np.empty((len(origins), 2, 3), dtype=np.float32)
+                segments[:, 0] = origins + directions * (lengths * 0.1)[:, None]
+                segments[:, 1] = origins + directions * lengths[:, None]
 
-                    coords.append(origin + (rot @ axis).normalized() * size * scale * factor * 0.1)
-                    coords.append(origin + (rot @ axis).normalized() * size * scale * factor)
+                coords.append(segments.reshape(-1, 3))
 
             if coords:
-                indices = [(i, i + 1) for i in range(0, len(coords), 2)]
+                coords = np.concatenate(coords)
+                indices = np.arange(len(coords), dtype=np.int32).reshape(-1, 2)
 
                 gpu.state.depth_test_set('NONE')
                 gpu.state.blend_set('ALPHA')
 
-                shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+                shader = get_shader('POLYLINE_UNIFORM_COLOR')
                 shader.uniform_float("color", (*color, alpha))
                 shader.uniform_float("lineWidth", 2)
                 shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
@@ -539,7 +620,7 @@ def draw_region_border(region, width=2, color=(1, 1, 1), alpha=1):
     coords = [(width, width), (region.width - width - 1, width), (region.width - width - 1, region.height - width - 1), (width, region.height - width - 1)]
     indices =[(0, 1), (1, 2), (2, 3), (3, 0)]
 
-    shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR', '2D'))
+    shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR', '2D'))
     shader.bind()
     shader.uniform_float("color", (*color, alpha))
 
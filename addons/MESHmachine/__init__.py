@@ -71,7 +71,7 @@ from bpy.props import PointerProperty, IntVectorProperty
 from typing import Tuple
 import os
 from . properties import MeshSceneProperties, MeshObjectProperties
-from . handlers import load_post, depsgraph_update_post
+from . handlers import scheduler, load_post, depsgraph_update_post
 from . utils.registration import get_core, get_menus, get_path, get_tools, get_prefs, register_classes, unregister_classes, register_keymaps, unregister_keymaps
 from . utils.registration import register_plugs, unregister_plugs, register_lockedlib, unregister_lockedlib, register_icons, unregister_icons
 from . utils.registration import register_msgbus, unregister_msgbus
@@ -293,6 +293,7 @@ def unregister():
 
     bpy.app.handlers.load_post.remove(load_post)
     bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    scheduler.unregister()
 
     unregister_msgbus(owner)
 
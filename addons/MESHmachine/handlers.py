@@ -2,7 +2,7 @@ import bpy
 from bpy.app.handlers import persistent
 from mathutils import Matrix
 from uuid import uuid4
-from . utils.application import delay_execution
+from . utils.application import DepsgraphScheduler, delay_execution
 from . utils.draw import draw_stashes_HUD, draw_stashes_VIEW3D
 from . utils.math import flatten_matrix
 from . utils.mesh import get_coords
@@ -13,6 +13,14 @@ from . import bl_info
 
 global_debug = False
 
+scheduler = DepsgraphScheduler("MESHmachine")
+
+def is_active_changed(changes):
+    if changes is None or changes['active_changed'] or changes['scene']:
+        return True
+
+    return changes['active'] in changes['other']
+
 stashesHUD = None
 oldactive = None
 oldstasheslen = 0
@@ -224,9 +232,12 @@ def load_post(none):
     delay_execution(manage_legacy_stashes)
 
 @persistent
-def depsgraph_update_post(scene):
+def depsgraph_update_post(scene, depsgraph):
     global global_debug
 
+    scheduler.debug = global_debug
+    changes = scheduler.get_changes(depsgraph)
+
     if global_debug:
         print()
         print("MESHmachine depsgraph update post handler:")
@@ -234,14 +245,14 @@ def depsgraph_update_post(scene):
     if global_debug:
         print(" managing stashes HUD")
 
-    delay_execution(manage_stashes_HUD)
+    scheduler.schedule(manage_stashes_HUD, is_active_changed(changes))
 
     if global_debug:
         print(" managing stashes VIEW3D")
 
-    delay_execution(manage_stashes_VIEW3D)
+    scheduler.schedule(manage_stashes_VIEW3D, is_active_changed(changes))
 
     if global_debug:
         print(" managing asset drop cleanup")
 
-    delay_execution(manage_asset_drop_cleanup)
+    scheduler.schedule(manage_asset_drop_cleanup)
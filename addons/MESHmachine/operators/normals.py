@@ -10,6 +10,7 @@ from .. utils.selection import get_2_rails_from_chamfer, get_selection_islands
 from .. utils.normal import normal_clear, normal_transfer_from_stash, normal_clear_across_sharps, remerge_sharp_edges
 from .. utils.math import get_edge_normal
 from .. utils.mesh import shade, flip_normals, get_coords
+from .. utils.stash import make_stash_mesh_unique
 from .. utils.registration import get_prefs
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, update_HUD_location
 from .. utils.ui import init_status, finish_status
@@ -471,12 +472,14 @@ class NormalTransfer(bpy.types.Operator):
             if event.type == 'F' and event.value == 'PRESS':
 
                 if self.stash.obj:
+                    make_stash_mesh_unique(self.stash.obj)
                     flip_normals(self.stash.obj.data)
 
                     self.stash.flipped = not self.stash.flipped
 
             if event.type == 'S' and event.value == 'PRESS':
                 if self.stash.obj:
+                    make_stash_mesh_unique(self.stash.obj)
                     shade(self.stash.obj.data, smooth=True)
 
             if event.type == 'M' and event.value == 'PRESS':
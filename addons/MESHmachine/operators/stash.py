@@ -4,7 +4,7 @@ import bmesh
 from .. utils.ui import draw_init, draw_title, draw_prop, draw_text, init_cursor, update_HUD_location
 from .. utils.ui import init_status, finish_status, init_timer_modal, set_countdown, get_timer_progress
 from .. utils.property import step_collection
-from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash
+from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash, share_stash_mesh, make_stash_mesh_unique
 from .. utils.mesh import get_coords
 from .. utils.draw import draw_mesh_wire, draw_edit_stash_HUD
 from .. utils.object import update_local_view
@@ -501,6 +501,8 @@ class ViewStashes(bpy.types.Operator):
                 bpy.ops.view3d.localview(frame_selected=False)
 
         self.stash.obj.update_from_editmode()
+        share_stash_mesh(self.stash.obj)
+
         offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
         self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
 
@@ -513,6 +515,8 @@ class ViewStashes(bpy.types.Operator):
     def enter_stash_edit_mode(self, context):
         self.editing = True
 
+        make_stash_mesh_unique(self.stash.obj)
+
         context.collection.objects.link(self.stash.obj)
 
         if self.stash.obj.matrix_world != self.active.matrix_world:
@@ -696,7 +700,11 @@ class ViewOrphanStashes(bpy.types.Operator):
 
             if objects:
                 for obj in objects:
-                    bpy.data.meshes.remove(obj.data, do_unlink=True)
+                    if obj.data.users > 1:
+                        bpy.data.objects.remove(obj, do_unlink=True)
+
+                    else:
+                        bpy.data.meshes.remove(obj.data, do_unlink=True)
 
                 bpy.ops.outliner.orphans_purge()
 
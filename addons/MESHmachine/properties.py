@@ -72,6 +72,7 @@ class MeshObjectProperties(bpy.types.PropertyGroup):
     stashdeltamx: FloatVectorProperty(name="Delta Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashorphanmx: FloatVectorProperty(name="Orphan Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashname: StringProperty(name="stash name")
+    stashhash: StringProperty(name="stash mesh hash")
 
     stashmx: FloatVectorProperty(name="Stash Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashtargetmx: FloatVectorProperty(name="Target Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 from mathutils import Vector, Matrix
+from hashlib import sha1
 import numpy as np
 
 def get_coords(mesh, mx=None, offset=0, indices=False):
@@ -35,6 +36,74 @@ def get_coords(mesh, mx=None, offset=0, indices=False):
 
     return coords
 
+attribute_formats = {'FLOAT': ('value', 1, np.float32),
+                     'INT': ('value', 1, np.int32),
+                     'INT8': ('value', 1, np.int32),
+                     'BOOLEAN': ('value', 1, bool),
+                     'FLOAT2': ('vector', 2, np.float32),
+                     'INT32_2D': ('value', 2, np.int32),
+                     'FLOAT_VECTOR': ('vector', 3, np.float32),
+                     'FLOAT_COLOR': ('color', 4, np.float32),
+                     'BYTE_COLOR': ('color', 4, np.float32),
+                     'QUATERNION': ('value', 4, np.float32)}
+
+geometry_attributes = {'.edge_verts', '.corner_vert', '.corner_edge'}
+
+def get_mesh_hash(mesh):
+    if mesh.shape_keys or mesh.has_custom_normals:
+        return
+
+    h = sha1()
+
+    def update(collection, prop, components, dtype):
+        data = np.empty(len(collection) * components, dtype=dtype)
+        collection.foreach_get(prop, data)
+        h.update(prop.encode())
+        h.update(data.tobytes())
+
+    h.update(np.array([len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)], dtype=np.int64).tobytes())
+
+    update(mesh.vertices, 'co', 3, np.float32)
+    update(mesh.edges, 'vertices', 2, np.int32)
+    update(mesh.loops, 'vertex_index', 1, np.int32)
+    update(mesh.polygons, 'loop_start', 1, np.int32)
+
+    edge_props = bpy.types.MeshEdge.bl_rna.properties
+    polygon_props = bpy.types.MeshPolygon.bl_rna.properties
+
+    for prop in ['use_seam', 'use_edge_sharp', 'use_freestyle_mark']:
+        if prop in edge_props:
+            update(mesh.edges, prop, 1, bool)
+
+    for prop in ['crease', 'bevel_weight']:
+        if prop in edge_props:
+            update(mesh.edges, prop, 1, np.float32)
+
+    for prop in ['use_smooth', 'use_freestyle_mark']:
+        if prop in polygon_props:
+            update(mesh.polygons, prop, 1, bool)
+
+    update(mesh.polygons, 'material_index', 1, np.int32)
+
+    for attr in sorted(mesh.attributes, key=lambda a: a.name):
+        if attr.name.startswith('.') and attr.name not in geometry_attributes:
+            continue
+
+        if attr.data_type not in attribute_formats:
+            return
+
+        prop, components, dtype = attribute_formats[attr.data_type]
+
+        h.update(f"{attr.name}:{attr.domain}:{attr.data_type}".encode())
+        update(attr.data, prop, components, dtype)
+
+    h.update(str([mat.name if mat else None for mat in mesh.materials]).encode())
+
+    if getattr(mesh, 'use_auto_smooth', False):
+        h.update(np.float32(mesh.auto_smooth_angle).tobytes())
+
+    return h.hexdigest()
+
 def hide(mesh):
     mesh.polygons.foreach_set('hide', [True] * len(mesh.polygons))
     mesh.edges.foreach_set('hide', [True] * len(mesh.edges))
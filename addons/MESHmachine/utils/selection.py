@@ -11,32 +11,26 @@ def get_selection_islands(bm, debug=False):
         print("selected:", [f.index for f in selected])
 
     face_islands = []
+    found = set()
 
-    while selected:
-        island = [selected[0]]
-        foundmore = [selected[0]]
+    for face in selected:
+        if face in found:
+            continue
 
-        if debug:
-            print("island:", [f.index for f in island])
-            print("foundmore:", [f.index for f in foundmore])
-
-        while foundmore:
-            for e in foundmore[0].edges:
-                bf = [f for f in e.link_faces if f.select and f not in island]
-                if bf:
-                    island.append(bf[0])
-                    foundmore.append(bf[0])
-
-            if debug:
-                print("popping", foundmore[0].index)
+        island = [face]
+        found.add(face)
 
-            foundmore.pop(0)
+        # the island doubles as the queue, faces get processed in the order they are found
+        for f in island:
+            for e in f.edges:
+                for lf in e.link_faces:
+                    if lf.select and lf not in found:
+                        island.append(lf)
+                        found.add(lf)
+                        break
 
         face_islands.append(island)
 
-        for f in island:
-            selected.remove(f)
-
     if debug:
         print()
         for idx, island in enumerate(face_islands):
@@ -4,7 +4,7 @@ from uuid import uuid4
 from mathutils import Matrix
 from . math import flatten_matrix
 from . object import update_local_view, unparent, parent, flatten
-from . mesh import get_eval_mesh
+from . mesh import get_eval_mesh, get_mesh_hash
 from . registration import get_addon
 from .. import bl_info
 
@@ -20,6 +20,40 @@ def get_stashobj_basename(name):
     basename = mo.group(1)
     return basename
 
+def get_shared_stash_mesh(mesh_hash):
+    for obj in bpy.data.objects:
+        if obj.MM.isstashobj and obj.MM.stashhash == mesh_hash and obj.type == 'MESH':
+            return obj.data
+
+def share_stash_mesh(stashobj, debug=False):
+    stashobj.MM.stashhash = ''
+
+    if stashobj.vertex_groups:
+        return
+
+    mesh_hash = get_mesh_hash(stashobj.data)
+
+    if mesh_hash:
+        shared = get_shared_stash_mesh(mesh_hash)
+
+        if shared and shared != stashobj.data:
+            if debug:
+                print(f" sharing mesh {shared.name} with existing identical stash")
+
+            mesh = stashobj.data
+            stashobj.data = shared
+
+            if not mesh.users:
+                bpy.data.meshes.remove(mesh, do_unlink=True)
+
+        stashobj.MM.stashhash = mesh_hash
+
+def make_stash_mesh_unique(stashobj):
+    if stashobj.data.users > 1:
+        stashobj.data = stashobj.data.copy()
+
+    stashobj.MM.stashhash = ''
+
 def create_stash(active, source, dg=None, self_stash=False, force_default_name=False, debug=False):
     stashindex = len(active.MM.stashes)
     stashname = source.MM.stashname if source.MM.stashname and not force_default_name else f"stash_{stashindex}"
@@ -67,6 +101,8 @@ def create_stash(active, source, dg=None, self_stash=False, force_default_name=F
 
     s.obj.data.transform(deltamx)
 
+    share_stash_mesh(stashobj, debug=debug)
+
     if debug:
         print("new stash:", stashname)
 
@@ -75,6 +111,7 @@ def create_stash(active, source, dg=None, self_stash=False, force_default_name=F
 def retrieve_stash(active, stashobj, retrieve_original=False):
     if retrieve_original:
         retrieved = stashobj
+        make_stash_mesh_unique(retrieved)
     else:
         retrieved = stashobj.copy()
         retrieved.data = stashobj.data.copy()
@@ -94,6 +131,7 @@ def retrieve_stash(active, stashobj, retrieve_original=False):
 
     retrieved.MM.isstashobj = False
     retrieved.MM.stashuuid = ''
+    retrieved.MM.stashhash = ''
     retrieved.MM.stashdeltamx.identity()
     retrieved.MM.stashorphanmx.identity()
 
@@ -129,7 +167,9 @@ def transfer_stashes(source, target, restash=False):
             s.name = stash.obj.MM.stashname if stash.obj.MM.stashname else f"stash_{s.index}"
 
             s.obj = stash.obj.copy()
-            s.obj.data = stash.obj.data.copy()
+
+            if not stash.obj.MM.stashhash:
+                s.obj.data = stash.obj.data.copy()
 
             s.uuid = stash.uuid
             s.version = stash.version
@@ -1,3 +1,4 @@
+import os
 from itertools import chain
 from pathlib import Path
 
@@ -24,17 +25,25 @@ METRIC_THREADS_FILE = RESOURCES_DIR / "metric_threads.csv"
 PRESET_THUMB_TEMPLATE = RESOURCES_DIR / "thumb_render_template.blend"
 PRESET_THUMB_SCRIPT = SCRIPT_DIR / "generate_thumb.py"
 PRESET_THUMB_DIR = USER_PRESETS_DIR / "thumbnails"
+PRESET_CACHE_FILE = USER_PRESETS_DIR / "preset_cache.pickle"
 PRESET_THUMB_RESOLUTION = 256
 PRESET_THUMB_SUFFIX = ".png"
+PRESET_THUMB_HASHES = "thumb_hashes.json"
 THUMB_COLLECTION_ALIAS = "fastener_thumbnails"
 ACTIVE_PRESET_DIR_ALIAS = "active_fastener_preset_dir"
 
 THUMB_GEN_IP = "127.0.0.1"
 THUMB_GEN_PORT = "8888"
+THUMB_GEN_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+THUMB_GEN_JOB_TIMEOUT = 120
+THUMB_GEN_RETRIES = 2
 
 PROPS_ALIAS = "fastener_props"
 PRESET_UPDATE_PROP_ALIAS = "fastener_presets_update_required"
 
+SUBMESH_CACHE_SIZE = 64
+DEBUG_PRINT_SUBMESH_CACHE = False
+
 THREAD_FIELDS = ("thread_name", "major_diameter", "pitch")
 
 PROP_BLACKLIST = {
@@ -4,15 +4,16 @@ NOTE: This sucks. Nothing here should be used directly
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from csv import DictReader
 from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import List, NamedTuple, Any, Union, TYPE_CHECKING, Dict
+from typing import Callable, List, NamedTuple, Any, Tuple, Union, TYPE_CHECKING, Dict
 
 import bpy
 from bpy.types import Mesh, Object, UILayout
-from mathutils import Vector
+from mathutils import Matrix, Vector
 import bmesh
 from bmesh.types import BMesh, BMLayerItem, BMVert
 from bmesh.types import BMEdge, BMFace
@@ -108,6 +109,35 @@ class FastenerVertLayers:
         return self.bm.verts.layers.int.new(name)
 
 
+class ThreadMeshMixin(ABC):
+    """Fasteners whose threads are the first geometry meshed in self.bm"""
+
+    def _mesh_threads(self):
+        """
+        Create mesh threads in self.bm, from the sub-mesh cache when possible.
+        Threads have to be the first geometry in self.bm
+        Returns: Tuple of bottom, top geom dicts whose keys are geometry types
+        """
+        key = (self.type, *self._cache_key("threads", self.thread_cache_keys))
+        submesh = submesh_cache.get(key)
+        if submesh is None:
+            thread_bottom, thread_top = self._build_threads()
+            groups = {"bottom": thread_bottom, "top": thread_top}
+            submesh_cache.add(key, SubMesh.from_bmesh(self.bm, groups))
+            return thread_bottom, thread_top
+
+        _, groups = submesh.to_bmesh(self.bm)
+        return groups["bottom"], groups["top"]
+
+    @abstractmethod
+    def _build_threads(self):
+        """
+        Mesh threads into the empty self.bm
+        Returns: Tuple of bottom, top geom dicts whose keys are geometry types
+        """
+        raise NotImplementedError
+
+
 class Fastener(ABC):
     props: FastenerProps
     type: str
@@ -120,11 +150,73 @@ class Fastener(ABC):
     driver_compatible: bool = False
     custom_thread_props: Union[dict, None] = None
     standard_thread_props: Union[dict, None] = None
+    # Properties the cached sub-meshes are built from
+    thread_cache_keys: Tuple[str, ...] = (
+        "custom_thread_profile",
+        "pitch",
+        "length",
+        "tolerance",
+        "minor_diameter",
+        "major_diameter",
+        "starts",
+        "root_weight",
+        "crest_weight",
+        "thread_angle",
+        "thread_resolution",
+    )
+    head_cache_keys: Tuple[str, ...] = (
+        "head_type",
+        "head_length",
+        "head_diameter",
+        "head_subdiv",
+        "head_mod_a",
+        "head_mod_b",
+        "head_mod_c",
+    )
+    driver_cache_keys: Tuple[str, ...] = (
+        "driver_type",
+        "driver_depth",
+        "driver_diameter",
+        "driver_mod_a",
+        "driver_mod_b",
+        "driver_mod_c",
+        "driver_mod_d",
+        "driver_mod_e",
+        "driver_mod_f",
+    )
 
     def __post_init__(self):
         self.bm = bmesh.new()
         self.vert_layers = FastenerVertLayers(self.bm)
 
+    def _cache_key(self, name: str, prop_names: Tuple[str, ...]) -> tuple:
+        return (name, *(getattr(self.props, prop) for prop in prop_names))
+
+    def _cached_submesh(self, key: tuple, build: Callable[[], BMesh]) -> SubMesh:
+        """Cached sub-mesh for key, on a miss stored from the bmesh returned by build"""
+        submesh = submesh_cache.get(key)
+        if submesh is None:
+            bm = build()
+            submesh = SubMesh.from_bmesh(bm)
+            bm.free()
+            submesh_cache.add(key, submesh)
+        return submesh
+
+    def _mesh_head(self, matrix: Matrix) -> List[BMVert]:
+        """Merge the transformed head into self.bm, return the head verts"""
+        key = self._cache_key("head", self.head_cache_keys)
+        submesh = self._cached_submesh(key, self._create_head)
+        head_verts, _ = submesh.to_bmesh(self.bm, matrix)
+        return head_verts
+
+    def _mesh_driver(self) -> BMesh:
+        """New bmesh containing the driver cutter"""
+        key = self._cache_key("driver", self.driver_cache_keys)
+        submesh = self._cached_submesh(key, self._create_driver)
+        driver_bm = bmesh.new()
+        submesh.to_bmesh(driver_bm)
+        return driver_bm
+
     def _vert_by_layer_val(self, layer: BMLayerItem, val=1):
         return [vert for vert in self.bm.verts if vert[layer] == val]
 
@@ -508,6 +600,186 @@ class MeshReader:
         bpy.data.meshes.remove(self.datablock)
 
 
+@dataclass
+class SubMesh:
+    """
+    Snapshot of generated bmesh geometry as flat arrays.
+    Named groups store geom dicts (as returned by dict_by_type) by vert indices
+    """
+
+    co: np.ndarray  # (n, 3) vert coordinates
+    edges: np.ndarray  # (n, 2) vert indices
+    loops: np.ndarray  # Vert index per face corner
+    loop_starts: np.ndarray
+    loop_totals: np.ndarray
+    int_layers: Dict[str, np.ndarray] = field(default_factory=dict)
+    groups: Dict[str, Dict[type, np.ndarray]] = field(default_factory=dict)
+
+    @classmethod
+    def from_bmesh(
+        cls, bm: BMesh, groups: Union[Dict[str, Dict], None] = None
+    ) -> SubMesh:
+        bm.verts.index_update()
+        co = np.array([vert.co for vert in bm.verts], dtype=np.float32)
+        co.shape = (len(bm.verts), 3)
+        edges = np.array(
+            [(edge.verts[0].index, edge.verts[1].index) for edge in bm.edges],
+            dtype=np.int32,
+        )
+        edges.shape = (len(bm.edges), 2)
+        loop_totals = np.array([len(face.verts) for face in bm.faces], dtype=np.int32)
+        loop_starts = np.zeros_like(loop_totals)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+        loops = np.array(
+            [vert.index for face in bm.faces for vert in face.verts], dtype=np.int32
+        )
+        int_layers = {
+            name: np.array([vert[layer] for vert in bm.verts], dtype=np.int32)
+            for name, layer in bm.verts.layers.int.items()
+        }
+
+        index_groups = {}
+        for name, geom in (groups or {}).items():
+            index_groups[name] = {
+                BMVert: np.array(
+                    [vert.index for vert in geom.get(BMVert, ())], dtype=np.int32
+                ),
+                BMEdge: np.array(
+                    [[vert.index for vert in edge.verts] for edge in geom.get(BMEdge, ())],
+                    dtype=np.int32,
+                ).reshape(-1, 2),
+            }
+        return cls(co, edges, loops, loop_starts, loop_totals, int_layers, index_groups)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.co, self.edges, self.loops, self.loop_starts, self.loop_totals]
+        arrays.extend(self.int_layers.values())
+        for group in self.groups.values():
+            arrays.extend(group.values())
+        return sum(array.nbytes for array in arrays)
+
+    def to_bmesh(
+        self, bm: BMesh, matrix: Union[Matrix, None] = None
+    ) -> Tuple[List[BMVert], Dict[str, Dict]]:
+        """
+        Append geometry to bm, optionally transformed by a 4x4 matrix
+        Returns: Tuple of the new verts and the named geom dicts
+        """
+        co = self.co
+        if matrix is not None:
+            matrix = np.array(matrix, dtype=np.float32)
+            co = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+        if len(bm.verts):
+            verts = self._append_to_bmesh(bm, co)
+        else:
+            verts = self._fill_bmesh(bm, co)
+
+        groups = {}
+        for name, group in self.groups.items():
+            groups[name] = {
+                BMVert: [verts[index] for index in group[BMVert]],
+                BMEdge: [bm.edges.get((verts[a], verts[b])) for a, b in group[BMEdge]],
+            }
+        return verts, groups
+
+    def _fill_bmesh(self, bm: BMesh, co: np.ndarray) -> List[BMVert]:
+        """Bulk load into an empty bmesh through a temporary mesh"""
+        mesh = bpy.data.meshes.new("temp")
+        mesh.vertices.add(len(co))
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.edges.add(len(self.edges))
+        mesh.edges.foreach_set("vertices", self.edges.ravel())
+        mesh.loops.add(len(self.loops))
+        mesh.loops.foreach_set("vertex_index", self.loops)
+        mesh.polygons.add(len(self.loop_totals))
+        mesh.polygons.foreach_set("loop_start", self.loop_starts)
+        if bpy.app.version < (4, 0, 0):
+            mesh.polygons.foreach_set("loop_total", self.loop_totals)
+        for name, values in self.int_layers.items():
+            attribute = mesh.attributes.new(name, "INT", "POINT")
+            attribute.data.foreach_set("value", values)
+        mesh.update(calc_edges=True)
+
+        bm.from_mesh(mesh)
+        bpy.data.meshes.remove(mesh)
+        bm.verts.ensure_lookup_table()
+        return bm.verts[:]
+
+    def _append_to_bmesh(self, bm: BMesh, co: np.ndarray) -> List[BMVert]:
+        """
+        Add elements one by one, bmesh reuses the slots of removed elements
+        so new verts are not guaranteed to be at the end of bm.verts
+        """
+        verts = [bm.verts.new(vert_co) for vert_co in co.tolist()]
+        loops = self.loops.tolist()
+        for start, total in zip(self.loop_starts.tolist(), self.loop_totals.tolist()):
+            bm.faces.new([verts[index] for index in loops[start : start + total]])
+        for a, b in self.edges.tolist():
+            if bm.edges.get((verts[a], verts[b])) is None:
+                bm.edges.new((verts[a], verts[b]))
+        for name, values in self.int_layers.items():
+            layer = bm.verts.layers.int.get(name)
+            if layer is None:
+                layer = bm.verts.layers.int.new(name)
+            for index in np.flatnonzero(values).tolist():
+                verts[index][layer] = int(values[index])
+        return verts
+
+
+class SubMeshCache:
+    """
+    Least recently used cache of generated sub-meshes keyed by the values of
+    the properties they are built from
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[tuple, SubMesh] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple) -> Union[SubMesh, None]:
+        submesh = self._items.get(key)
+        if submesh is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return submesh
+
+    def add(self, key: tuple, submesh: SubMesh) -> None:
+        self._items[key] = submesh
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(submesh.nbytes for submesh in self._items.values())
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0
+        return (
+            f"Sub-mesh cache: {len(self)}/{self.max_items} items, "
+            f"{self.nbytes / 1024:.1f} KiB, "
+            f"{self.hits} hits, {self.misses} misses ({ratio:.0%} hit rate)"
+        )
+
+
+submesh_cache = SubMeshCache(config.SUBMESH_CACHE_SIZE)
+
+
 class ThreadProfile(ABC):
     pitch: float
     length: float
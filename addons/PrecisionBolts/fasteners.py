@@ -18,7 +18,7 @@ import numpy as np
 
 from .heads import HEADS
 from .drivers import DRIVERS
-from .config import NUTS_FILE
+from .config import NUTS_FILE, DEBUG_PRINT_SUBMESH_CACHE
 from .custom_types import (
     FastenerHead,
     FastenerVertLayers,
@@ -26,6 +26,8 @@ from .custom_types import (
     PropertyMapping,
     Fastener,
     PropsUpdateDisabled,
+    ThreadMeshMixin,
+    submesh_cache,
 )
 from . import thread_profiles
 from .bmesh_filters import dict_by_type, vert_axis_split, unique_edge_verts
@@ -56,6 +58,8 @@ def update_fastener(self, context: Context) -> None:
 
     builder = builders[props.fastener_type](props)
     builder.create(fastener.data)
+    if DEBUG_PRINT_SUBMESH_CACHE:
+        print(submesh_cache.stats())
 
     # Handle sharpness update, 
     # TODO: Using op is hacky and attribs should be done in mesh generation
@@ -117,14 +121,15 @@ class Nut(Fastener):
         # Transform body
         self._transform_body()
 
+        # Tri divide ngons
+        ngons = [f for f in self.bm.faces if len(f.edges[:]) > 4]
+        bmesh.ops.triangulate(self.bm, faces=ngons)
+
         # Mesh Threads
         body_geom = set(bm_as_list(self.bm))
-        thread_bm = self._mesh_nut_threads()
-        temp_mesh = bpy.data.meshes.new("temp")
-        thread_bm.to_mesh(temp_mesh)
-        thread_bm.free()
-        self.bm.from_mesh(temp_mesh)
-        bpy.data.meshes.remove(temp_mesh)
+        key = (self.type, *self._cache_key("threads", self.thread_cache_keys))
+        thread_mesh = self._cached_submesh(key, self._mesh_nut_threads)
+        thread_mesh.to_bmesh(self.bm)
         thread_geom = set(bm_as_list(self.bm)) - body_geom
         thread_geom = dict_by_type(thread_geom)
 
@@ -339,19 +344,16 @@ class Nut(Fastener):
         result = bmesh_helpers.trim(thread_bm, geom, loc=loc, norm=Vector((0, 0, 1)))
         bmesh.ops.reverse_faces(thread_bm, faces=thread_bm.faces)
 
-        # Tri divide ngons
-        ngons = [f for f in self.bm.faces if len(f.edges[:]) > 4]
-        bmesh.ops.triangulate(self.bm, faces=ngons)
-
         return thread_bm
 
 
 @dataclass
-class Bolt(Fastener):
+class Bolt(ThreadMeshMixin, Fastener):
     props: FastenerProps
     type = "BOLT"
     heads = HEADS
     drivers = DRIVERS
+    thread_cache_keys = Fastener.thread_cache_keys + ("shank_length",)
 
     custom_thread_props = {
         "custom_thread_profile": PropertyMapping("Custom Profile", default=0),
@@ -431,13 +433,9 @@ class Bolt(Fastener):
 
         # Create Head
         if self.props.head_type != "NONE":
-            # Create and merge head mesh
-            head_bm = self._create_head()
-            head_verts, head_faces = bmesh_helpers.merge_bmesh(head_bm, self.bm)
-
-            # Set head height
+            # Merge head mesh at head height
             offset = Vector((0, 0, self.props.length - (self.props.tolerance * 2)))
-            bmesh.ops.translate(self.bm, vec=offset, verts=head_verts)
+            head_verts = self._mesh_head(Matrix.Translation(offset))
 
             head_opening = filter(lambda v: v.is_boundary, head_verts)
             connection_loop = bmesh_helpers.shared_edges(head_opening)
@@ -457,7 +455,7 @@ class Bolt(Fastener):
             self._chamfer()
 
         if self.props.driver_type != "NONE":
-            driver_bm = self._create_driver()
+            driver_bm = self._mesh_driver()
             self.bm = boolean_bm(self.bm, driver_bm, xform=self._driver_xform)
             driver_bm.free()
 
@@ -483,7 +481,7 @@ class Bolt(Fastener):
 
         self.bm.to_mesh(mesh)
 
-    def _mesh_threads(self):
+    def _build_threads(self):
         """
         Create mesh threads in self.bm
         Returns: Tuple of bottom, top geom dicts whose keys are geometry types
@@ -728,7 +726,7 @@ class Bolt(Fastener):
 
 
 @dataclass
-class ThreadedRod(Fastener):
+class ThreadedRod(ThreadMeshMixin, Fastener):
     props: FastenerProps
     type = "THREADED_ROD"
 
@@ -810,7 +808,7 @@ class ThreadedRod(Fastener):
 
         self.bm.to_mesh(mesh)
 
-    def _mesh_threads(self):
+    def _build_threads(self):
         """
         Create mesh threads in self.bm
         Returns: Tuple of bottom, top geom dicts whose keys are geometry types
@@ -1007,11 +1005,12 @@ class ThreadedRod(Fastener):
 
 
 @dataclass
-class Screw(Fastener):
+class Screw(ThreadMeshMixin, Fastener):
     props: FastenerProps
     type = "SCREW"
     heads = HEADS
     drivers = DRIVERS
+    thread_cache_keys = Fastener.thread_cache_keys + ("shank_length",)
     custom_thread_props = None
 
     type_props = {
@@ -1076,13 +1075,9 @@ class Screw(Fastener):
 
         # Create Head
         if self.props.head_type != "NONE":
-            # Create and merge head mesh
-            head_bm = self._create_head()
-            head_verts, head_faces = bmesh_helpers.merge_bmesh(head_bm, self.bm)
-
-            # Set head height
+            # Merge head mesh at head height
             offset = Vector((0, 0, self.props.length - self.props.tolerance))
-            bmesh.ops.translate(self.bm, vec=offset, verts=head_verts)
+            head_verts = self._mesh_head(Matrix.Translation(offset))
 
             head_opening = filter(lambda v: v.is_boundary, head_verts)
             connection_loop = bmesh_helpers.shared_edges(head_opening)
@@ -1098,7 +1093,7 @@ class Screw(Fastener):
             self._chamfer()
 
         if self.props.driver_type != "NONE":
-            driver_bm = self._create_driver()
+            driver_bm = self._mesh_driver()
             self.bm = boolean_bm(self.bm, driver_bm, xform=self._driver_xform)
             driver_bm.free()
 
@@ -1150,7 +1145,7 @@ class Screw(Fastener):
         # Merge by distance to cleanup point
         bmesh.ops.remove_doubles(self.bm, verts=affected_verts, dist=0.0001)
 
-    def _mesh_threads(self):
+    def _build_threads(self):
         """
         Create mesh threads in self.bm
         Returns: Tuple of bottom, top geom dicts whose keys are geometry types
@@ -1,11 +1,11 @@
 """ Render client run by thumbnail generator in presets.py """
 
-from functools import partial
 import sys
 from typing import Any, Dict, Iterable
 from pathlib import Path
 import collections
 from itertools import islice
+import json
 import pickle
 import asyncio
 from dataclasses import dataclass
@@ -120,10 +120,11 @@ def remove_placeholder_objects(keep: str = ""):
     consume(remove_extras)
 
 
-async def request_presets(ip: str, port: int, preset_type):
+async def request_presets(ip: str, port: int, message):
     reader, writer = await asyncio.open_connection(ip, port)
     print("CLIENT:Requesting Job")
-    writer.write(preset_type.encode())
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    writer.write_eof()
     await writer.drain()
 
     message = await reader.read()
@@ -196,9 +197,6 @@ def generate_thumbnails(job: RenderJob, save_debug: bool = False):
         # name_as_hex = string_to_hex(preset_name)
         output_path = str(job.output_path / bpy.path.clean_name(preset_name))
         # print(output_path)
-        if Path(output_path).with_suffix(".png").exists():
-            print(f"{output_path}.png already exists, skipping")
-            continue
 
         view_layer = bpy.context.view_layer
         remove_placeholder_objects(keep=job.fastener_type)
@@ -237,23 +235,27 @@ def generate_thumbnails(job: RenderJob, save_debug: bool = False):
         yield output_path
 
 
-def run(ip: str = "127.0.0.1", port: int = 8888, save_debug: bool = False):
+def run(ip: str = "127.0.0.1", port: int = 8888, worker_id: int = 0, save_debug: bool = False):
     enable_addon()
-    # Request a preset
-    print("RENDER CLIENT STARTING")
-    preset_request = partial(request_presets, ip, port, "REQUEST:JOB")
-    response = asyncio.run(preset_request())
-    # print(response)
+    # Request a preset, reporting the result of the previous job
+    print(f"RENDER CLIENT {worker_id} STARTING")
+    result = None
+    response = asyncio.run(request_presets(ip, port, [worker_id, result]))
     while response != "TERMINATE":
-        job = RenderJob(*response)
-        results = [image for image in generate_thumbnails(job, save_debug)]
-        if None in results:
-            print(f"Error encountered rendering thumb for {job}")
-        response = asyncio.run(preset_request())
-    print("RENDER CLIENT TERMINATING")
+        job_id, job_args = response
+        job = RenderJob(*job_args)
+        try:
+            results = [image for image in generate_thumbnails(job, save_debug)]
+            success = None not in results
+        except Exception as e:
+            print(f"Error encountered rendering thumb for {job}: {e}")
+            revert_scene()
+            success = False
+        result = [job_id, success]
+        response = asyncio.run(request_presets(ip, port, [worker_id, result]))
+    print(f"RENDER CLIENT {worker_id} TERMINATING")
 
 
 if __name__ == "__main__":
-    ip = sys.argv[-2]
-    port = int(sys.argv[-1])
-    run(ip, port, save_debug=False)
+    ip, port, worker_id = sys.argv[sys.argv.index("--") + 1:][:3]
+    run(ip, int(port), int(worker_id), save_debug=False)
@@ -377,7 +377,7 @@ class OBJECT_OT_save_fastener_preset(bpy.types.Operator):
         for cat in categories:
             self.write_preset(cat)
         
-        # presets.clear_caches()
+        presets.clear_caches()
         bpy.ops.render.generate_bolt_thumbnails()
         return {"FINISHED"}
 
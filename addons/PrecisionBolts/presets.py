@@ -1,12 +1,20 @@
 """
-TODO: disc cache mechanism. Either json or pickle
+Preset csv files are parsed once and kept in a PresetIndex, which is persisted
+to disc and revalidated from file modification times and content hashes
 """
 import asyncio
-from functools import partial, cache
+import hashlib
+import io
+import json
+import os
+import time
+from collections import deque
+from functools import partial
+from itertools import count
 from pathlib import Path
 from csv import DictReader, DictWriter
 import pickle
-from typing import Generator, Dict, Any, Iterable, Tuple, List
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple, List
 from ast import literal_eval
 
 from bpy.types import Context
@@ -51,12 +59,10 @@ def validate_csv(csv: Path) -> bool:
 
 
 def find_preset_by_name(name: str, folder: Path) -> Preset:
-    csv_files = folder.glob("*.csv")
-    preset_collections = map(_read_general_preset_file, csv_files)
-    for collection in preset_collections:
-        if name in collection.keys():
-            return collection[name]
-    raise ValueError(f"No {name} preset in folder csv files")
+    preset = _index.folder_presets(folder, first=True).get(name)
+    if preset is None:
+        raise ValueError(f"No {name} preset in folder csv files")
+    return dict(preset)
 
 
 def user_preset_type_categories(fastener_type: str) -> Iterable[Path]:
@@ -93,14 +99,6 @@ def user_preset_categories_enum(self, context: Context) -> BpyEnum:
     return enum
 
 
-def _csv_reader(csv_file: Path) -> Generator[Dict[str, str], None, None]:
-    """Yield lines of file as dicts"""
-    with open(csv_file, "r") as preset_file:
-        reader = DictReader(preset_file)
-        for entry in reader:
-            yield entry
-
-
 def _type_preset_line(entry: Dict[str, str]) -> Preset:
     """Apply correct types to preset values"""
 
@@ -127,44 +125,158 @@ def _load_thread_definitions(csv_file: Path) -> Iterable[Preset]:
     def _reduce_to_fields(entry: Preset):
         return dicttoolz.keyfilter(lambda k: k in config.THREAD_FIELDS, entry)
 
-    untyped_presets = _csv_reader(csv_file)
-    typed_presets = map(_type_preset_line, untyped_presets)
-    return map(_reduce_to_fields, typed_presets)
+    return map(_reduce_to_fields, _index.read(csv_file))
 
 
-async def generate_thumbnails() -> Path:
-    """Run an instance of Blender in an asyc subprocess and render preset thumbnails with it"""
-
-    async def handle_request(reader, writer, queue: asyncio.Queue):
-        data = await reader.read(100)
-        message = data.decode()
-        addr = writer.get_extra_info("peername")
-        # print(f"Received {message} from {addr}")
-        # print("Responding to Job Request")
-        task = await queue.get()
-        writer.write(task)
-        await writer.drain()
+def _thumb_hash(job: Tuple) -> str:
+    """Content hash of everything a rendered thumbnail depends on"""
+    fastener_type, preset_type, presets, _, resolution = job
+    content = repr((fastener_type, preset_type, resolution, sorted(presets.items())))
+    return hashlib.sha1(content.encode()).hexdigest()
 
-        # print("Close the connection")
-        writer.close()
-        queue.task_done()
 
-    async def run_renderer(print_log: bool = True):
-        ip = config.THUMB_GEN_IP
-        port = config.THUMB_GEN_PORT
-        template = config.PRESET_THUMB_TEMPLATE
-        script = config.PRESET_THUMB_SCRIPT
+def _read_thumb_hashes(folder: Path) -> Dict[str, str]:
+    try:
+        with open(folder / config.PRESET_THUMB_HASHES, "r") as hashes_file:
+            return json.load(hashes_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_thumb_hashes(folder: Path, hashes: Dict[str, str]) -> None:
+    with open(folder / config.PRESET_THUMB_HASHES, "w") as hashes_file:
+        json.dump(hashes, hashes_file, indent=1, sort_keys=True)
+
+
+class ThumbnailRenderFarm:
+    """
+    Job server handing single preset render jobs to a pool of headless Blender workers.
+    Workers request a job and report the result of their previous one with the next
+    request. A worker running a job longer than the timeout is killed and replaced,
+    jobs of failed or killed workers are queued again until retries are exhausted
+    """
+
+    def __init__(self, jobs: Dict[int, Tuple], workers: int, timeout: float, retries: int):
+        self.jobs = jobs
+        self.queue = deque(jobs)
+        self.attempts = {job_id: 0 for job_id in jobs}
+        self.workers = max(1, min(workers, len(jobs)))
+        self.timeout = timeout
+        self.retries = retries
+
+        self.done = set()
+        self.failed = set()
+        # worker_id: (job_id, start_time)
+        self.running: Dict[int, Tuple[int, float]] = {}
+        self.processes: Dict[int, asyncio.subprocess.Process] = {}
+        self._worker_ids = count()
+        self._served_workers = set()
+        self.start_time = 0.0
+        self.on_done: Callable[[int], None] = lambda job_id: None
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self.start_time
+        return len(self.done) / elapsed if elapsed > 0 else 0.0
+
+    def _job_name(self, job_id: int) -> str:
+        fastener_type, preset_type, presets, _, _ = self.jobs[job_id]
+        return f"{fastener_type}:{preset_type}:{next(iter(presets))}"
+
+    def _finish(self, worker_id: int, job_id: int, success: bool) -> None:
+        self.running.pop(worker_id, None)
+        if not success:
+            print(f"Render worker {worker_id} failed {self._job_name(job_id)}")
+            self._retry(job_id)
+            return
+
+        self.done.add(job_id)
+        self.on_done(job_id)
+        print(
+            f"Thumbnail {len(self.done)}/{len(self.jobs)} {self._job_name(job_id)} "
+            f"({self.throughput:.2f} thumbs/s, {self.workers} workers)"
+        )
 
-        script_args = ["--", ip, str(port)]
-        args = ["-b", template, "-P", script] + script_args
+    def _retry(self, job_id: int) -> None:
+        self.attempts[job_id] += 1
+        if self.attempts[job_id] > self.retries:
+            print(f"Giving up on {self._job_name(job_id)}")
+            self.failed.add(job_id)
+        else:
+            self.queue.append(job_id)
+
+    @staticmethod
+    def _parse_request(data: bytes) -> Optional[Tuple[int, Optional[Tuple[int, bool]]]]:
+        """
+        Parse a worker request, a json line of [worker_id, null] or
+        [worker_id, [job_id, success]]. Returns None for anything else
+        """
+        try:
+            message = json.loads(data.decode("utf-8"))
+        except ValueError:
+            return None
+
+        def _is_int(value) -> bool:
+            return isinstance(value, int) and not isinstance(value, bool)
+
+        if not isinstance(message, list) or len(message) != 2:
+            return None
+        worker_id, result = message
+        if not _is_int(worker_id):
+            return None
+        if result is None:
+            return worker_id, None
+        if not isinstance(result, list) or len(result) != 2:
+            return None
+        job_id, success = result
+        if not _is_int(job_id) or not isinstance(success, bool):
+            return None
+        return worker_id, (job_id, success)
+
+    async def handle_request(self, reader, writer) -> None:
+        request = self._parse_request(await reader.readline())
+        # Only answer workers started by this farm
+        if request is None or request[0] not in self.processes:
+            print("Ignoring invalid render worker request")
+            writer.close()
+            return
+
+        worker_id, result = request
+        if result is not None:
+            job_id, success = result
+            # Results are only accepted for the job the worker is running
+            running = self.running.get(worker_id)
+            if running is not None and running[0] == job_id:
+                self._finish(worker_id, job_id, success)
+
+        if self.queue:
+            job_id = self.queue.popleft()
+            self.running[worker_id] = (job_id, time.monotonic())
+            self._served_workers.add(worker_id)
+            response = (job_id, self.jobs[job_id])
+        else:
+            response = "TERMINATE"
+
+        writer.write(pickle.dumps(response))
+        await writer.drain()
+        writer.close()
+
+    async def run_worker(self, print_log: bool = True) -> bool:
+        """Run a worker until it terminates, return False if it never requested a job"""
+        worker_id = next(self._worker_ids)
+        threads = max(1, (os.cpu_count() or 1) // self.workers)
+        script_args = ["--", config.THUMB_GEN_IP, str(config.THUMB_GEN_PORT), str(worker_id)]
+        args = ["-b", config.PRESET_THUMB_TEMPLATE, "-t", str(threads)]
+        args += ["-P", config.PRESET_THUMB_SCRIPT] + script_args
         proc = await asyncio.create_subprocess_exec(
             config.BLENDER,
             *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-
+        self.processes[worker_id] = proc
         stdout, stderr = await proc.communicate()
+        del self.processes[worker_id]
 
         if print_log:
             if stdout:
@@ -172,105 +284,290 @@ async def generate_thumbnails() -> Path:
             if stderr:
                 print(f"{stderr}\n{stderr.decode()}")
 
-    async def main():
-        job_queue = asyncio.Queue()
-        resolution = int(config.PRESET_THUMB_RESOLUTION)
-        output_dir = config.USER_PRESETS_DIR
-
-        fastener_types = (
-            "BOLT",
-            "NUT",
-            "SCREW",
-            "THREADED_ROD",
-        )
-        for fastener_type in fastener_types:
-            category_dirs = user_preset_type_categories(fastener_type)
-            for category_dir in category_dirs:
-                preset_csvs = list(category_dir.glob("*.csv"))
-                valid_csvs = filter(validate_csv, preset_csvs)
-                output_dir = category_dir
-                preset_type = category_dir.stem
-                for preset_csv in valid_csvs:
-                    print(preset_csv)
-                    presets = _read_general_preset_file(preset_csv)
-                    job = (fastener_type, preset_type, presets, output_dir, resolution)
-
-                    await job_queue.put(pickle.dumps(job))
-
-        # Write termination command
-        terminate = pickle.dumps("TERMINATE")
-        await job_queue.put(terminate)
-
-        server_callback = partial(handle_request, queue=job_queue)
+        # Worker crashed or got killed while rendering
+        running = self.running.pop(worker_id, None)
+        if running is not None:
+            print(f"Render worker {worker_id} exited during {self._job_name(running[0])}")
+            self._retry(running[0])
+        return worker_id in self._served_workers
+
+    async def _worker_slot(self, print_log: bool) -> None:
+        """Keep a worker running while jobs are queued"""
+        while self.queue:
+            if not await self.run_worker(print_log) and self.queue:
+                print("Render worker exited without requesting a job, closing slot")
+                return
+
+    async def _watchdog(self) -> None:
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            for worker_id, (job_id, start_time) in list(self.running.items()):
+                if now - start_time < self.timeout:
+                    continue
+                print(f"Render worker {worker_id} timed out on {self._job_name(job_id)}")
+                proc = self.processes.get(worker_id)
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+
+    async def run(self, print_log: bool = True) -> None:
         ip = config.THUMB_GEN_IP
         port = config.THUMB_GEN_PORT
-        job_server = await asyncio.start_server(server_callback, ip, port)
+        job_server = await asyncio.start_server(self.handle_request, ip, port)
 
         addrs = ", ".join(str(sock.getsockname()) for sock in job_server.sockets)
-        print(f"Running job server on {addrs}")
+        print(f"Running job server on {addrs} with {self.workers} render workers")
+        self.start_time = time.monotonic()
         async with job_server:
-            await job_server.start_serving()
-            await run_renderer(config.DEBUG_PRINT_THUMB_RENDER_LOG)
-            # await job_queue.join()
+            watchdog = asyncio.ensure_future(self._watchdog())
+            try:
+                slots = (self._worker_slot(print_log) for _ in range(self.workers))
+                await asyncio.gather(*slots)
+            finally:
+                watchdog.cancel()
+
+
+async def generate_thumbnails() -> Path:
+    """
+    Render preset thumbnails in a pool of background Blender instances.
+    Presets are skipped when their thumbnail was rendered from identical values
+    """
+    resolution = int(config.PRESET_THUMB_RESOLUTION)
+    jobs = {}
+    job_hashes = {}
+    folder_hashes = {}
+    n_skipped = 0
+
+    for fastener_type in config.FASTENER_TYPES:
+        category_dirs = user_preset_type_categories(fastener_type)
+        for category_dir in category_dirs:
+            preset_csvs = list(category_dir.glob("*.csv"))
+            valid_csvs = filter(validate_csv, preset_csvs)
+            output_dir = category_dir
+            preset_type = category_dir.stem
+            hashes = folder_hashes[category_dir] = _read_thumb_hashes(category_dir)
+            for preset_csv in valid_csvs:
+                presets = _read_general_preset_file(preset_csv)
+                for preset_name, preset in presets.items():
+                    job = (fastener_type, preset_type, {preset_name: preset}, output_dir, resolution)
+                    thumb_name = clean_name(preset_name)
+                    thumb_path = (output_dir / thumb_name).with_suffix(config.PRESET_THUMB_SUFFIX)
+                    job_hash = _thumb_hash(job)
+                    if thumb_path.exists():
+                        # Thumbnails rendered before hashes were recorded are kept
+                        hashes.setdefault(thumb_name, job_hash)
+                        if hashes[thumb_name] == job_hash:
+                            n_skipped += 1
+                            continue
+                    job_id = len(jobs)
+                    jobs[job_id] = job
+                    job_hashes[job_id] = (category_dir, thumb_name, job_hash)
+
+    print(f"Rendering {len(jobs)} thumbnails, {n_skipped} unchanged")
+    if jobs:
+
+        def _record_hash(job_id: int):
+            category_dir, thumb_name, job_hash = job_hashes[job_id]
+            folder_hashes[category_dir][thumb_name] = job_hash
+
+        farm = ThumbnailRenderFarm(
+            jobs,
+            config.THUMB_GEN_WORKERS,
+            config.THUMB_GEN_JOB_TIMEOUT,
+            config.THUMB_GEN_RETRIES,
+        )
+        farm.on_done = _record_hash
+        try:
+            await farm.run(config.DEBUG_PRINT_THUMB_RENDER_LOG)
+        finally:
+            for category_dir, hashes in folder_hashes.items():
+                _write_thumb_hashes(category_dir, hashes)
+
+        elapsed = time.monotonic() - farm.start_time
+        print(
+            f"Rendered {len(farm.done)} thumbnails in {elapsed:.1f}s "
+            f"({farm.throughput:.2f} thumbs/s), {len(farm.failed)} failed"
+        )
+    else:
+        for category_dir, hashes in folder_hashes.items():
+            _write_thumb_hashes(category_dir, hashes)
 
-    # asyncio.run(main(), debug=True)
     print("Thumbnail rendering complete")
-    await main()
+
+
+def _populate_thread_values(preset: Preset) -> Preset:
+    """Populate thread fields from 'thread_preset' field value"""
+    thread_name = preset.get("thread_preset")
+    if thread_name is not None:
+        thread_preset = thread_presets().get(thread_name, {})
+        preset = dicttoolz.merge(preset, thread_preset)
+    return preset
 
 
 def _read_general_preset_file(csv_file: Path) -> Dict[str, Preset]:
     """Read csv files and return as dict of 'preset_name': preset"""
-
-    def _populate_thread_values(preset: Preset) -> Preset:
-        """Populate thread fields from 'thread_preset' field value"""
-        thread_name = preset.get("thread_preset")
-        if thread_name is not None:
-            thread_preset = thread_presets().get(thread_name)
-            preset.update(thread_preset)
-        return preset
-
-    # Get presets
-    untyped_presets = _csv_reader(csv_file)
-    typed_presets = map(_type_preset_line, untyped_presets)
-    typed_presets = map(_populate_thread_values, typed_presets)
+    typed_presets = map(_populate_thread_values, _index.read(csv_file))
     return {preset["preset_name"]: preset for preset in typed_presets}
 
 
-def _load_fastener_presets(fastener_type: str):
-    presets_by_category = {}
-    category_dir = user_preset_type_categories(fastener_type)
-    for category in category_dir:
-        csv_files = category.glob("*.csv")
-        preset_collections = map(_read_general_preset_file, csv_files)
-        presets_by_category[category.stem] = dicttoolz.merge(preset_collections)
-    return presets_by_category
+def _file_signature(csv_file: Path) -> Tuple[int, int]:
+    stat = csv_file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PresetIndex:
+    """
+    Typed presets of csv files, parsed once and persisted to a pickled disc cache.
+    Files are revalidated from their modification time and size, a content hash
+    avoids parsing files which were touched but not changed.
+    Lookups are revalidated at most every CHECK_INTERVAL seconds
+    """
+
+    CACHE_VERSION = 1
+    CHECK_INTERVAL = 1.0
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        # str(path): (signature, digest, typed presets)
+        self._files: Dict[str, Tuple[Tuple[int, int], str, List[Preset]]] = {}
+        self._loaded = False
+        self._dirty = False
+        # key: (checked_at, signature, value)
+        self._lookups: Dict[Any, Tuple[float, Any, Any]] = {}
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            with open(self.cache_file, "rb") as cache_file:
+                version, files = pickle.load(cache_file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Ignoring preset cache {self.cache_file}: {e}")
+            return
+        if version == self.CACHE_VERSION:
+            self._files = files
+
+    def save(self) -> None:
+        """Write parsed presets to disc cache if any file was parsed"""
+        if not self._dirty:
+            return
+        temp_file = self.cache_file.with_suffix(".temp")
+        try:
+            with open(temp_file, "wb") as cache_file:
+                pickle.dump((self.CACHE_VERSION, self._files), cache_file)
+            temp_file.replace(self.cache_file)
+        except OSError as e:
+            print(f"Unable to write preset cache {self.cache_file}: {e}")
+            return
+        self._dirty = False
+
+    def read(self, csv_file: Path) -> List[Preset]:
+        """Return typed presets of a csv file, parse it only if it changed"""
+        if not self._loaded:
+            self._load()
+
+        key = str(csv_file)
+        signature = _file_signature(csv_file)
+        entry = self._files.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[2]
+
+        content = csv_file.read_text()
+        digest = hashlib.sha1(content.encode()).hexdigest()
+        if entry is not None and entry[1] == digest:
+            presets = entry[2]
+        else:
+            untyped_presets = DictReader(io.StringIO(content, newline=None))
+            presets = list(map(_type_preset_line, untyped_presets))
+
+        self._files[key] = (signature, digest, presets)
+        self._dirty = True
+        return presets
+
+    def _lookup(self, key, signature_func, build_func):
+        """
+        Return cached value of key, rebuild it when the signature of its files changed.
+        Without signature_func the value is rebuilt once CHECK_INTERVAL passed
+        """
+        now = time.monotonic()
+        cached = self._lookups.get(key)
+        if cached is not None and now - cached[0] < self.CHECK_INTERVAL:
+            return cached[2]
+
+        signature = signature_func() if signature_func else None
+        if cached is not None and signature is not None and cached[1] == signature:
+            value = cached[2]
+        else:
+            value = build_func()
+            self.save()
+        self._lookups[key] = (now, signature, value)
+        return value
+
+    def thread_presets(self) -> Dict[str, Preset]:
+        csv_file = config.METRIC_THREADS_FILE
+
+        def build():
+            presets = _load_thread_definitions(csv_file)
+            return {preset["thread_name"]: preset for preset in presets}
+
+        return self._lookup(csv_file, partial(_file_signature, csv_file), build)
+
+    def folder_presets(self, folder: Path, first: bool = False) -> Dict[str, Preset]:
+        """
+        Merged presets of all csv files in folder by preset name.
+        Later files take precedence unless first is True
+        """
+
+        def signature():
+            files = tuple((f.name, _file_signature(f)) for f in folder.glob("*.csv"))
+            return files, _file_signature(config.METRIC_THREADS_FILE)
+
+        def build():
+            collections = list(map(_read_general_preset_file, folder.glob("*.csv")))
+            return (
+                dicttoolz.merge(collections),
+                dicttoolz.merge(reversed(collections)),
+            )
+
+        merged, first_merged = self._lookup(("FOLDER", folder), signature, build)
+        return first_merged if first else merged
+
+    def fastener_presets(self, fastener_type: str) -> Dict[str, PresetCollection]:
+        """Presets of fastener type by category"""
+
+        def build():
+            categories = user_preset_type_categories(fastener_type)
+            return {category.stem: self.folder_presets(category) for category in categories}
+
+        return self._lookup(("TYPE", fastener_type), None, build)
+
+    def clear(self) -> None:
+        """Revalidate all files on next lookup"""
+        self._lookups.clear()
+
+
+_index = PresetIndex(config.PRESET_CACHE_FILE)
 
 
-# @cache
 def bolt_presets():
-    return _load_fastener_presets("BOLT")
+    return _index.fastener_presets("BOLT")
 
 
-# @cache
 def nut_presets():
-    return _load_fastener_presets("NUT")
+    return _index.fastener_presets("NUT")
 
 
-# @cache
 def screw_presets():
-    return _load_fastener_presets("SCREW")
+    return _index.fastener_presets("SCREW")
 
 
-# @cache
 def thread_rod_presets():
-    return _load_fastener_presets("THREADED_ROD")
+    return _index.fastener_presets("THREADED_ROD")
 
 
-# @cache
 def thread_presets() -> Dict[str, Preset]:
-    csv_file = config.METRIC_THREADS_FILE
-    presets = _load_thread_definitions(csv_file)
-    return {preset["thread_name"]: preset for preset in presets}
+    return _index.thread_presets()
 
 
 _presets = {
@@ -286,8 +583,4 @@ def get(key: str):
 
 
 def clear_caches() -> None:
-    # return None
-    # print("Fastener cache cleared")
-    caches = (bolt_presets, nut_presets, screw_presets, thread_presets)
-    for func in caches:
-        func.cache_clear()
+    _index.clear()
@@ -105,6 +105,10 @@ else:
             from .snapi.i18n import i18n
             i18n.register()
 
+            # Persistent snap primitives cache, handlers track mesh updates
+            from .snapi.mesh_cache import MeshCache
+            MeshCache.register()
+
             register_class(SLCT_tool_settings)
 
             # Tools settings are not stored into Scene, so they are not affected by undo
@@ -172,6 +176,9 @@ else:
             from .snapi.i18n import i18n
             i18n.unregister()
 
+            from .snapi.mesh_cache import MeshCache
+            MeshCache.unregister()
+
             print("{} {} : unregister() success".format(bl_info['name'], __version__))
 
         except Exception as ex:
@@ -0,0 +1,213 @@
+# -*- coding:utf-8 -*-
+
+# #
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+#
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+from .logger import get_logger
+from collections import OrderedDict
+# noinspection PyUnresolvedReferences
+import numpy as np
+# noinspection PyUnresolvedReferences
+import bpy
+# noinspection PyUnresolvedReferences
+from bpy.app.handlers import persistent
+logger = get_logger(__name__, 'ERROR')
+
+
+# ------------------------
+# Mesh snap primitives cache
+# ------------------------
+
+
+class MeshCachePrimitives:
+    """
+        Isolated snap primitives of a mesh, coord in local space
+    """
+    def __init__(self, points, lines):
+        """
+        :param points: np.array (n, 3) float32 loose vertices coord
+        :param lines: np.array (2n, 3) float32 wire edges coord
+        """
+        self.points = points
+        self.lines = lines
+        # index buffers, separated items
+        self.points_indices = np.arange(len(points), dtype='i')
+        self.lines_indices = np.arange(len(lines), dtype='i').reshape(-1, 2)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.points.nbytes +
+            self.lines.nbytes +
+            self.points_indices.nbytes +
+            self.lines_indices.nbytes
+        )
+
+
+class MeshCache:
+    """
+        Persistent cache of mesh snap primitives (loose verts and wire edges),
+        keyed by mesh data pointer and update counter, so operators only evaluate
+        a mesh again once its geometry did change.
+    """
+    # Memory budget in bytes, least recently used items are evicted first
+    budget = 64 * 1024 * 1024
+
+    # key: (pointer, version, verts, edges, loops) -> MeshCachePrimitives
+    _cache = OrderedDict()
+    _nbytes = 0
+
+    # pointer -> update counter
+    _versions = {}
+
+    @classmethod
+    def key(cls, mesh):
+        """
+        :param mesh: blender mesh data
+        :return: cache key, element count guard against pointers reuse
+        """
+        ptr = mesh.as_pointer()
+        return ptr, cls._versions.get(ptr, 0), len(mesh.vertices), len(mesh.edges), len(mesh.loops)
+
+    @staticmethod
+    def evaluate(mesh) -> MeshCachePrimitives:
+        """
+        Find loose vertices and wire edges of a mesh in object mode
+        :param mesh: blender mesh data
+        :return: MeshCachePrimitives
+        """
+        n_verts, n_edges, n_loops = len(mesh.vertices), len(mesh.edges), len(mesh.loops)
+
+        co = np.empty(n_verts * 3, dtype='f4')
+        mesh.vertices.foreach_get("co", co)
+        co.shape = (n_verts, 3)
+
+        edges = np.empty(n_edges * 2, dtype='i')
+        mesh.edges.foreach_get("vertices", edges)
+
+        loop_edges = np.empty(n_loops, dtype='i')
+        mesh.loops.foreach_get("edge_index", loop_edges)
+
+        # vertices without linked edges
+        loose = np.bincount(edges, minlength=n_verts) == 0
+        # edges without linked faces
+        wire = np.bincount(loop_edges, minlength=n_edges) == 0
+
+        points = co[loose]
+        lines = co[edges.reshape(-1, 2)[wire].ravel()]
+
+        return MeshCachePrimitives(points, lines)
+
+    @classmethod
+    def get(cls, mesh) -> MeshCachePrimitives:
+        """
+        Get snap primitives of a mesh, evaluate on cache miss
+        :param mesh: blender mesh data
+        :return: MeshCachePrimitives
+        """
+        key = cls.key(mesh)
+        primitives = cls._cache.get(key)
+
+        if primitives is not None:
+            cls._cache.move_to_end(key)
+            logger.debug("MeshCache.get() hit %s" % mesh.name)
+            return primitives
+
+        primitives = cls.evaluate(mesh)
+        # drop outdated items of this mesh
+        cls.discard(key[0])
+        cls._cache[key] = primitives
+        cls._nbytes += primitives.nbytes
+        cls._evict()
+        logger.debug("MeshCache.get() miss %s %s bytes" % (mesh.name, cls._nbytes))
+        return primitives
+
+    @classmethod
+    def _evict(cls):
+        # keep at least last item even when over budget
+        while cls._nbytes > cls.budget and len(cls._cache) > 1:
+            key, primitives = cls._cache.popitem(last=False)
+            cls._nbytes -= primitives.nbytes
+
+    @classmethod
+    def discard(cls, ptr: int):
+        """
+        Remove items of mesh with given pointer
+        :param ptr: mesh data pointer
+        :return:
+        """
+        for key in [key for key in cls._cache.keys() if key[0] == ptr]:
+            cls._nbytes -= cls._cache.pop(key).nbytes
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+        cls._versions.clear()
+        cls._nbytes = 0
+
+    @classmethod
+    def tag_update(cls, ptr: int):
+        """
+        Increment update counter of mesh with given pointer
+        :param ptr: mesh data pointer
+        :return:
+        """
+        cls._versions[ptr] = cls._versions.get(ptr, 0) + 1
+
+    @classmethod
+    def register(cls):
+        handlers = bpy.app.handlers
+        if _depsgraph_update_post not in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.append(_depsgraph_update_post)
+        for handler in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+            if _reset not in handler:
+                handler.append(_reset)
+
+    @classmethod
+    def unregister(cls):
+        handlers = bpy.app.handlers
+        if _depsgraph_update_post in handlers.depsgraph_update_post:
+            handlers.depsgraph_update_post.remove(_depsgraph_update_post)
+        for handler in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+            if _reset in handler:
+                handler.remove(_reset)
+        cls.clear()
+
+
+@persistent
+def _depsgraph_update_post(scene, depsgraph):
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        _id = update.id.original
+        if isinstance(_id, bpy.types.Object):
+            if _id.type != 'MESH':
+                continue
+            _id = _id.data
+        if isinstance(_id, bpy.types.Mesh):
+            MeshCache.tag_update(_id.as_pointer())
+
+
+@persistent
+def _reset(*args):
+    # undo and file load reallocate data, pointers may be reused
+    MeshCache.clear()
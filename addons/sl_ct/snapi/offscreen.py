@@ -147,9 +147,9 @@ class OffscreenShader:
             if detectable.batch_type == BatchType.POINTS:
                 _indices = np.arange(_len, dtype='i')
             elif detectable.batch_type == BatchType.LINES:
-                _indices = [(i, i + 1) for i in range(0, _len, 2)]
+                _indices = np.arange(_len, dtype='i').reshape(-1, 2)
             else:
-                _indices = [(i, i + 1, i + 2) for i in range(0, _len, 3)]
+                _indices = np.arange(_len, dtype='i').reshape(-1, 3)
 
         ibo = GPUIndexBuf(type=detectable.batch_type.name, seq=_indices)
         size = len(_indices)
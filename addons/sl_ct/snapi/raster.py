@@ -25,6 +25,8 @@
 from .logger import get_logger
 from math import sqrt
 # noinspection PyUnresolvedReferences
+import numpy as np
+# noinspection PyUnresolvedReferences
 from mathutils import Matrix, Vector
 # noinspection PyUnresolvedReferences
 import bmesh
@@ -50,6 +52,7 @@ from .drawable import (
     ImageShader
 )
 from .offscreen import OffscreenShader, DEBUG_SNAP_BUFFER
+from .mesh_cache import MeshCache
 from .types import (
     SnapType,
     BatchType,
@@ -91,6 +94,8 @@ class RasterDetectEngine(DetectEngine):
     def __init__(self, context):
         DetectEngine.__init__(self, context)
         self._buf_size = 2 * self._snap_radius + 1
+        # flat index of snap buffer pixels, nearest to cursor first
+        self._pixel_order = self.pixel_order(self._buf_size)
 
         # self.depth_range = Vector((0, 1e64))
 
@@ -162,19 +167,33 @@ class RasterDetectEngine(DetectEngine):
             else:
                 detectable.create_batch()
 
-    def _detectable_by_index(self, index: int):
+    def _detectables_by_index(self, indices):
         """
-        Find detectable by index
-        :param index:
-        :return:
+        Find detectables by index
+        :param indices: np.array of index
+        :return: list of detectable or None for each index
         """
-        for detectable in self.detectable:
-            if detectable.offset > 0:
-                i = index - detectable.offset
-                if 0 <= i < detectable.buffer_size:
-                    return detectable
-        logger.error("_detectable_by_index(index: %s) not found !" % index)
-        return None
+        detectables = [detectable for detectable in self.detectable if detectable.offset > 0]
+        if not detectables:
+            return [None] * len(indices)
+
+        offsets = np.array([detectable.offset for detectable in detectables], dtype=np.int64)
+        order = np.argsort(offsets, kind='stable')
+        starts = offsets[order]
+        ends = starts + np.array([detectables[i].buffer_size for i in order], dtype=np.int64)
+
+        pos = np.searchsorted(starts, indices, side='right') - 1
+        valid = pos >= 0
+        valid[valid] = indices[valid] < ends[pos[valid]]
+
+        res = []
+        for index, i, is_valid in zip(indices.tolist(), pos.tolist(), valid.tolist()):
+            if is_valid:
+                res.append(detectables[order[i]])
+            else:
+                logger.error("_detectables_by_index(index: %s) not found !" % index)
+                res.append(None)
+        return res
 
     def _detectable_by_type(self, obj, typ: int):
         """
@@ -410,45 +429,33 @@ class RasterDetectEngine(DetectEngine):
         obj = detectable.obj
 
         if obj.mode == "EDIT":
+            # mesh data is not in sync with edit mesh, evaluate without cache
             bm = bmesh.from_edit_mesh(obj.data)
+            points = np.array([v.co[:] for v in bm.verts if not v.link_edges], dtype='f4').reshape(-1, 3)
+            lines = np.array([
+                v.co[:] for ed in bm.edges if ed.is_wire for v in ed.verts
+            ], dtype='f4').reshape(-1, 3)
+            points_indices, lines_indices = None, None
         else:
-            bm = bmesh.new(use_operators=True)
-            bm.from_mesh(obj.data)
-
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-        co = [v.co.copy() for v in bm.verts if not v.link_edges]
-
-        _detectable = self._detectable_by_type(obj, BatchType.POINTS)
-
-        if _detectable is None:
-            logger.error("detectable type POINTS not found %s" % obj.name)
-
-        elif len(co) > 0:
-            _detectable.co = co
-            _detectable.create_batch()
-        else:
-            _detectable.is_empty = True
-
-        co = []
-        for ed in bm.edges:
-            if ed.is_wire:
-                co.extend([ed.verts[0].co.copy(), ed.verts[1].co.copy()])
-
-        _detectable = self._detectable_by_type(obj, BatchType.LINES)
-        if _detectable is None:
-            logger.error("detectable type LINES not found %s" % obj.name)
-
-        elif len(co) > 0:
-            _detectable.co = co
-            _detectable.create_batch()
-        else:
-            _detectable.is_empty = True
-
-        if obj.mode != "EDIT":
-            bm.free()
+            primitives = MeshCache.get(obj.data)
+            points, lines = primitives.points, primitives.lines
+            points_indices, lines_indices = primitives.points_indices, primitives.lines_indices
+
+        for batch_type, co, indices in (
+            (BatchType.POINTS, points, points_indices),
+            (BatchType.LINES, lines, lines_indices)
+        ):
+            _detectable = self._detectable_by_type(obj, batch_type)
+
+            if _detectable is None:
+                logger.error("detectable type %s not found %s" % (batch_type.name, obj.name))
+
+            elif len(co) > 0:
+                _detectable.co = co
+                _detectable.indices = indices
+                _detectable.create_batch()
+            else:
+                _detectable.is_empty = True
 
         logger.debug("mesh isolated verts edges evaluation: %s  %.4f sec" % (obj.name, time.time() - t))
 
@@ -549,18 +556,27 @@ class RasterDetectEngine(DetectEngine):
         fb.clear(color=(0.0, 0.0, 0.0, 0.0))
 
     @staticmethod
-    def four_bytes_as_index(pixel):
+    def pixel_order(size: int):
         """
-        Retrieve index from pixel color + alpha byte values
-        :param pixel:
-        :return:
+        Flat index of buffer pixels sorted by distance from buffer center
+        :param size: buffer size in pixels
+        :return: np.array of flat pixel index
+        """
+        y, x = np.indices((size, size)) - size // 2
+        return np.argsort((x * x + y * y).ravel(), kind='stable')
+
+    @staticmethod
+    def buffer_as_indices(buffer):
         """
-        r, g, b, a = pixel
+        Retrieve index of all pixels from color + alpha byte values
+        :param buffer: UBYTE rgba buffer
+        :return: np.array of index, one by pixel
+        """
+        pixels = np.asarray(buffer, dtype=np.uint8).reshape(-1, 4).astype(np.int64)
         if DEBUG_SNAP_BUFFER:
             # inhibit alpha as it is set to 1 in OffscreenShader
-            a = 0
-        raw = ((a * 256 + b) * 256 + g) * 256 + r
-        return int(round(raw, 0))
+            pixels[:, 3] = 0
+        return pixels @ np.array([1, 256, 65536, 16777216], dtype=np.int64)
 
     def _process_buffer(self, buffer):
         """
@@ -568,37 +584,34 @@ class RasterDetectEngine(DetectEngine):
         :param buffer:
         :return:
         """
-        loc = [self._snap_radius, self._snap_radius]
-        d = 1
-        m = self._buf_size
-        maxi = 2 * m - 1
+        indices = self.buffer_as_indices(buffer)[self._pixel_order]
+
+        # unique index, nearest to cursor first
+        found, first = np.unique(indices, return_index=True)
+        order = np.argsort(first, kind='stable')
+        found, first = found[order], first[order]
+        keep = found != 0
+        found, first = found[keep], first[keep]
+
         res = False
-        found = {0}
-
-        while m < maxi:
-            # axis x, y -> y, x in buffer
-            for i in range(2):
-                # move x and y
-                while 2 * loc[i] * d < m:
-                    x, y = loc
-                    # logger.debug("x: %s y: %s" % (x, y))
-                    index = self.four_bytes_as_index(buffer[y][x])
-                    loc[i] += d
-                    if index not in found:
-                        found.add(index)
-                        detectable = self._detectable_by_index(index)
-                        if detectable is not None:
-                            # Detect all as points must snap before lines
-                            if self._snap_item(detectable, index - detectable.offset):
-                                logger.info("RasterDetectEngine._detectable_by_index(%s) found: %s %s %s" % (
-                                    index,
-                                    detectable,
-                                    x, y
-                                ))
-                                res = True
-
-            d = -d
-            m += 4 * self._snap_radius * d + 1
+
+        if found.size == 0:
+            return res
+
+        pixels = self._pixel_order[first]
+        detectables = self._detectables_by_index(found)
+
+        for index, pixel, detectable in zip(found.tolist(), pixels.tolist(), detectables):
+            if detectable is not None:
+                # Detect all as points must snap before lines
+                if self._snap_item(detectable, index - detectable.offset):
+                    y, x = divmod(pixel, self._buf_size)
+                    logger.info("RasterDetectEngine._detectables_by_index(%s) found: %s %s %s" % (
+                        index,
+                        detectable,
+                        x, y
+                    ))
+                    res = True
 
         return res
 
@@ -854,7 +867,7 @@ class RasterDetectEngine(DetectEngine):
                 )
 
             # Analyse buffer
-            found = self._process_buffer(self._snap_buf.to_list())
+            found = self._process_buffer(self._snap_buf)
 
             # Flag set in .offscreen
             if DEBUG_SNAP_BUFFER:
@@ -24,13 +24,13 @@
 # ----------------------------------------------------------
 from .logger import get_logger
 # noinspection PyUnresolvedReferences
-import bpy
-# noinspection PyUnresolvedReferences
 import bmesh
 from math import pi, sin, cos, log2, pow
 import time
 # noinspection PyUnresolvedReferences
 from mathutils import Vector, Matrix
+# noinspection PyUnresolvedReferences
+from mathutils.bvhtree import BVHTree
 from .preferences import (
     USE_TRI_OVERLAY
 )
@@ -57,6 +57,133 @@ logger = get_logger(__name__, 'ERROR')
 GEOMETRY_NODES = False
 
 
+class MeshBVH:
+    """
+    Unified ray cast and geometry access for mesh objects in object and edit mode
+    Object mode rely on Object.ray_cast() and evaluated mesh,
+    edit mode on a BVHTree built from edit bmesh, so there is no need for temporary objects
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.is_edit = obj.mode == "EDIT"
+        self._bm = None
+        self._bvh = None
+        self._me = None
+        self._tris = None
+
+    @property
+    def name(self) -> str:
+        return self.obj.name
+
+    @property
+    def type(self) -> str:
+        return self.obj.type
+
+    @property
+    def bound_box(self):
+        return self.obj.bound_box
+
+    @property
+    def dimensions(self):
+        return self.obj.dimensions
+
+    def tag_update(self):
+        """ Edit mesh did change, rebuild tree on next ray cast
+        :return:
+        """
+        self._bvh = None
+        self._tris = None
+
+    def _edit_bvh(self):
+        if self._bvh is None:
+            t = time.time()
+            self._bm = bmesh.from_edit_mesh(self.obj.data)
+            self._bm.verts.ensure_lookup_table()
+            self._bm.faces.ensure_lookup_table()
+            self._bvh = BVHTree.FromBMesh(self._bm)
+            logger.debug("MeshBVH %s %.4f sec" % (self.obj.name, time.time() - t))
+        return self._bvh
+
+    def ray_cast(self, origin: Vector, direction: Vector):
+        """
+        :param origin: ray origin in object's space
+        :param direction: ray direction in object's space
+        :return: success, location, normal, face_index in object's space
+        """
+        if self.is_edit:
+            location, normal, face_index, dist = self._edit_bvh().ray_cast(origin, direction)
+            return location is not None, location, normal, face_index
+
+        return self.obj.ray_cast(origin, direction)
+
+    def evaluate(self, depsgraph):
+        """ Init geometry access for hits evaluation
+        :param depsgraph:
+        :return:
+        """
+        if self.is_edit:
+            self._edit_bvh()
+
+        else:
+            if len(self.obj.modifiers) > 0:
+                self._me = self.obj.evaluated_get(depsgraph).to_mesh()
+            else:
+                self._me = self.obj.data
+            self._tris = None
+
+    @property
+    def face_count(self) -> int:
+        if self.is_edit:
+            return len(self._bm.faces)
+        return len(self._me.polygons)
+
+    def face_select(self, face_index: int) -> bool:
+        if self.is_edit:
+            return self._bm.faces[face_index].select
+        return self._me.polygons[face_index].select
+
+    def face_verts(self, face_index: int) -> list:
+        """
+        :param face_index:
+        :return: list of (vertex index, vertex selected, coord in object's space)
+        """
+        if self.is_edit:
+            return [(v.index, v.select, v.co) for v in self._bm.faces[face_index].verts]
+        me = self._me
+        return [(i, me.vertices[i].select, me.vertices[i].co) for i in me.polygons[face_index].vertices]
+
+    def face_center(self, face_index: int) -> Vector:
+        if self.is_edit:
+            return self._bm.faces[face_index].calc_center_median()
+        return self._me.polygons[face_index].center
+
+    def face_tris(self, face_index: int) -> list:
+        """
+        :param face_index:
+        :return: gl compatible triangulated face coord in object's space
+        """
+        if self.is_edit:
+            if self._tris is None:
+                self._tris = self._bm.calc_loop_triangles()
+            return [
+                loop.vert.co for tri in self._tris if tri[0].face.index == face_index for loop in tri
+            ]
+        me = self._me
+        if self._tris is None:
+            me.calc_loop_triangles()
+            self._tris = me.loop_triangles
+        return [
+            me.vertices[v].co for tri in self._tris for v in tri.vertices if tri.polygon_index == face_index
+        ]
+
+    def exit(self):
+        self._bm = None
+        self._bvh = None
+        self._me = None
+        self._tris = None
+
+
 class RayCastDetectEngine(DetectEngine):
     """
     A raycast based detect engine for Mesh objects
@@ -88,13 +215,14 @@ class RayCastDetectEngine(DetectEngine):
         # object: pixel xmin xmax, ymin, ymax
         self._visible_bounds = {}
         self._visible_objects = {}
-        self._edit_mode_objects = {}
+        # object name: MeshBVH
+        self._targets = {}
 
     def _add_collection_instance(self, empty, space, coll):
         # objects
         _space = space @ Matrix.Translation(-coll.instance_offset)
         self._visible_objects.update({
-            (o, id(_space)): _space @ o.matrix_world
+            (self._target(o), id(_space)): _space @ o.matrix_world
             for o in coll.objects if o.type == "MESH"
         })
         # nested collection instances
@@ -131,32 +259,24 @@ class RayCastDetectEngine(DetectEngine):
     #         else:
     #             continue
 
-    @staticmethod
-    def create_obj_from_edit(context, o, matrix_world):
-        """ Edit mode objects are not visible for ray cast, create a temporary copy in OBJECT mode.
-        :param context:
-        :param o: object in EDIT mode
-        :param matrix_world: object's matrix_world
-        :return: object copy in OBJECT mode
+    def _target(self, o) -> MeshBVH:
+        """ Share a MeshBVH between instances of same object
+        :param o: mesh object
+        :return: MeshBVH
         """
-        bm = bmesh.from_edit_mesh(o.data)
-        me = bpy.data.meshes.new("CAD Transform temp - %s" % o.name)
-        bm.to_mesh(me)
-        bm.free()
-        new_o = bpy.data.objects.new("CAD Transform temp - %s" % o.name, me)
-        context.scene.collection.objects.link(new_o)
-        new_o.hide_set(True)
-        new_o.matrix_world[:] = matrix_world
-        return new_o
+        target = self._targets.get(o.name)
+        if target is None:
+            target = MeshBVH(o)
+            self._targets[o.name] = target
+        return target
 
     def update(self, context):
-        """ Update object copy from EDIT mode one
+        """ Edit mode geometry did change, rebuild BVHTree on demand
         :return:
         """
-        for (name, key), o in self._edit_mode_objects.items():
-            bm = bmesh.from_edit_mesh(bpy.data.objects[name].data)
-            bm.to_mesh(o.data)
-            bm.free()
+        for target in self._targets.values():
+            if target.is_edit:
+                target.tag_update()
 
     def start(self, context, event):
         t = time.time()
@@ -170,7 +290,7 @@ class RayCastDetectEngine(DetectEngine):
 
         # id() in key provide uniqueness to handle collection instances objects
         self._visible_objects.update({
-            (o, id(o.matrix_world)): o.matrix_world for o in context.visible_objects if o.type == "MESH"
+            (self._target(o), id(o.matrix_world)): o.matrix_world for o in context.visible_objects if o.type == "MESH"
         })
 
         if context.window_manager.slct.collection_instances:
@@ -178,14 +298,6 @@ class RayCastDetectEngine(DetectEngine):
                 if empty.type == "EMPTY" and empty.instance_type == 'COLLECTION':
                     self._add_collection_instance(empty, empty.matrix_world, empty.instance_collection)
 
-        # Create data from mesh in edit mode not visible by obj.ray_cast() ..
-        for (o, key), matrix_world in list(self._visible_objects.items()):
-            if o.mode == "EDIT":
-                new_o = self.create_obj_from_edit(context, o, matrix_world)
-                self._edit_mode_objects[(o.name, key)] = new_o
-                del self._visible_objects[(o, key)]
-                self._visible_objects[(new_o, key)] = matrix_world
-
         # init _visible
         self.exclude(context)
 
@@ -202,7 +314,8 @@ class RayCastDetectEngine(DetectEngine):
         res = [Vector((0, 0)) for i in range(8)]
         for (o, key), matrix_world in self._visible_objects.items():
             try:
-                if o.name not in self._exclude:
+                # objects in edit mode are never excluded, skip selected faces instead
+                if o.is_edit or o.name not in self._exclude:
                     box = []
                     if self._any_visible_box(o, matrix_world, v, res, box):
                         self._visible_bounds[(o, key)] = box, matrix_world
@@ -216,9 +329,9 @@ class RayCastDetectEngine(DetectEngine):
         self._visible_bounds.clear()
         self._visible_objects.clear()
         self._skip_selected_faces = False
-        for (name, o) in self._edit_mode_objects.items():
-            bpy.data.objects.remove(o, do_unlink=True)
-        self._edit_mode_objects.clear()
+        for target in self._targets.values():
+            target.exit()
+        self._targets.clear()
         self._visible.clear()
         self._include.clear()
 
@@ -230,7 +343,7 @@ class RayCastDetectEngine(DetectEngine):
         self.exclude_offscreen()
 
     @staticmethod
-    def _object_ray_cast(obj, matrix: Matrix, origin: Vector, direction: Vector):
+    def _object_ray_cast(obj: MeshBVH, matrix: Matrix, origin: Vector, direction: Vector):
         # get the ray in object's space
         matrix_inv = Geom3d.matrix_inverted(matrix)
         ray_origin = matrix_inv @ origin
@@ -334,23 +447,24 @@ class RayCastDetectEngine(DetectEngine):
 
         return t, p, d
 
-    def _closest_mesh_vert(self, obj, me, hits):
+    def _closest_mesh_vert(self, obj, target: MeshBVH, hits):
+        face_count = target.face_count
         for face_index, hit in hits.items():
-            if face_index < len(me.polygons):
+            if face_index < face_count:
                 pos, normal, matrix_world, z, ray_depth = hit
 
-                if self._skip_selected_faces and me.polygons[face_index].select:
+                if self._skip_selected_faces and target.face_select(face_index):
                     continue
 
                 # TODO: handle "visible" state
                 verts = [
-                    (i, matrix_world @ me.vertices[i].co)
-                    for i in me.polygons[face_index].vertices
+                    (select, matrix_world @ co)
+                    for i, select, co in target.face_verts(face_index)
                 ]
 
-                for i, co in verts:
+                for select, co in verts:
 
-                    if self._skip_selected_faces and me.vertices[i].select:
+                    if self._skip_selected_faces and select:
                         continue
 
                     dist = View.distance_pixels_from_3d_sq(co)
@@ -430,21 +544,19 @@ class RayCastDetectEngine(DetectEngine):
 
         return found, radius, (typ, dist, pos, res, fac, z)
 
-    def _closest_mesh_face(self, obj, me, hits):
+    def _closest_mesh_face(self, obj, target: MeshBVH, hits):
 
         seek_radius = self._snap_radius_sq
         snap_radius = self._snap_radius_sq
-
-        if USE_TRI_OVERLAY:
-            me.calc_loop_triangles()
+        face_count = target.face_count
 
         for face_index, hit in hits.items():
-            if face_index < len(me.polygons):
+            if face_index < face_count:
 
                 # Find closest item start by verts, then edges / center, face center if closest
                 # and fallback to face if nothing else is found in radius
 
-                if self._skip_selected_faces and me.polygons[face_index].select:
+                if self._skip_selected_faces and target.face_select(face_index):
                     # skip selected face in edit mode when snapping to normal
                     continue
 
@@ -454,8 +566,8 @@ class RayCastDetectEngine(DetectEngine):
 
                 # must store as tris
                 verts = [
-                    (self._skip_selected_faces and me.vertices[v].select, matrix_world @ me.vertices[v].co)
-                    for v in me.polygons[face_index].vertices
+                    (self._skip_selected_faces and select, matrix_world @ co)
+                    for i, select, co in target.face_verts(face_index)
                 ]
 
                 res = None
@@ -473,7 +585,7 @@ class RayCastDetectEngine(DetectEngine):
                             typ, dist, pos, res, fac, z = ret
 
                 if SnapType.has(SnapType.FACE_CENTER):
-                    p = matrix_world @ me.polygons[face_index].center
+                    p = matrix_world @ target.face_center(face_index)
                     dpix = View.distance_pixels_from_3d_sq(p)
                     if dpix < seek_radius:
                         pos = p
@@ -491,10 +603,7 @@ class RayCastDetectEngine(DetectEngine):
                     #    continue
                     # Store gl compatible triangulated faces coord
                     if USE_TRI_OVERLAY:
-                        res = [
-                            matrix_world @ me.vertices[v].co
-                            for tri in me.loop_triangles for v in tri.vertices if tri.polygon_index == face_index
-                        ]
+                        res = [matrix_world @ co for co in target.face_tris(face_index)]
                     else:
                         res = [v[1] for v in verts]
                     # fake distance max so anything else will snap before
@@ -509,22 +618,23 @@ class RayCastDetectEngine(DetectEngine):
                                   target=obj
                                   )
 
-    def _closest_mesh_edge(self, obj, me, hits):
+    def _closest_mesh_edge(self, obj, target: MeshBVH, hits):
 
         snap_radius = self._snap_radius_sq
         seek_radius = self._snap_radius_sq
+        face_count = target.face_count
 
         for face_index, hit in hits.items():
-            if face_index < len(me.polygons):
+            if face_index < face_count:
 
-                if self._skip_selected_faces and me.polygons[face_index].select:
+                if self._skip_selected_faces and target.face_select(face_index):
                     continue
 
                 # TODO: handle "visible" state
                 pos, normal, matrix_world, z, ray_depth = hit
                 verts = [
-                    (self._skip_selected_faces and me.vertices[v].select, matrix_world @ me.vertices[v].co)
-                    for v in me.polygons[face_index].vertices
+                    (self._skip_selected_faces and select, matrix_world @ co)
+                    for i, select, co in target.face_verts(face_index)
                 ]
                 dist = 1e32
                 typ = None
@@ -549,7 +659,7 @@ class RayCastDetectEngine(DetectEngine):
                                   )
 
             else:
-                logger.error("_closest_mesh_edge face_index > n polys %s > %s" % (face_index, len(me.polygons)))
+                logger.error("_closest_mesh_edge face_index > n polys %s > %s" % (face_index, face_count))
 
     def _closest_geometry(self, context, hits_dict):
         """
@@ -562,22 +672,20 @@ class RayCastDetectEngine(DetectEngine):
         # TODO: handle "visible" state at object's level, including "isolated" state
         depsgraph = context.evaluated_depsgraph_get()
 
-        for o, hits in hits_dict.items():
-            if o.type == "MESH":
+        for target, hits in hits_dict.items():
+            if target.type == "MESH":
 
-                if len(o.modifiers) > 0:
-                    me = o.evaluated_get(depsgraph).to_mesh()
-                else:
-                    me = o.data
+                target.evaluate(depsgraph)
+                o = target.obj
 
                 if SnapType.has(SnapType.FACE | SnapType.FACE_CENTER):
-                    self._closest_mesh_face(o, me, hits)
+                    self._closest_mesh_face(o, target, hits)
 
                 elif SnapType.has(SnapType.EDGE | SnapType.EDGE_CENTER):
-                    self._closest_mesh_edge(o, me, hits)
+                    self._closest_mesh_edge(o, target, hits)
 
                 elif SnapType.has(SnapType.VERT):
-                    self._closest_mesh_vert(o, me, hits)
+                    self._closest_mesh_vert(o, target, hits)
 
     def _cast(self, context, hits, radius, use_center, deep_cast):
         """
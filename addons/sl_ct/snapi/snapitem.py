@@ -25,6 +25,8 @@
 from .. import bl_info
 from .logger import get_logger
 from math import atan2
+from heapq import nsmallest
+from logging import DEBUG
 # noinspection PyUnresolvedReferences
 import bmesh
 # noinspection PyUnresolvedReferences
@@ -84,7 +86,8 @@ class SnapItem:
         self.ray_depth = ray_depth
         self.target_type = target_type
         self.target = target
-        logger.debug("SnapItem %s %.4f pos: %s coords: %s" % (typ, dist, coord, self.coords))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("SnapItem %s %.4f pos: %s coords: %s" % (typ, dist, coord, self.coords))
 
     def __eq__(self, other) -> bool:
         return \
@@ -135,13 +138,25 @@ class SnapItems:
         cls.found = False
         cls._snapitems.clear()
 
+    @classmethod
+    def best(cls, key, k: int = 1) -> list:
+        """
+        Partial sort, stable as list.sort()
+        :param key: sort key function
+        :param k: number of items
+        :return: list of k best SnapItem
+        """
+        if k == 1:
+            return [min(cls._snapitems, key=key)]
+        return nsmallest(k, cls._snapitems, key=key)
+
     @classmethod
     def find(cls, key) -> SnapItem:
-        cls._snapitems.sort(key=key)
-        logger.debug("find() : snapitems: \n\n" + "\n\n".join([
-            "%s: %s" % (i, item) for i, item in enumerate(cls._snapitems)
-        ]))
-        closest = cls._snapitems[0]
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("find() : snapitems: \n\n" + "\n\n".join([
+                "%s: %s" % (i, item) for i, item in enumerate(sorted(cls._snapitems, key=key))
+            ]))
+        closest = cls.best(key)[0]
         cls.active = closest
         cls.exit()
         return closest
@@ -292,9 +307,18 @@ class SnapContext:
         :return:
         NOTE: points include center of lines and tris
         """
-        pts = cls.find_all_by_type(SnapItemType.POINT | SnapItemType.CENTER)
-        lines = cls.find_all_by_type(SnapItemType.LINE, SnapItemType.CENTER)
-        tris = cls.find_all_by_type(SnapItemType.TRI, SnapItemType.CENTER)
+        pts, lines, tris = [], [], []
+        # single pass, buckets by type
+        for snapitem in cls._items:
+            typ = snapitem.type
+            if typ & (SnapItemType.POINT | SnapItemType.CENTER):
+                pts.append(snapitem)
+            if typ & SnapItemType.CENTER:
+                continue
+            if typ & SnapItemType.LINE:
+                lines.append(snapitem)
+            if typ & SnapItemType.TRI:
+                tris.append(snapitem)
         logger.debug("SnapContext._by_type() pts: %s lines: %s tris: %s" % (len(pts), len(lines), len(tris)))
         return pts, lines, tris
 
@@ -39,6 +39,9 @@ class add_mesh_bolt(Operator, AddObjectHelper):
     change: BoolProperty(name="Change",
                          default=False,
                          description="change Bolt")
+    share_mesh: BoolProperty(name="Share Mesh",
+                             default=False,
+                             description="Use one mesh for all bolts made with the same settings")
 
     # Model Types
     Model_Type_List = [('bf_Model_Bolt', 'BOLT', 'Bolt Model'),
@@ -422,6 +425,7 @@ class add_mesh_bolt(Operator, AddObjectHelper):
         if not self.change:
             # generic transform props
             col.separator()
+            col.prop(self, 'share_mesh')
             col.prop(self, 'align')
             col.prop(self, 'location')
             col.prop(self, 'rotation')
@@ -447,6 +451,10 @@ class add_mesh_bolt(Operator, AddObjectHelper):
 
                 mesh = createMesh.Create_New_Mesh(self, context, adjusted_scale)
 
+                # Only change this bolt when its mesh is shared with others
+                if obj.data.users > 1:
+                    obj.data = obj.data.copy()
+
                 # Modify existing mesh data object by replacing geometry (but leaving materials etc)
                 bm = bmesh.new()
                 bm.from_mesh(mesh)
@@ -466,6 +474,10 @@ class add_mesh_bolt(Operator, AddObjectHelper):
                 except:
                     pass
 
+            elif self.share_mesh:
+                mesh = createMesh.Get_Shared_Mesh(self, context, adjusted_scale)
+                obj = object_utils.object_data_add(context, mesh, operator=self)
+
             else:
                 mesh = createMesh.Create_New_Mesh(self, context, adjusted_scale)
                 obj = object_utils.object_data_add(context, mesh, operator=self)
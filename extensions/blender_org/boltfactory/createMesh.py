@@ -13,6 +13,9 @@ from math import (
     tan, radians, atan, degrees
 )
 from random import triangular
+from itertools import chain
+from collections import OrderedDict
+import numpy as np
 from bpy_extras.object_utils import AddObjectHelper, object_data_add
 
 NARROW_UI = 180
@@ -60,38 +63,77 @@ disadvantage of not being able to interactively change the properties.
 
 def RemoveDoubles(verts, faces, Decimal_Places=4):
 
-    new_verts = []
-    new_faces = []
-    dict_verts = {}
-    Rounded_Verts = []
-
-    for v in verts:
-        Rounded_Verts.append([round(v[0], Decimal_Places),
-                              round(v[1], Decimal_Places),
-                              round(v[2], Decimal_Places)])
-
-    for face in faces:
-        new_face = []
-        for vert_index in face:
-            Real_co = tuple(verts[vert_index])
-            Rounded_co = tuple(Rounded_Verts[vert_index])
-
-            if Rounded_co not in dict_verts:
-                dict_verts[Rounded_co] = len(dict_verts)
-                new_verts.append(Real_co)
-            if dict_verts[Rounded_co] not in new_face:
-                new_face.append(dict_verts[Rounded_co])
-        if len(new_face) == 3 or len(new_face) == 4:
-            new_faces.append(new_face)
-
-    return new_verts, new_faces
+    new_verts, face_verts, face_sizes = Weld_Verts_Faces(verts, faces, Decimal_Places)
+    new_faces = np.split(face_verts, np.cumsum(face_sizes)[:-1]) if len(face_sizes) else []
+
+    return [tuple(v) for v in new_verts.tolist()], [f.tolist() for f in new_faces]
+
+
+# Array version of RemoveDoubles. Verts that round to the same key are
+# welded and numbered in the order the faces first use them,
+# repeated verts are dropped from each face and only tris and quads are kept.
+# Returns the welded verts, the flat face vert indices and the face sizes.
+def Weld_Verts_Faces(verts, faces, Decimal_Places=4):
+    verts = Verts_Array(verts)
+    if not len(faces):
+        return verts[:0], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    face_sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    face_verts = np.fromiter(chain.from_iterable(faces), dtype=np.int64,
+                             count=int(face_sizes.sum()))
+
+    # integer keys group like the rounded coordinates, and sorting the
+    # rows with lexsort is much quicker than np.unique(..., axis=0)
+    Scaled_Verts = verts * 10.0 ** Decimal_Places
+    Rounded_Verts = np.rint(Scaled_Verts)
+    # round() rounds the exact decimal value of a coordinate, so it can only
+    # disagree with rint of the scaled value near a .5 tie, use it there
+    Ties = np.abs(Scaled_Verts - np.floor(Scaled_Verts) - 0.5) < 1e-6
+    if Ties.any():
+        Tie_Rounded = [round(v, Decimal_Places) for v in verts[Ties].tolist()]
+        Rounded_Verts[Ties] = np.rint(np.array(Tie_Rounded) * 10.0 ** Decimal_Places)
+    Rounded_Verts = Rounded_Verts.astype(np.int64)
+    sort = np.lexsort(Rounded_Verts.T[::-1])
+    new_key = np.ones(len(verts), dtype=bool)
+    new_key[1:] = np.any(Rounded_Verts[sort[1:]] != Rounded_Verts[sort[:-1]], axis=1)
+    vert_keys = np.empty(len(verts), dtype=np.int64)
+    vert_keys[sort] = np.cumsum(new_key) - 1
+    face_keys = vert_keys[face_verts]
+
+    used_keys, first_use = np.unique(face_keys, return_index=True)
+    order = np.argsort(first_use, kind='stable')
+    key_to_vert = np.zeros(len(verts), dtype=np.int64)
+    key_to_vert[used_keys[order]] = np.arange(len(used_keys))
+    new_verts = verts[face_verts[first_use[order]]]
+    face_verts = key_to_vert[face_keys]
+
+    # a vert that is repeated in a face only keeps its first corner
+    face_ids = np.repeat(np.arange(len(faces)), face_sizes)
+    sort = np.lexsort((np.arange(len(face_verts)), face_verts, face_ids))
+    repeated = np.zeros(len(face_verts), dtype=bool)
+    repeated[sort[1:]] = ((face_ids[sort[1:]] == face_ids[sort[:-1]]) &
+                          (face_verts[sort[1:]] == face_verts[sort[:-1]]))
+    face_verts = face_verts[~repeated]
+    face_ids = face_ids[~repeated]
+
+    face_sizes = np.bincount(face_ids, minlength=len(faces))
+    keep = (face_sizes == 3) | (face_sizes == 4)
+
+    return new_verts, face_verts[keep[face_ids]], face_sizes[keep]
+
+
+# Returns the verts as a float64 array of shape (n, 3)
+def Verts_Array(verts):
+    return np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+
+
+# Returns the vert lists/arrays joined into one array
+def Stack_Verts(*parts):
+    return np.concatenate([Verts_Array(v) for v in parts])
 
 
 def Scale_Mesh_Verts(verts, scale_factor):
-    Ret_verts = []
-    for v in verts:
-        Ret_verts.append([v[0] * scale_factor, v[1] * scale_factor, v[2] * scale_factor])
-    return Ret_verts
+    return Verts_Array(verts) * scale_factor
 
 
 # Create a matrix representing a rotation.
@@ -148,10 +190,10 @@ def Get_Phillips_Bit_Height(Bit_Dia):
 #                    Miscellaneous Utilities
 # ####################################################################
 
-# Returns a list of verts rotated by the given matrix. Used by SpinDup
+# Returns an array of verts rotated by the given matrix. Used by SpinDup
 def Rot_Mesh(verts, matrix):
-    from mathutils import Vector
-    return [(matrix @ Vector(v))[:] for v in verts]
+    matrix = np.array(matrix, dtype=np.float64)
+    return Verts_Array(verts) @ matrix[:3, :3].T + matrix[:3, 3]
 
 
 # Returns a list of faces that has there index incremented by offset
@@ -161,6 +203,7 @@ def Copy_Faces(faces, offset):
 
 # Much like Blenders built in SpinDup
 def SpinDup(VERTS, FACES, DEGREE, DIVISIONS, AXIS):
+    VERTS = Verts_Array(VERTS)
     verts = []
     faces = []
 
@@ -171,37 +214,24 @@ def SpinDup(VERTS, FACES, DEGREE, DIVISIONS, AXIS):
 
     for i in range(int(DIVISIONS)):
         rotmat = Simple_RotationMatrix(step * i, 4, AXIS)  # 4x4 rotation matrix, 30d about the x axis.
-        Rot = Rot_Mesh(VERTS, rotmat)
-        faces.extend(Copy_Faces(FACES, len(verts)))
-        verts.extend(Rot)
-    return verts, faces
+        faces.extend(Copy_Faces(FACES, i * len(VERTS)))
+        verts.append(Rot_Mesh(VERTS, rotmat))
+    return Stack_Verts(*verts), faces
 
 
-# Returns a list of verts that have been moved up the z axis by DISTANCE
+# Returns an array of verts that have been moved up the z axis by DISTANCE
 def Move_Verts_Up_Z(VERTS, DISTANCE):
-    ret = []
-    for v in VERTS:
-        ret.append([v[0], v[1], v[2] + DISTANCE])
-    return ret
+    return Verts_Array(VERTS) + (0.0, 0.0, DISTANCE)
 
 
 # Returns a list of verts and faces that has been mirrored in the AXIS
 def Mirror_Verts_Faces(VERTS, FACES, AXIS, FLIP_POINT=0):
-    ret_vert = []
+    ret_vert = Verts_Array(VERTS).copy()
     ret_face = []
     offset = len(VERTS)
-    if AXIS == 'y':
-        for v in VERTS:
-            Delta = v[0] - FLIP_POINT
-            ret_vert.append([FLIP_POINT - Delta, v[1], v[2]])
-    if AXIS == 'x':
-        for v in VERTS:
-            Delta = v[1] - FLIP_POINT
-            ret_vert.append([v[0], FLIP_POINT - Delta, v[2]])
-    if AXIS == 'z':
-        for v in VERTS:
-            Delta = v[2] - FLIP_POINT
-            ret_vert.append([v[0], v[1], FLIP_POINT - Delta])
+    Column = {'y': 0, 'x': 1, 'z': 2}[AXIS]
+    Delta = ret_vert[:, Column] - FLIP_POINT
+    ret_vert[:, Column] = FLIP_POINT - Delta
 
     for f in FACES:
         fsub = []
@@ -216,20 +246,16 @@ def Mirror_Verts_Faces(VERTS, FACES, AXIS, FLIP_POINT=0):
 # Returns a list of faces that
 # make up an array of 4 point polygon.
 def Build_Face_List_Quads(OFFSET, COLUMN, ROW, FLIP=0):
-    Ret = []
-    RowStart = 0
-    for j in range(ROW):
-        for i in range(COLUMN):
-            Res1 = RowStart + i
-            Res2 = RowStart + i + (COLUMN + 1)
-            Res3 = RowStart + i + (COLUMN + 1) + 1
-            Res4 = RowStart + i + 1
-            if FLIP:
-                Ret.append([OFFSET + Res1, OFFSET + Res2, OFFSET + Res3, OFFSET + Res4])
-            else:
-                Ret.append([OFFSET + Res4, OFFSET + Res3, OFFSET + Res2, OFFSET + Res1])
-        RowStart += COLUMN + 1
-    return Ret
+    RowStart = np.arange(max(ROW, 0))[:, None] * (COLUMN + 1)
+    Res1 = (RowStart + np.arange(COLUMN)).ravel()
+    Res2 = Res1 + (COLUMN + 1)
+    Res3 = Res1 + (COLUMN + 1) + 1
+    Res4 = Res1 + 1
+    if FLIP:
+        Ret = np.stack((Res1, Res2, Res3, Res4), axis=1)
+    else:
+        Ret = np.stack((Res4, Res3, Res2, Res1), axis=1)
+    return (Ret + OFFSET).tolist()
 
 
 # Returns a list of faces that makes up a fill pattern for a
@@ -708,7 +734,7 @@ def Create_Pan_Head(HOLE_DIA, HEAD_DIA, SHANK_DIA, HEIGHT, RAD1, RAD2, FACE_OFFS
     Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)  # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)  # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT))
 
@@ -769,7 +795,7 @@ def Create_Dome_Head(HOLE_DIA, HEAD_DIA, SHANK_DIA, HEIGHT, RAD1, RAD2, FACE_OFF
     Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)   # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)   # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT))
 
@@ -806,7 +832,7 @@ def Create_CounterSink_Head(HOLE_DIA, HEAD_DIA, SHANK_DIA, HEAD_ANGLE, RAD1, DIV
     Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)    # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)    # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT))
 
@@ -852,7 +878,7 @@ def Create_Cap_Head(HOLE_DIA, HEAD_DIA, SHANK_DIA, HEIGHT, RAD1, RAD2, DIV_COUNT
         Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)    # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)    # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT))
 
@@ -1412,6 +1438,31 @@ def Thread_Start3(verts, INNER_RADIUS, OUTTER_RADIUS, PITCH, DIV_COUNT,
     return Ret_Row, Height_Offset
 
 
+# Returns the row start heights for Count turns of the thread profile Steps
+# and the height after the last row. np.cumsum subtracts each step in turn
+# just like the Height_Offset -= ... loops.
+def Thread_Row_Heights(Height_Offset, Steps, Count):
+    Count = max(Count, 0)
+    Heights = np.cumsum(np.concatenate(([Height_Offset], np.tile(np.negative(Steps), Count))))
+    return Heights[:-1], float(Heights[-1])
+
+
+# Returns the verts of a helix with one row of DIV_COUNT + 1 verts for each
+# row height and radius, each row dropping one PITCH over a full turn.
+def Thread_Helix_Verts(Row_Heights, Row_Radii, PITCH, DIV_COUNT):
+    Deg_Step = 360.0 / float(DIV_COUNT)
+    Height_Step = float(PITCH) / float(DIV_COUNT)
+
+    i = np.arange(DIV_COUNT + 1)
+    Angles = np.radians(i * Deg_Step)
+    Radii = np.asarray(Row_Radii, dtype=np.float64)[:, None]
+
+    x = np.sin(Angles) * Radii
+    y = np.cos(Angles) * Radii
+    z = np.asarray(Row_Heights, dtype=np.float64)[:, None] - (Height_Step * i)
+    return np.stack((x, y, z), axis=-1).reshape(-1, 3)
+
+
 def Create_Shank_Verts(START_DIA, OUTTER_DIA, LENGTH, Z_LOCATION, DIV_COUNT):
 
     verts = []
@@ -1593,66 +1644,25 @@ def Create_Thread_Start_Verts(INNER_DIA, OUTTER_DIA, PITCH, CREST_PERCENT,
 def Create_Thread_Verts(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
                         CREST_PERCENT, ROOT_PERCENT, Z_LOCATION, DIV_COUNT):
 
-    verts = []
-
     INNER_RADIUS = INNER_DIA / 2
     OUTTER_RADIUS = OUTTER_DIA / 2
 
-    Deg_Step = 360.0 / float(DIV_COUNT)
-    Height_Step = float(PITCH) / float(DIV_COUNT)
-
     NUM_OF_START_THREADS = 2.0      # Was 4 in the very first submission
     NUM_OF_END_THREADS = 3.0
     Num = int((HEIGHT - ((NUM_OF_START_THREADS * PITCH) + (NUM_OF_END_THREADS * PITCH))) / PITCH)
     # This uses less than the requested bolt length by up to 1 pitch, after 5 revolutions
-    Row = 0
 
     Crest_Height = float(PITCH) * float(CREST_PERCENT) / float(100)
     Root_Height = float(PITCH) * float(ROOT_PERCENT) / float(100)
     Root_to_Crest_Height = Crest_to_Root_Height = \
         (float(PITCH) - (Crest_Height + Root_Height)) / 2.0
 
-    Height_Offset = Z_LOCATION
-
-    Lowest_Z_Vert = 0
-
-    for j in range(Num):
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Crest_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Crest_to_Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Root_to_Crest_Height
-        Row += 1
+    Row_Heights, Height_Offset = Thread_Row_Heights(
+        Z_LOCATION, (Crest_Height, Crest_to_Root_Height, Root_Height, Root_to_Crest_Height), Num
+    )
+    Row_Radii = np.tile((OUTTER_RADIUS, OUTTER_RADIUS, INNER_RADIUS, INNER_RADIUS), max(Num, 0))
+    verts = Thread_Helix_Verts(Row_Heights, Row_Radii, PITCH, DIV_COUNT)
+    Row = len(Row_Heights)
 
     return verts, Row, Height_Offset
 
@@ -1781,10 +1791,12 @@ def Create_External_Thread(SHANK_DIA, SHANK_LENGTH, INNER_DIA, OUTTER_DIA,
     if Mini_adder < LENGTH * 0.01:
         Mini_adder = 0  # Catches a very thin shim and also negative situations, worst case error is 1%
 
-    verts.extend(Shank_Verts)
-    verts.extend(Move_Verts_Up_Z(Thread_Start_Verts, -Mini_adder))    # Needs moving down by the mini_adder
-    verts.extend(Move_Verts_Up_Z(Thread_Verts, -Mini_adder))          # so that any missing length is added
-    verts.extend(Move_Verts_Up_Z(Thread_End_Verts, -Mini_adder))      # between the thread and the shank.
+    verts = Stack_Verts(
+        Shank_Verts,
+        Move_Verts_Up_Z(Thread_Start_Verts, -Mini_adder),   # Needs moving down by the mini_adder
+        Move_Verts_Up_Z(Thread_Verts, -Mini_adder),         # so that any missing length is added
+        Move_Verts_Up_Z(Thread_End_Verts, -Mini_adder)      # between the thread and the shank.
+    )
 
     faces.extend(Build_Face_List_Quads(Face_Start, DIV_COUNT, Total_Row - 1, 0))
     faces.extend(Fill_Ring_Face(len(verts) - DIV_COUNT, DIV_COUNT, 1))
@@ -1975,7 +1987,7 @@ def add_Nylon_Head(OUTSIDE_RADIUS, Z_LOCATION, DIV_COUNT):
     Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)        # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)        # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT, 1))
 
@@ -2023,7 +2035,7 @@ def add_Nylon_Part(OUTSIDE_RADIUS, Z_LOCATION, DIV_COUNT):
     Row += 1
 
     sVerts, sFaces = SpinDup(verts, faces, 360, DIV_COUNT, 'z')
-    sVerts.extend(verts)  # add the start verts to the Spin verts to complete the loop
+    sVerts = Stack_Verts(sVerts, verts)  # add the start verts to the Spin verts to complete the loop
 
     faces.extend(Build_Face_List_Quads(FaceStart, Row - 1, DIV_COUNT, 1))
 
@@ -2204,13 +2216,11 @@ def Create_Internal_Thread(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
                            CREST_PERCENT, ROOT_PERCENT, INTERNAL, DIV_COUNT):
     verts = []
     faces = []
+    End_Verts = []
 
     INNER_RADIUS = INNER_DIA / 2
     OUTTER_RADIUS = OUTTER_DIA / 2
 
-    Deg_Step = 360.0 / float(DIV_COUNT)
-    Height_Step = float(PITCH) / float(DIV_COUNT)
-
     # less one pitch for the start and end that is 1/2 pitch high
     Num = int(round((HEIGHT - PITCH) / PITCH))
 
@@ -2231,43 +2241,21 @@ def Create_Internal_Thread(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
     )
     Row += Row_Inc
 
-    for j in range(Num):
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            verts.append([x, y, Height_Offset - (Height_Step * i)])
-        Height_Offset -= Crest_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            verts.append([x, y, Height_Offset - (Height_Step * i)])
-        Height_Offset -= Crest_to_Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            verts.append([x, y, Height_Offset - (Height_Step * i)])
-        Height_Offset -= Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            verts.append([x, y, Height_Offset - (Height_Step * i)])
-        Height_Offset -= Root_to_Crest_Height
-        Row += 1
+    Row_Heights, Height_Offset = Thread_Row_Heights(
+        Height_Offset, (Crest_Height, Crest_to_Root_Height, Root_Height, Root_to_Crest_Height), Num
+    )
+    Row_Radii = np.tile((OUTTER_RADIUS, OUTTER_RADIUS, INNER_RADIUS, INNER_RADIUS), max(Num, 0))
+    Thread_Verts = Thread_Helix_Verts(Row_Heights, Row_Radii, PITCH, DIV_COUNT)
+    Row += len(Row_Heights)
 
     Row_Inc, Height_Offset = Create_Internal_Thread_End_Verts(
-        verts, INNER_RADIUS, OUTTER_RADIUS,
+        End_Verts, INNER_RADIUS, OUTTER_RADIUS,
         PITCH, CREST_PERCENT,
         ROOT_PERCENT, Height_Offset, DIV_COUNT
     )
 
     Row += Row_Inc
+    verts = Stack_Verts(verts, Thread_Verts, End_Verts)
     faces.extend(Build_Face_List_Quads(FaceStart, DIV_COUNT, Row - 1, FLIP=1))
 
     return verts, faces, 0 - Height_Offset
@@ -2293,7 +2281,7 @@ def Nut_Mesh(props, context):
         props.bf_Crest_Percent, props.bf_Root_Percent,
         1, props.bf_Div_Count
     )
-    verts.extend(Thread_Verts)
+    verts = Stack_Verts(verts, Thread_Verts)
     faces.extend(Copy_Faces(Thread_Faces, Face_Start))
 
     Face_Start = len(verts)
@@ -2310,7 +2298,7 @@ def Nut_Mesh(props, context):
             props.bf_Hex_Nut_Flat_Distance,
             props.bf_Major_Dia, New_Nut_Height
         )
-    verts.extend((Head_Verts))
+    verts = Stack_Verts(verts, Head_Verts)
     faces.extend(Copy_Faces(Head_Faces, Face_Start))
 
     LowZ = 0 - New_Nut_Height
@@ -2321,7 +2309,7 @@ def Nut_Mesh(props, context):
             Lock_Nut_Rad, 0 - New_Nut_Height,
             props.bf_Div_Count
         )
-        verts.extend((Nylon_Head_Verts))
+        verts = Stack_Verts(verts, Nylon_Head_Verts)
         faces.extend(Copy_Faces(Nylon_Head_faces, Face_Start))
 
         Face_Start = len(verts)
@@ -2329,7 +2317,7 @@ def Nut_Mesh(props, context):
             Lock_Nut_Rad, 0 - New_Nut_Height,
             props.bf_Div_Count
         )
-        verts.extend((Nylon_Verts))
+        verts = Stack_Verts(verts, Nylon_Verts)
         faces.extend(Copy_Faces(Nylon_faces, Face_Start))
 
     return Move_Verts_Up_Z(verts, 0 - LowZ), faces
@@ -2431,11 +2419,11 @@ def Bolt_Mesh(props, context):
         )
 
     Face_Start = len(verts)
-    verts.extend(Move_Verts_Up_Z(Bit_Verts, Head_Height))
+    verts = Stack_Verts(verts, Move_Verts_Up_Z(Bit_Verts, Head_Height))
     faces.extend(Copy_Faces(Bit_Faces, Face_Start))
 
     Face_Start = len(verts)
-    verts.extend(Move_Verts_Up_Z(Head_Verts, Head_Height))
+    verts = Stack_Verts(verts, Move_Verts_Up_Z(Head_Verts, Head_Height))
     faces.extend(Copy_Faces(Head_Faces, Face_Start))
 
     make_shank = props.bf_Shank_Length
@@ -2460,18 +2448,81 @@ def Bolt_Mesh(props, context):
         props.bf_Root_Percent, props.bf_Div_Count
     )
 
-    verts.extend(Move_Verts_Up_Z(Thread_Verts, 0))
+    verts = Stack_Verts(verts, Thread_Verts)
     faces.extend(Copy_Faces(Thread_Faces, Face_Start))
 
     return Move_Verts_Up_Z(verts, Thread_Height), faces
 
 
 
-def Create_New_Mesh(props, context, adjusted_scale):
+# ####################################################################
+#                    Mesh Cache
+# ####################################################################
+
+# Welded geometry of recently built bolts and nuts, keyed by the parameters
+# that shape them. Least recently used entries are dropped past the limit.
+mesh_cache = OrderedDict()
+mesh_cache_size = 16
+
+# Parameters only the nut reads, and the thread parameters both models read
+Nut_Params = ('bf_Nut_Type', 'bf_Hex_Nut_', 'bf_12_Point_Nut_')
+Thread_Params = ('bf_Major_Dia', 'bf_Minor_Dia', 'bf_Pitch',
+                 'bf_Crest_Percent', 'bf_Root_Percent', 'bf_Div_Count')
+
+
+# Returns a hashable key of the parameters that affect the model type,
+# with floats rounded so that UI round trips give the same key.
+def Mesh_Cache_Key(props, adjusted_scale):
+    key = [props.bf_Model_Type, round(adjusted_scale, 9)]
+    for prop in props.bl_rna.properties:
+        name = prop.identifier
+        if not name.startswith('bf_') or name == 'bf_Model_Type':
+            continue
+        if props.bf_Model_Type == 'bf_Model_Nut':
+            if not (name.startswith(Nut_Params) or name in Thread_Params):
+                continue
+        elif name.startswith(Nut_Params):
+            continue
+        value = getattr(props, name)
+        if isinstance(value, float):
+            value = round(value, 6)
+        key.append((name, value))
+    return tuple(key)
+
+
+def Mesh_Cache_Read(key):
+    entry = mesh_cache.get(key)
+    if entry is not None:
+        mesh_cache.move_to_end(key)
+    return entry
+
+
+def Mesh_Cache_Write(key, entry):
+    mesh_cache[key] = entry
+    mesh_cache.move_to_end(key)
+    while len(mesh_cache) > mesh_cache_size:
+        mesh_cache.popitem(last=False)
+
+
+# Returns True if the mesh still holds the cached geometry
+def Mesh_Matches(mesh, entry):
+    if mesh.is_editmode or len(mesh.vertices) != len(entry["verts"]) or \
+            len(mesh.polygons) != len(entry["face_sizes"]):
+        return False
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return np.array_equal(co, entry["verts"].ravel())
+
+
+# Returns the welded geometry for the props, building it on a cache miss
+def Get_Mesh_Data(props, context, adjusted_scale):
+    key = Mesh_Cache_Key(props, adjusted_scale)
+    entry = Mesh_Cache_Read(key)
+    if entry is not None:
+        return entry
 
     verts = []
     faces = []
-    edges = []
     sObjName = ''
 
     if props.bf_Model_Type == 'bf_Model_Bolt':
@@ -2484,12 +2535,44 @@ def Create_New_Mesh(props, context, adjusted_scale):
         verts, faces = Nut_Mesh(props, context)
         sObjName = 'Nut'
 
-    verts, faces = RemoveDoubles(verts, faces)
+    verts, face_verts, face_sizes = Weld_Verts_Faces(verts, faces)
 
     verts = Scale_Mesh_Verts(verts, adjusted_scale)
 
-    mesh = bpy.data.meshes.new(name=sObjName)
-    mesh.from_pydata(verts, edges, faces)
+    entry = {
+        "name": sObjName,
+        "verts": verts.astype(np.float32),
+        "face_verts": face_verts.astype(np.int32),
+        "face_sizes": face_sizes,
+        "mesh_name": None,      # mesh datablock shared by objects using this entry
+    }
+    Mesh_Cache_Write(key, entry)
+    return entry
+
+
+# Fills an empty mesh with the welded verts and faces using foreach_set,
+# which is much quicker than from_pydata for threads with many rows.
+def Fill_Mesh(mesh, verts, face_verts, face_sizes):
+    loop_start = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_start[1:])
+
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(face_verts))
+    mesh.polygons.add(len(face_sizes))
+
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", face_verts.astype(np.int32))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+
+    mesh.update(calc_edges=True)
+
+
+def Create_New_Mesh(props, context, adjusted_scale):
+
+    entry = Get_Mesh_Data(props, context, adjusted_scale)
+
+    mesh = bpy.data.meshes.new(name=entry["name"])
+    Fill_Mesh(mesh, entry["verts"], entry["face_verts"], entry["face_sizes"])
 
     # useful for development when the mesh may be invalid.
     # Fix T51338 : Validate the mesh (the internal thread generator for the Nut
@@ -2500,3 +2583,21 @@ def Create_New_Mesh(props, context, adjusted_scale):
         props.report({'INFO'}, "Mesh is not Valid, correcting")
 
     return mesh
+
+
+# Returns the mesh datablock last made for the same parameters if it is
+# still unchanged, so identical bolts can share one mesh. Otherwise a new
+# mesh is made and remembered for the next bolt.
+def Get_Shared_Mesh(props, context, adjusted_scale):
+
+    entry = Get_Mesh_Data(props, context, adjusted_scale)
+
+    if entry["mesh_name"] is not None:
+        mesh = bpy.data.meshes.get(entry["mesh_name"])
+        if mesh is not None and Mesh_Matches(mesh, entry):
+            return mesh
+
+    mesh = Create_New_Mesh(props, context, adjusted_scale)
+    entry["mesh_name"] = mesh.name
+
+    return mesh
@@ -18,12 +18,15 @@ bl_info = {
 }
 
 
+import bisect
 import bmesh
 import bpy
 import collections
 import mathutils
 import math
+import numpy as np
 from bpy_extras import view3d_utils
+from bpy.app.handlers import persistent
 from bpy.types import (
         Operator,
         Menu,
@@ -45,7 +48,10 @@ from bpy.props import (
 # ########################################
 
 # used by all tools to improve speed on reruns Unlink
-looptools_cache = {}
+# format: {(tool, object name): entry}, least recently used first
+looptools_cache = collections.OrderedDict()
+looptools_cache_size = 16
+looptools_cache_stats = {"hits": 0, "misses": 0}
 
 
 def get_strokes(self, context):
@@ -69,35 +75,61 @@ def get_strokes(self, context):
 
 # force a full recalculation next time
 def cache_delete(tool):
-    if tool in looptools_cache:
-        del looptools_cache[tool]
+    for key in [key for key in looptools_cache if key[0] == tool]:
+        del looptools_cache[key]
+
+
+# per object counter, bumped whenever the mesh is edited by something other
+# than LoopTools itself
+looptools_changes = {}
+
+
+# bump the change counter of meshes that were edited outside of LoopTools
+@persistent
+def cache_depsgraph_update(scene, depsgraph):
+    operators = bpy.context.window_manager.operators
+    # LoopTools operators (and their redo) change the mesh themselves, that
+    # must not invalidate their own cache
+    if operators and operators[-1].bl_idname.startswith("MESH_OT_looptools"):
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and update.id.type == 'MESH':
+            name = update.id.original.name
+            looptools_changes[name] = looptools_changes.get(name, 0) + 1
+
+
+# cheap fingerprint of the selection and the mesh topology, no per vertex work
+def cache_fingerprint(object, bm):
+    me = object.data
+
+    return(looptools_changes.get(object.name, 0), me.total_vert_sel,
+        me.total_edge_sel, me.total_face_sel, len(bm.verts), len(bm.edges),
+        len(bm.faces))
 
 
 # check cache for stored information
 def cache_read(tool, object, bm, input_method, boundaries):
-    # current tool not cached yet
-    if tool not in looptools_cache:
-        return(False, False, False, False, False)
-    # check if selected object didn't change
-    if object.name != looptools_cache[tool]["object"]:
+    entry = looptools_cache.get((tool, object.name))
+    # current tool not cached yet for this object
+    if entry is None:
+        looptools_cache_stats["misses"] += 1
         return(False, False, False, False, False)
     # check if input didn't change
-    if input_method != looptools_cache[tool]["input_method"]:
-        return(False, False, False, False, False)
-    if boundaries != looptools_cache[tool]["boundaries"]:
-        return(False, False, False, False, False)
     modifiers = [mod.name for mod in object.modifiers if mod.show_viewport and
                  mod.type == 'MIRROR']
-    if modifiers != looptools_cache[tool]["modifiers"]:
-        return(False, False, False, False, False)
-    input = [v.index for v in bm.verts if v.select and not v.hide]
-    if input != looptools_cache[tool]["input"]:
+    if input_method != entry["input_method"] or \
+            boundaries != entry["boundaries"] or \
+            modifiers != entry["modifiers"] or \
+            cache_fingerprint(object, bm) != entry["fingerprint"]:
+        looptools_cache_stats["misses"] += 1
         return(False, False, False, False, False)
+    looptools_cache_stats["hits"] += 1
+    looptools_cache.move_to_end((tool, object.name))
     # reading values
-    single_loops = looptools_cache[tool]["single_loops"]
-    loops = looptools_cache[tool]["loops"]
-    derived = looptools_cache[tool]["derived"]
-    mapping = looptools_cache[tool]["mapping"]
+    single_loops = entry["single_loops"]
+    loops = entry["loops"]
+    derived = entry["derived"]
+    mapping = entry["mapping"]
 
     return(True, single_loops, loops, derived, mapping)
 
@@ -105,24 +137,24 @@ def cache_read(tool, object, bm, input_method, boundaries):
 # store information in the cache
 def cache_write(tool, object, bm, input_method, boundaries, single_loops,
 loops, derived, mapping):
-    # clear cache of current tool
-    if tool in looptools_cache:
-        del looptools_cache[tool]
     # prepare values to be saved to cache
-    input = [v.index for v in bm.verts if v.select and not v.hide]
     modifiers = [mod.name for mod in object.modifiers if mod.show_viewport
     and mod.type == 'MIRROR']
     # update cache
-    looptools_cache[tool] = {
-        "input": input, "object": object.name,
+    looptools_cache[(tool, object.name)] = {
+        "fingerprint": cache_fingerprint(object, bm),
         "input_method": input_method, "boundaries": boundaries,
         "single_loops": single_loops, "loops": loops,
         "derived": derived, "mapping": mapping, "modifiers": modifiers}
+    looptools_cache.move_to_end((tool, object.name))
+    # drop the least recently used entries
+    while len(looptools_cache) > looptools_cache_size:
+        looptools_cache.popitem(last=False)
 
 
 # calculates natural cubic splines through all given knots
 def calculate_cubic_splines(bm_mod, tknots, knots):
-    # hack for circular loops
+    # circular loops are extended by 4 knots on both sides
     if knots[0] == knots[-1] and len(knots) > 1:
         circular = True
         k_new1 = []
@@ -135,10 +167,6 @@ def calculate_cubic_splines(bm_mod, tknots, knots):
             if k + 1 > len(knots) - 1:
                 k -= len(knots)
             k_new2.append(knots[k + 1])
-        for k in k_new1:
-            knots.insert(0, k)
-        for k in k_new2:
-            knots.append(k)
         t_new1 = []
         total1 = 0
         for t in range(-1, -5, -1):
@@ -153,64 +181,81 @@ def calculate_cubic_splines(bm_mod, tknots, knots):
                 t -= len(tknots)
             total2 += tknots[t + 1] - tknots[t]
             t_new2.append(tknots[-1] + total2)
-        for t in t_new1:
-            tknots.insert(0, t)
-        for t in t_new2:
-            tknots.append(t)
+        knots = k_new1[::-1] + knots + k_new2
+        tknots = t_new1[::-1] + tknots + t_new2
     else:
         circular = False
-    # end of hack
 
     n = len(knots)
     if n < 2:
         return False
-    x = tknots[:]
-    locs = [bm_mod.verts[k].co[:] for k in knots]
-    result = []
-    for j in range(3):
-        a = []
-        for i in locs:
-            a.append(i[j])
-        h = []
-        for i in range(n - 1):
-            if x[i + 1] - x[i] == 0:
-                h.append(1e-8)
-            else:
-                h.append(x[i + 1] - x[i])
-        q = [False]
-        for i in range(1, n - 1):
-            q.append(3 / h[i] * (a[i + 1] - a[i]) - 3 / h[i - 1] * (a[i] - a[i - 1]))
-        l = [1.0]
-        u = [0.0]
-        z = [0.0]
-        for i in range(1, n - 1):
-            l.append(2 * (x[i + 1] - x[i - 1]) - h[i - 1] * u[i - 1])
-            if l[i] == 0:
-                l[i] = 1e-8
-            u.append(h[i] / l[i])
-            z.append((q[i] - h[i - 1] * z[i - 1]) / l[i])
-        l.append(1.0)
-        z.append(0.0)
-        b = [False for i in range(n - 1)]
-        c = [False for i in range(n)]
-        d = [False for i in range(n - 1)]
-        c[n - 1] = 0.0
-        for i in range(n - 2, -1, -1):
-            c[i] = z[i] - u[i] * c[i + 1]
-            b[i] = (a[i + 1] - a[i]) / h[i] - h[i] * (c[i + 1] + 2 * c[i]) / 3
-            d[i] = (c[i + 1] - c[i]) / (3 * h[i])
-        for i in range(n - 1):
-            result.append([a[i], b[i], c[i], d[i], x[i]])
-    splines = []
-    for i in range(len(knots) - 1):
-        splines.append([result[i], result[i + n - 1], result[i + (n - 1) * 2]])
-    if circular:  # cleaning up after hack
-        knots = knots[4:-4]
-        tknots = tknots[4:-4]
+    x = np.array(tknots, dtype=np.float64)
+    a = np.array([bm_mod.verts[k].co[:] for k in knots], dtype=np.float64)
+    h = np.diff(x)
+    h[h == 0] = 1e-8
+    # natural spline system, solved for all three axes at once
+    q = np.zeros((n, 3))
+    q[1:-1] = 3 / h[1:, np.newaxis] * (a[2:] - a[1:-1]) - \
+        3 / h[:-1, np.newaxis] * (a[1:-1] - a[:-2])
+    lower = np.zeros(n)
+    diag = np.ones(n)
+    upper = np.zeros(n)
+    lower[1:-1] = h[:-1]
+    diag[1:-1] = 2 * (x[2:] - x[:-2])
+    upper[1:-1] = h[1:]
+    c = solve_tridiagonal(lower, diag, upper, q)
+    b = (a[1:] - a[:-1]) / h[:, np.newaxis] - h[:, np.newaxis] * (c[1:] + 2 * c[:-1]) / 3
+    d = (c[1:] - c[:-1]) / (3 * h[:, np.newaxis])
+    t = np.broadcast_to(x[:-1, np.newaxis], b.shape)
+    # [segment][axis] = [a, b, c, d, x]
+    splines = np.stack((a[:-1], b, c[:-1], d, t), axis=-1).tolist()
+    if circular:  # only keep the splines between the original knots
+        splines = splines[4:-4]
 
     return(splines)
 
 
+# solves a tridiagonal system for one or more right-hand sides (columns
+# of rhs) by cyclic reduction, lower[0] and upper[-1] are not used
+def solve_tridiagonal(lower, diag, upper, rhs):
+    n = len(diag)
+    if n == 1:
+        return rhs / np.where(diag == 0, 1e-8, diag)[:, np.newaxis]
+
+    # odd rows, padded with an identity row on both sides
+    a_odd = np.concatenate(([0.0], lower[1::2], [0.0]))
+    b_odd = np.concatenate(([1.0], diag[1::2], [1.0]))
+    b_odd[b_odd == 0] = 1e-8
+    c_odd = np.concatenate(([0.0], upper[1::2], [0.0]))
+    zero = np.zeros((1, rhs.shape[1]))
+    d_odd = np.concatenate((zero, rhs[1::2], zero))
+
+    # eliminate the odd unknowns from the even rows
+    a_even = lower[0::2].copy()
+    a_even[0] = 0.0
+    c_even = upper[0::2].copy()
+    if n % 2 == 1:
+        c_even[-1] = 0.0
+    half = len(a_even)
+    alpha = -a_even / b_odd[:half]
+    gamma = -c_even / b_odd[1:half + 1]
+    x_even = solve_tridiagonal(
+        alpha * a_odd[:half],
+        diag[0::2] + alpha * c_odd[:half] + gamma * a_odd[1:half + 1],
+        gamma * c_odd[1:half + 1],
+        rhs[0::2] + alpha[:, np.newaxis] * d_odd[:half] +
+        gamma[:, np.newaxis] * d_odd[1:half + 1])
+
+    # back substitute the odd unknowns
+    x_next = np.concatenate((x_even, zero))
+    x = np.empty_like(rhs, dtype=np.float64)
+    x[0::2] = x_even
+    x[1::2] = (rhs[1::2] - lower[1::2, np.newaxis] * x_even[:n // 2] -
+        upper[1::2, np.newaxis] * x_next[1:n // 2 + 1]) / b_odd[1:-1, np.newaxis]
+
+    return(x)
+
+
 # calculates linear splines through all given knots
 def calculate_linear_splines(bm_mod, tknots, knots):
     splines = []
@@ -319,6 +364,15 @@ def calculate_splines(interpolation, bm_mod, tknots, knots):
     return(splines)
 
 
+# index of the spline whose knot interval contains m (tknots is sorted)
+def get_spline_index(tknots, m, spline_count):
+    n = bisect.bisect_left(tknots, m)
+    if n == len(tknots) or tknots[n] != m:
+        n -= 1
+
+    return(min(max(n, 0), spline_count - 1))
+
+
 # check loops and only return valid ones
 def check_loops(loops, mapping, bm_mod):
     valid_loops = []
@@ -417,6 +471,15 @@ def dict_vert_verts(edge_keys):
     return(vert_verts)
 
 
+# input: list, output: dictionary with the index of the first occurrence of each item
+def dict_first_index(items):
+    first_index = {}
+    for i, item in enumerate(items):
+        first_index.setdefault(item, i)
+
+    return(first_index)
+
+
 # return the edgekey ([v1.index, v2.index]) of a bmesh edge
 def edgekey(edge):
     return(tuple(sorted([edge.verts[0].index, edge.verts[1].index])))
@@ -453,43 +516,38 @@ def get_connected_selections(edge_keys):
     # find loops consisting of connected selected edges
     loops = []
     while len(vert_verts) > 0:
-        loop = [iter(vert_verts.keys()).__next__()]
-        growing = True
-        flipped = False
-
-        # extend loop
-        while growing:
-            # no more connection data for current vertex
-            if loop[-1] not in vert_verts:
-                if not flipped:
-                    loop.reverse()
-                    flipped = True
-                else:
-                    growing = False
-            else:
+        start = next(iter(vert_verts))
+        loop = collections.deque([start])
+        in_loop = {start}
+
+        # extend loop at the end, then at the start
+        for append, end in ((loop.append, -1), (loop.appendleft, 0)):
+            while True:
+                current = loop[end]
+                # no more connection data for current vertex
+                if current not in vert_verts:
+                    break
                 extended = False
-                for i, next_vert in enumerate(vert_verts[loop[-1]]):
-                    if next_vert not in loop:
-                        vert_verts[loop[-1]].pop(i)
-                        if len(vert_verts[loop[-1]]) == 0:
-                            del vert_verts[loop[-1]]
+                for i, next_vert in enumerate(vert_verts[current]):
+                    if next_vert not in in_loop:
+                        vert_verts[current].pop(i)
+                        if len(vert_verts[current]) == 0:
+                            del vert_verts[current]
                         # remove connection both ways
                         if next_vert in vert_verts:
                             if len(vert_verts[next_vert]) == 1:
                                 del vert_verts[next_vert]
                             else:
-                                vert_verts[next_vert].remove(loop[-1])
-                        loop.append(next_vert)
+                                vert_verts[next_vert].remove(current)
+                        append(next_vert)
+                        in_loop.add(next_vert)
                         extended = True
                         break
+                # found one end of the loop
                 if not extended:
-                    # found one end of the loop, continue with next
-                    if not flipped:
-                        loop.reverse()
-                        flipped = True
-                    # found both ends of the loop, stop growing
-                    else:
-                        growing = False
+                    break
+        loop.reverse()
+        loop = list(loop)
 
         # check if loop is circular
         if loop[0] in vert_verts:
@@ -2243,10 +2301,12 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
     tpoints = []
     loc_prev = False
     len_total = 0
+    knot_index = dict_first_index(knots)
+    point_index = dict_first_index(points)
 
     for p in points:
-        if p in knots:
-            loc = pknots[knots.index(p)]  # use projected knot location
+        if p in knot_index:
+            loc = pknots[knot_index[p]]  # use projected knot location
         else:
             loc = mathutils.Vector(bm_mod.verts[p].co[:])
         if not loc_prev:
@@ -2256,8 +2316,8 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
         loc_prev = loc
     tknots = []
     for p in points:
-        if p in knots:
-            tknots.append(tpoints[points.index(p)])
+        if p in knot_index:
+            tknots.append(tpoints[point_index[p]])
     if circular:
         tknots[-1] = tpoints[-1]
 
@@ -2267,7 +2327,7 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
         for i in range(1, len(tpoints) - 1):
             tpoints[i] = i * tpoints_average
         for i in range(len(knots)):
-            tknots[i] = tpoints[points.index(knots[i])]
+            tknots[i] = tpoints[point_index[knots[i]]]
         if circular:
             tknots[-1] = tpoints[-1]
 
@@ -2279,22 +2339,14 @@ def curve_calculate_vertices(bm_mod, knots, tknots, points, tpoints, splines,
 interpolation, restriction):
     newlocs = {}
     move = []
+    knots_set = set(knots)
+    point_index = dict_first_index(points)
 
     for p in points:
-        if p in knots:
+        if p in knots_set:
             continue
-        m = tpoints[points.index(p)]
-        if m in tknots:
-            n = tknots.index(m)
-        else:
-            t = tknots[:]
-            t.append(m)
-            t.sort()
-            n = t.index(m) - 1
-        if n > len(splines) - 1:
-            n = len(splines) - 1
-        elif n < 0:
-            n = 0
+        m = tpoints[point_index[p]]
+        n = get_spline_index(tknots, m, len(splines))
 
         if interpolation == 'cubic':
             ax, bx, cx, dx, tx = splines[n][0]
@@ -2852,20 +2904,16 @@ def gstretch_eval_stroke(stroke, distance, stroke_lengths_cache=False):
         total_length = max(lengths[-1], 1e-7)
         stroke_lengths_cache = [length / total_length for length in
             lengths]
-    stroke_lengths = stroke_lengths_cache[:]
+    stroke_lengths = stroke_lengths_cache
+    stroke_index = bisect.bisect_left(stroke_lengths, distance)
 
-    if distance in stroke_lengths:
-        loc = stroke.points[stroke_lengths.index(distance)].co
+    if stroke_index < len(stroke_lengths) and stroke_lengths[stroke_index] == distance:
+        loc = stroke.points[stroke_index].co
     elif distance > stroke_lengths[-1]:
         # should be impossible, but better safe than sorry
         loc = stroke.points[-1].co
     else:
-        stroke_lengths.append(distance)
-        stroke_lengths.sort()
-        stroke_index = stroke_lengths.index(distance)
-        interval_length = stroke_lengths[
-                stroke_index + 1] - stroke_lengths[stroke_index - 1
-                ]
+        interval_length = stroke_lengths[stroke_index] - stroke_lengths[stroke_index - 1]
         distance_relative = (distance - stroke_lengths[stroke_index - 1]) / interval_length
         interval_vector = stroke.points[stroke_index].co - stroke.points[stroke_index - 1].co
         loc = stroke.points[stroke_index - 1].co + distance_relative * interval_vector
@@ -3140,19 +3188,10 @@ points, splines):
     change = []
     move = []
     for i in range(len(knots)):
+        point_index = dict_first_index(points[i])
         for p in points[i]:
-            m = tpoints[i][points[i].index(p)]
-            if m in tknots[i]:
-                n = tknots[i].index(m)
-            else:
-                t = tknots[i][:]
-                t.append(m)
-                t.sort()
-                n = t.index(m) - 1
-            if n > len(splines[i]) - 1:
-                n = len(splines[i]) - 1
-            elif n < 0:
-                n = 0
+            m = tpoints[i][point_index[p]]
+            n = get_spline_index(tknots[i], m, len(splines[i]))
 
             if interpolation == 'cubic':
                 ax, bx, cx, dx, tx = splines[i][n][0]
@@ -3200,19 +3239,10 @@ def space_calculate_t(bm_mod, knots):
 def space_calculate_verts(bm_mod, interpolation, tknots, tpoints, points,
 splines):
     move = []
+    point_index = dict_first_index(points)
     for p in points:
-        m = tpoints[points.index(p)]
-        if m in tknots:
-            n = tknots.index(m)
-        else:
-            t = tknots[:]
-            t.append(m)
-            t.sort()
-            n = t.index(m) - 1
-        if n > len(splines) - 1:
-            n = len(splines) - 1
-        elif n < 0:
-            n = 0
+        m = tpoints[point_index[p]]
+        n = get_spline_index(tknots, m, len(splines))
 
         if interpolation == 'cubic':
             ax, bx, cx, dx, tx = splines[n][0]
@@ -4057,8 +4087,9 @@ class GStretch(Operator):
 
     def invoke(self, context, event):
         # flush cached strokes
-        if 'Gstretch' in looptools_cache:
-            looptools_cache['Gstretch']['single_loops'] = []
+        for key, entry in looptools_cache.items():
+            if key[0] == 'Gstretch':
+                entry['single_loops'] = []
         # load custom settings
         settings_load(self)
         return self.execute(context)
@@ -5225,11 +5256,15 @@ def register():
         bpy.utils.register_class(cls)
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.prepend(menu_func)
     bpy.types.WindowManager.looptools = PointerProperty(type=LoopToolsProps)
+    bpy.app.handlers.depsgraph_update_post.append(cache_depsgraph_update)
     update_panel(None, bpy.context)
 
 
 # unregistering and removing menus
 def unregister():
+    if cache_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(cache_depsgraph_update)
+    looptools_changes.clear()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.remove(menu_func)
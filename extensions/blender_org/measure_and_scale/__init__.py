@@ -38,6 +38,7 @@ from bpy.props import (
 )
 import bpy_extras.view3d_utils
 from gpu_extras.batch import batch_for_shader
+import numpy as np
 
 # Constants
 MAX_SNAP_DISTANCE_SCREEN = 25.0
@@ -141,7 +142,97 @@ def ray_cast(context, position):
         context.scene.ray_cast(depsgraph, view_point, view_vector)
     return result, location, normal, index, object_hit, matrix, view_point
 
-def find_nearest_vertex_world(context, event, obj):
+class VertexSnapCache:
+    """World space vertex positions of a mesh, projected to the region and
+    bucketed in a screen space grid so snapping doesn't loop over every vertex"""
+
+    def __init__(self, obj):
+        mesh = obj.data
+        count = len(mesh.vertices) if mesh else 0
+        co = np.empty(count * 3, dtype=np.float32)
+        if count:
+            mesh.vertices.foreach_get("co", co)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        self.world_co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        self.matrix_world = obj.matrix_world.copy()
+        self.vert_count = count
+        self.view_key = None
+        self.screen_co = None
+        self.grid_keys = None
+        self.grid_order = None
+        self.grid_columns = 0
+
+    def matches(self, obj):
+        """Check the cache still describes the object"""
+        return (obj.data is not None and len(obj.data.vertices) == self.vert_count and
+                obj.matrix_world == self.matrix_world)
+
+    def update_view(self, region, rv3d):
+        """Project all vertices like location_3d_to_region_2d, only when the view changed"""
+        view_key = (region.width, region.height, tuple(map(tuple, rv3d.perspective_matrix)))
+        if view_key == self.view_key:
+            return
+        self.view_key = view_key
+
+        persp = np.array(rv3d.perspective_matrix, dtype=np.float64)
+        prj = self.world_co @ persp[:, :3].T + persp[:, 3]
+        in_front = prj[:, 3] > 0.0
+        w = np.where(in_front, prj[:, 3], 1.0)
+        width_half = region.width / 2.0
+        height_half = region.height / 2.0
+        screen_co = np.empty((len(prj), 2))
+        screen_co[:, 0] = width_half + width_half * (prj[:, 0] / w)
+        screen_co[:, 1] = height_half + height_half * (prj[:, 1] / w)
+        self.screen_co = screen_co
+
+        # Grid cells as large as the snap distance, so a query only has to look
+        # at the 3x3 cells around the mouse. Vertices further than one cell
+        # outside the region can never be within reach of the mouse.
+        cell = MAX_SNAP_DISTANCE_SCREEN
+        columns = int(region.width // cell) + 3
+        rows = int(region.height // cell) + 3
+        with np.errstate(invalid='ignore'):
+            cx = np.floor(screen_co[:, 0] / cell) + 1
+            cy = np.floor(screen_co[:, 1] / cell) + 1
+            usable = in_front & (cx >= 0) & (cx < columns) & (cy >= 0) & (cy < rows)
+        indices = np.flatnonzero(usable)
+        keys = cy[indices].astype(np.int64) * columns + cx[indices].astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        self.grid_keys = keys[order]
+        self.grid_order = indices[order]
+        self.grid_columns = columns
+
+    def nearest(self, mouse_pos, ray_hit_loc=None):
+        """Return the index of the vertex nearest to mouse_pos in screen space
+        within MAX_SNAP_DISTANCE_SCREEN, or None.
+        With ray_hit_loc only vertices close to the hit location are considered."""
+        cell = MAX_SNAP_DISTANCE_SCREEN
+        cx = int(np.floor(mouse_pos[0] / cell)) + 1
+        cy = int(np.floor(mouse_pos[1] / cell)) + 1
+        candidates = []
+        for row in range(cy - 1, cy + 2):
+            first = row * self.grid_columns + cx - 1
+            start, end = np.searchsorted(self.grid_keys, (first, first + 3))
+            candidates.append(self.grid_order[start:end])
+        # sorted so ties go to the lowest index, like the old vertex loop
+        candidates = np.sort(np.concatenate(candidates))
+        if not len(candidates):
+            return None
+
+        if ray_hit_loc is not None:
+            offset = self.world_co[candidates] - np.array(ray_hit_loc)
+            candidates = candidates[np.einsum('ij,ij->i', offset, offset) <= MAX_3D_SNAP_VALIDATION_DIST_SQ]
+            if not len(candidates):
+                return None
+
+        delta = self.screen_co[candidates] - np.array(mouse_pos)
+        dist_sq = np.einsum('ij,ij->i', delta, delta)
+        best = int(np.argmin(dist_sq))
+        if dist_sq[best] >= MAX_SNAP_DISTANCE_SCREEN**2:
+            return None
+        return int(candidates[best])
+
+def find_nearest_vertex_world(context, event, obj, snap_cache=None):
     """Find nearest visible vertex on the base mesh using improved snapping logic"""
     mouse_pos = Vector((event.mouse_region_x, event.mouse_region_y))
     region = context.region
@@ -151,35 +242,21 @@ def find_nearest_vertex_world(context, event, obj):
 
     ray_result, ray_hit_loc, _, _, hit_obj, _, _ = ray_cast(context, mouse_pos)
 
-    min_dist_sq_screen = MAX_SNAP_DISTANCE_SCREEN**2
-    nearest_vert_co = None
-
     mesh = obj.data
     if not mesh or not mesh.vertices:
         return None
 
-    world_matrix = obj.matrix_world
-    verts = mesh.vertices
-
-    for v in verts:
-        world_co = world_matrix @ v.co
+    if snap_cache is None:
+        snap_cache = VertexSnapCache(obj)
+    snap_cache.update_view(region, rv3d)
 
-        if ray_result and hit_obj == obj:
-            if (world_co - ray_hit_loc).length_squared > MAX_3D_SNAP_VALIDATION_DIST_SQ:
-                continue
-
-        try:
-            screen_co = bpy_extras.view3d_utils.location_3d_to_region_2d(region, rv3d, world_co)
-        except (TypeError, ReferenceError):
-            screen_co = None
-
-        if screen_co:
-            dist_sq = (screen_co - mouse_pos).length_squared
-            if dist_sq < min_dist_sq_screen:
-                min_dist_sq_screen = dist_sq
-                nearest_vert_co = world_co
+    if not (ray_result and hit_obj == obj):
+        ray_hit_loc = None
+    index = snap_cache.nearest(mouse_pos, ray_hit_loc)
+    if index is None:
+        return None
 
-    return nearest_vert_co
+    return Vector(snap_cache.world_co[index])
 
 # Drawing Callback
 def draw_callback_px(op, context):
@@ -325,6 +402,7 @@ class OBJECT_OT_ScaleToDimensionInteractive(Operator):
     _shader = None
     _current_mouse_pos = None
     _hover_vertex_co = None
+    _snap_cache = None
     _original_wireframe_state = None
     _wireframe_changed_by_op = False
 
@@ -364,6 +442,7 @@ class OBJECT_OT_ScaleToDimensionInteractive(Operator):
         self.status_message = "Click first vertex (ESC to cancel)"
         self._current_mouse_pos = None
         self._hover_vertex_co = None
+        self._snap_cache = VertexSnapCache(active_obj)
         self._wireframe_changed_by_op = False
         OBJECT_OT_ScaleToDimensionInteractive._dialog_completed_successfully = False
 
@@ -421,18 +500,21 @@ class OBJECT_OT_ScaleToDimensionInteractive(Operator):
             self.report({'WARNING'}, "Object is no longer a mesh.")
             return self._cancel_and_cleanup(context)
 
+        if self._snap_cache is None or not self._snap_cache.matches(obj):
+            self._snap_cache = VertexSnapCache(obj)
+
         # Event Handling
         if event.type == 'MOUSEMOVE':
             if not self.has_end_vertex:
                 self._current_mouse_pos = (event.mouse_region_x, event.mouse_region_y)
-                self._hover_vertex_co = find_nearest_vertex_world(context, event, obj)
+                self._hover_vertex_co = find_nearest_vertex_world(context, event, obj, self._snap_cache)
             else:
                 self._current_mouse_pos = None
                 self._hover_vertex_co = None
 
         elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
             if not self.has_end_vertex:
-                click_co = find_nearest_vertex_world(context, event, obj)
+                click_co = find_nearest_vertex_world(context, event, obj, self._snap_cache)
                 if click_co:
                     if not self.has_start_vertex:
                         self.start_vertex_co = click_co
@@ -508,6 +590,7 @@ class OBJECT_OT_ScaleToDimensionInteractive(Operator):
         self._shader = None
         self._current_mouse_pos = None
         self._hover_vertex_co = None
+        self._snap_cache = None
 
         if context and context.area:
             context.area.tag_redraw()
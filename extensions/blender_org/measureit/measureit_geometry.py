@@ -18,6 +18,7 @@ from bmesh import from_edit_mesh
 from bpy_extras import view3d_utils, mesh_utils
 import bpy_extras.object_utils as object_utils
 from sys import exc_info
+import numpy as np
 # GPU
 import gpu
 from gpu_extras.batch import batch_for_shader
@@ -25,6 +26,8 @@ from gpu_extras.batch import batch_for_shader
 
 shader = gpu.shader.from_builtin('UNIFORM_COLOR') if not bpy.app.background else None
 shader_line = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR') if not bpy.app.background else None
+shader_flat = gpu.shader.from_builtin('FLAT_COLOR') if not bpy.app.background else None
+shader_line_flat = gpu.shader.from_builtin('POLYLINE_FLAT_COLOR') if not bpy.app.background else None
 
 imm_line_width = 1.0
 imm_viewport = (0, 0)
@@ -41,20 +44,9 @@ def imm_set_line_width(width):
 #
 # -------------------------------------------------------------
 # noinspection PyUnresolvedReferences,PyUnboundLocalVariable
-def draw_segments(context, myobj, op, region, rv3d):
+def draw_segments(context, myobj, op, region, rv3d, overlay=None):
     if op.measureit_num > 0:
-        a_code = "\u00b0"  # degree
-        scale = bpy.context.scene.unit_settings.scale_length
         scene = bpy.context.scene
-        pr = scene.measureit_gl_precision
-        fmt = "%1." + str(pr) + "f"
-        ovr = scene.measureit_ovr
-        ovrcolor = scene.measureit_ovr_color
-        ovrfsize = scene.measureit_ovr_font
-        ovrfang = get_angle_in_rad(scene.measureit_ovr_font_rotation)
-        ovrfaln = scene.measureit_ovr_font_align
-        ovrline = scene.measureit_ovr_width
-        units = scene.measureit_units
         fang = get_angle_in_rad(scene.measureit_font_rotation)
 
         # --------------------
@@ -70,6 +62,160 @@ def draw_segments(context, myobj, op, region, rv3d):
                       tx_scale, scene.measureit_scale_color, scene.measureit_scale_font,
                       text_rot=fang)
 
+        if overlay is None:
+            overlay = get_overlay(myobj, op)
+        draw_overlay(myobj, overlay, region, rv3d)
+
+    return
+
+
+# -------------------------------------------------------------
+# Retained overlay of one object
+#
+# Keeps the 3D geometry of all measures (lines, arrows, triangles
+# and text anchors). Only the projection to screen space is done
+# on each redraw.
+# -------------------------------------------------------------
+class MeasureOverlay:
+    def __init__(self, myobj):
+        self.name = myobj.name
+        self.mesh = myobj.data.name if myobj.data is not None else None
+        self.points = []
+        self.lines = []
+        self.arrows = []
+        self.tris = []
+        self.texts = []
+        self.links = set()
+        self.group_sums = {}
+
+    def add_point(self, v1):
+        self.points.append((v1[0], v1[1], v1[2]))
+        return len(self.points) - 1
+
+    def line(self, v1, v2, rgba, width):
+        self.lines.append((self.add_point(v1), self.add_point(v2), tuple(rgba), width))
+
+    def arrow(self, v1, v2, rgba, width, size=20, a_typ="1", b_typ="1"):
+        self.arrows.append((self.add_point(v1), self.add_point(v2), tuple(rgba), width, size, a_typ, b_typ))
+
+    def triangle(self, v1, v2, v3, rgba):
+        self.tris.append((self.add_point(v1), self.add_point(v2), self.add_point(v3), tuple(rgba)))
+
+    def text(self, v1, offset, display_text, rgba, fsize, align='L', text_rot=0.0):
+        # Calculate sum groups
+        m = 0
+        while "<#" in display_text:
+            m += 1
+            if m > 10:   # limit loop
+                break
+            i = display_text.index("<#")
+            tag = display_text[i:i + 4]
+            display_text = display_text.replace(tag, self.group_sums.get(tag.upper()[2:3], " "))
+
+        self.texts.append((self.add_point(v1), offset, display_text, tuple(rgba), fsize, align, text_rot))
+
+
+# -------------------------------------------------------------
+# Overlay cache
+#
+# Format: {Object.as_pointer(): (signature, MeasureOverlay)}
+# Entries are dropped by the depsgraph handler when the object, its
+# mesh or a linked object is updated, by the frame change handler
+# when one of them is animated, and rebuilt when the signature
+# (mode, number of measures, transforms, scene settings) does not
+# match anymore.
+# -------------------------------------------------------------
+overlay_cache = {}
+
+
+def get_overlay_signature(myobj, op, links=()):
+    scene = bpy.context.scene
+    settings = (scene.measureit_gl_precision, scene.measureit_units, scene.measureit_hide_units,
+                scene.measureit_ovr, tuple(scene.measureit_ovr_color), scene.measureit_ovr_font,
+                scene.measureit_ovr_font_rotation, scene.measureit_ovr_font_align, scene.measureit_ovr_width,
+                scene.measureit_font_rotation, scene.measureit_scale, scene.measureit_scale_factor,
+                scene.measureit_gl_show_d, scene.measureit_gl_show_n,
+                scene.unit_settings.scale_length, scene.unit_settings.system,
+                scene.unit_settings.system_rotation)
+    matrices = [tuple(map(tuple, myobj.matrix_world))]
+    for name in sorted(links):
+        linkobj = bpy.data.objects.get(name)
+        matrices.append(tuple(map(tuple, linkobj.matrix_world)) if linkobj is not None else None)
+
+    return myobj.mode, op.measureit_num, tuple(matrices), settings
+
+
+def get_overlay(myobj, op):
+    key = myobj.as_pointer()
+    entry = overlay_cache.get(key)
+    if entry is not None:
+        signature, overlay = entry
+        if signature == get_overlay_signature(myobj, op, overlay.links):
+            return overlay
+
+    overlay = build_overlay(myobj, op)
+    overlay_cache[key] = (get_overlay_signature(myobj, op, overlay.links), overlay)
+    return overlay
+
+
+def invalidate_overlay_cache(depsgraph=None):
+    if depsgraph is None:
+        overlay_cache.clear()
+        return
+
+    names = set()
+    for update in depsgraph.updates:
+        names.add(update.id.original.name)
+
+    if not names:
+        return
+
+    for key in list(overlay_cache):
+        signature, overlay = overlay_cache[key]
+        if overlay.name in names or overlay.mesh in names or not names.isdisjoint(overlay.links):
+            del overlay_cache[key]
+
+
+def invalidate_animated_overlays(scene):
+    # animated measure properties (color, text, spacing...) don't show
+    # up in the signature, drop the overlays that may have changed
+    if scene.animation_data is not None:
+        overlay_cache.clear()
+        return
+
+    for key in list(overlay_cache):
+        signature, overlay = overlay_cache[key]
+        for name in (overlay.name, *overlay.links):
+            myobj = bpy.data.objects.get(name)
+            if myobj is not None and myobj.animation_data is not None:
+                del overlay_cache[key]
+                break
+
+
+# -------------------------------------------------------------
+# Build the 3D geometry of all measures of one object
+#
+# -------------------------------------------------------------
+# noinspection PyUnresolvedReferences,PyUnboundLocalVariable
+def build_overlay(myobj, op):
+    overlay = MeasureOverlay(myobj)
+    if op.measureit_num > 0:
+        a_code = "\u00b0"  # degree
+        scale = bpy.context.scene.unit_settings.scale_length
+        scene = bpy.context.scene
+        pr = scene.measureit_gl_precision
+        fmt = "%1." + str(pr) + "f"
+        ovr = scene.measureit_ovr
+        ovrcolor = scene.measureit_ovr_color
+        ovrfsize = scene.measureit_ovr_font
+        ovrfang = get_angle_in_rad(scene.measureit_ovr_font_rotation)
+        ovrfaln = scene.measureit_ovr_font_align
+        ovrline = scene.measureit_ovr_width
+        units = scene.measureit_units
+        fang = get_angle_in_rad(scene.measureit_font_rotation)
+        obverts = get_mesh_vertices(myobj)
+        overlay.group_sums = get_group_sums(myobj)
+
         # --------------------
         # Loop
         # --------------------
@@ -102,8 +248,6 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Segment or Label
                     # ----------------------
                     if ms.gltype == 1 or ms.gltype == 2:
-                        obverts = get_mesh_vertices(myobj)
-
                         if ms.glpointa <= len(obverts) and ms.glpointb <= len(obverts):
                             a_p1 = get_point(obverts[ms.glpointa].co, myobj)
                             b_p1 = get_point(obverts[ms.glpointb].co, myobj)
@@ -112,7 +256,6 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Segment or Label
                     # ----------------------
                     if ms.gltype == 12 or ms.gltype == 13 or ms.gltype == 14:
-                        obverts = get_mesh_vertices(myobj)
                         if ms.glpointa <= len(obverts):
                             a_p1 = get_point(obverts[ms.glpointa].co, myobj)
                             if ms.gltype == 12:  # X
@@ -131,7 +274,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Vertex to Vertex (link)
                     # ----------------------
                     if ms.gltype == 3:
-                        obverts = get_mesh_vertices(myobj)
+                        overlay.links.add(ms.gllink)
                         linkverts = bpy.data.objects[ms.gllink].data.vertices
                         a_p1 = get_point(obverts[ms.glpointa].co, myobj)
                         b_p1 = get_point(linkverts[ms.glpointb].co, bpy.data.objects[ms.gllink])
@@ -139,13 +282,14 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Vertex to Object (link)
                     # ----------------------
                     if ms.gltype == 4:
-                        obverts = get_mesh_vertices(myobj)
+                        overlay.links.add(ms.gllink)
                         a_p1 = get_point(obverts[ms.glpointa].co, myobj)
                         b_p1 = get_location(bpy.data.objects[ms.gllink])
                     # ----------------------
                     # Object to Vertex (link)
                     # ----------------------
                     if ms.gltype == 5:
+                        overlay.links.add(ms.gllink)
                         linkverts = bpy.data.objects[ms.gllink].data.vertices
                         a_p1 = get_location(myobj)
                         b_p1 = get_point(linkverts[ms.glpointb].co, bpy.data.objects[ms.gllink])
@@ -153,13 +297,13 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Object to Object (link)
                     # ----------------------
                     if ms.gltype == 8:
+                        overlay.links.add(ms.gllink)
                         a_p1 = get_location(myobj)
                         b_p1 = get_location(bpy.data.objects[ms.gllink])
                     # ----------------------
                     # Vertex to origin
                     # ----------------------
                     if ms.gltype == 6:
-                        obverts = get_mesh_vertices(myobj)
                         a_p1 = (0, 0, 0)
                         b_p1 = get_point(obverts[ms.glpointa].co, myobj)
                     # ----------------------
@@ -172,7 +316,6 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Angle
                     # ----------------------
                     if ms.gltype == 9:
-                        obverts = get_mesh_vertices(myobj)
                         if ms.glpointa <= len(obverts) and ms.glpointb <= len(obverts) and ms.glpointc <= len(obverts):
                             an_p1 = get_point(obverts[ms.glpointa].co, myobj)
                             an_p2 = get_point(obverts[ms.glpointb].co, myobj)
@@ -196,7 +339,6 @@ def draw_segments(context, myobj, op, region, rv3d):
                     # Arc
                     # ----------------------
                     if ms.gltype == 11:
-                        obverts = get_mesh_vertices(myobj)
                         if ms.glpointa <= len(obverts) and ms.glpointb <= len(obverts) and ms.glpointc <= len(obverts):
                             an_p1 = get_point(obverts[ms.glpointa].co, myobj)
                             an_p2 = get_point(obverts[ms.glpointb].co, myobj)
@@ -306,25 +448,12 @@ def draw_segments(context, myobj, op, region, rv3d):
                                 v22[2] = v11[2]
 
                     # ------------------------------------
-                    # converting to screen coordinates
-                    # ------------------------------------
-                    screen_point_ap1 = get_2d_point(region, rv3d, a_p1)
-                    screen_point_bp1 = get_2d_point(region, rv3d, b_p1)
-
-                    screen_point_v1 = get_2d_point(region, rv3d, v1)
-                    screen_point_v2 = get_2d_point(region, rv3d, v2)
-                    screen_point_v11 = get_2d_point(region, rv3d, v11)
-                    screen_point_v22 = get_2d_point(region, rv3d, v22)
-                    screen_point_v11a = get_2d_point(region, rv3d, v11a)
-                    screen_point_v11b = get_2d_point(region, rv3d, v11b)
-
-                    # ------------------------------------
-                    # colour + line setup
+                    # line setup
                     # ------------------------------------
                     if ovr is False:
-                        imm_set_line_width(ms.glwidth)
+                        width = ms.glwidth
                     else:
-                        imm_set_line_width(ovrline)
+                        width = ovrline
 
                     # ------------------------------------
                     # Text (distance)
@@ -335,10 +464,6 @@ def draw_segments(context, myobj, op, region, rv3d):
                         try:
                             midpoint3d = interpolate3d(v1, v2, fabs(dist / 2))
                             gap3d = (midpoint3d[0], midpoint3d[1], midpoint3d[2] + s / 2)
-                            tmp_point = get_2d_point(region, rv3d, gap3d)
-                            if tmp_point is None:
-                                pass
-                            txtpoint2d = tmp_point[0] + ms.glfontx, tmp_point[1] + ms.glfonty
                             # Scale
                             if scene.measureit_scale is True:
                                 dist = dist * scene.measureit_scale_factor
@@ -364,13 +489,12 @@ def draw_segments(context, myobj, op, region, rv3d):
                             if scene.measureit_gl_show_n is True and ms.glnames is True:
                                 msg += ms.gltxt
                             if scene.measureit_gl_show_d is True or scene.measureit_gl_show_n is True:
-                                draw_text(myobj, txtpoint2d, msg, rgba, fsize, faln, fang)
+                                overlay.text(gap3d, (ms.glfontx, ms.glfonty), msg, rgba, fsize, faln, fang)
 
                             # ------------------------------
                             # if axis loc, show a indicator
                             # ------------------------------
                             if locflag is True and ms.glocwarning is True:
-                                txtpoint2d = get_2d_point(region, rv3d, (v2[0], v2[1], v2[2]))
                                 txt = "["
                                 if ms.glocx is True:
                                     txt += "X"
@@ -379,7 +503,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                                 if ms.glocz is True:
                                     txt += "Z"
                                 txt += "]"
-                                draw_text(myobj, txtpoint2d, txt, rgba, fsize - 1, text_rot=fang)
+                                overlay.text(v2, (0, 0), txt, rgba, fsize - 1, text_rot=fang)
 
                         except:
                             pass
@@ -440,10 +564,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                                     via = vna * ms.glspace
 
                                     gap3d = (b_p1[0] + via[0], b_p1[1] + via[1], b_p1[2] + via[2])
-                                    tmp_point = get_2d_point(region, rv3d, gap3d)
-                                    if tmp_point is not None:
-                                        txtpoint2d = tmp_point[0] + ms.glfontx, tmp_point[1] + ms.glfonty
-                                        draw_text(myobj, txtpoint2d, msg, rgba, fsize, faln, fang)
+                                    overlay.text(gap3d, (ms.glfontx, ms.glfonty), msg, rgba, fsize, faln, fang)
                                 # Radius
                                 if scene.measureit_gl_show_d is True and ms.gldist is True and \
                                         ms.glarc_rad is True:
@@ -456,10 +577,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                             else:
                                 gap3d = (a_p1[0], a_p1[1], a_p1[2])
 
-                            tmp_point = get_2d_point(region, rv3d, gap3d)
-                            if tmp_point is not None:
-                                txtpoint2d = tmp_point[0] + ms.glfontx, tmp_point[1] + ms.glfonty
-                                draw_text(myobj, txtpoint2d, tx_dist, rgba, fsize, faln, fang)
+                            overlay.text(gap3d, (ms.glfontx, ms.glfonty), tx_dist, rgba, fsize, faln, fang)
                         except:
                             pass
                     # ------------------------------------
@@ -470,33 +588,28 @@ def draw_segments(context, myobj, op, region, rv3d):
                         # noinspection PyBroadException
                         tx_dist = ms.gltxt
                         gap3d = (vn1[0], vn1[1], vn1[2])
-                        tmp_point = get_2d_point(region, rv3d, gap3d)
-                        if tmp_point is not None:
-                            txtpoint2d = tmp_point[0] + ms.glfontx, tmp_point[1] + ms.glfonty
-                            draw_text(myobj, txtpoint2d, tx_dist, rgba, fsize, faln, fang)
+                        overlay.text(gap3d, (ms.glfontx, ms.glfonty), tx_dist, rgba, fsize, faln, fang)
 
                     # ------------------------------------
-                    # Draw lines
+                    # Lines
                     # ------------------------------------
-                    gpu.state.blend_set('ALPHA')
-
                     if ms.gltype == 1:  # Segment
-                        draw_line(screen_point_ap1, screen_point_v11, rgba)
-                        draw_line(screen_point_bp1, screen_point_v22, rgba)
-                        draw_arrow(screen_point_v1, screen_point_v2, rgba, a_size, a_type, b_type)
+                        overlay.line(a_p1, v11, rgba, width)
+                        overlay.line(b_p1, v22, rgba, width)
+                        overlay.arrow(v1, v2, rgba, width, a_size, a_type, b_type)
 
                     if ms.gltype == 12 or ms.gltype == 13 or ms.gltype == 14:  # Segment to origin
-                        draw_line(screen_point_ap1, screen_point_v11, rgba)
-                        draw_line(screen_point_bp1, screen_point_v22, rgba)
-                        draw_arrow(screen_point_v1, screen_point_v2, rgba, a_size, a_type, b_type)
+                        overlay.line(a_p1, v11, rgba, width)
+                        overlay.line(b_p1, v22, rgba, width)
+                        overlay.arrow(v1, v2, rgba, width, a_size, a_type, b_type)
 
                     if ms.gltype == 2:  # Label
-                        draw_line(screen_point_v11a, screen_point_v11b, rgba)
-                        draw_arrow(screen_point_ap1, screen_point_v11, rgba, a_size, a_type, b_type)
+                        overlay.line(v11a, v11b, rgba, width)
+                        overlay.arrow(a_p1, v11, rgba, width, a_size, a_type, b_type)
 
                     if ms.gltype == 3 or ms.gltype == 4 or ms.gltype == 5 or ms.gltype == 8 \
                             or ms.gltype == 6 or ms.gltype == 7:  # Origin and Links
-                        draw_arrow(screen_point_ap1, screen_point_bp1, rgba, a_size, a_type, b_type)
+                        overlay.arrow(a_p1, b_p1, rgba, width, a_size, a_type, b_type)
 
                     if ms.gltype == 9:  # Angle
                         dist, distloc = distance(an_p1, an_p2)
@@ -505,20 +618,16 @@ def draw_segments(context, myobj, op, region, rv3d):
                         dist, distloc = distance(an_p3, an_p2)
                         mp2 = interpolate3d(an_p3, an_p2, fabs(dist / 1.1))
 
-                        screen_point_an_p1 = get_2d_point(region, rv3d, mp1)
-                        screen_point_an_p2 = get_2d_point(region, rv3d, an_p2)
-                        screen_point_an_p3 = get_2d_point(region, rv3d, mp2)
-
-                        draw_line(screen_point_an_p1, screen_point_an_p2, rgba)
-                        draw_line(screen_point_an_p2, screen_point_an_p3, rgba)
-                        draw_line(screen_point_an_p1, screen_point_an_p3, rgba)
+                        overlay.line(mp1, an_p2, rgba, width)
+                        overlay.line(an_p2, mp2, rgba, width)
+                        overlay.line(mp1, mp2, rgba, width)
 
                     if ms.gltype == 11:  # arc
                         # draw line from center of arc second point
                         c = Vector(a_p1)
                         if ms.glarc_rad is True:
                             if ms.glarc_extrad is False:
-                                draw_arrow(screen_point_ap1, screen_point_bp1, rgba, a_size, a_type, b_type)
+                                overlay.arrow(a_p1, b_p1, rgba, width, a_size, a_type, b_type)
                             else:
                                 vne = Vector((b_p1[0] - a_p1[0],
                                               b_p1[1] - a_p1[1],
@@ -526,8 +635,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                                 vne.normalize()
                                 vie = vne * ms.glspace
                                 pe = (b_p1[0] + vie[0], b_p1[1] + vie[1], b_p1[2] + vie[2])
-                                screen_point_pe = get_2d_point(region, rv3d, pe)
-                                draw_arrow(screen_point_ap1, screen_point_pe, rgba, a_size, a_type, b_type)
+                                overlay.arrow(a_p1, pe, rgba, width, a_size, a_type, b_type)
 
                         # create arc around the centerpoint
                         # rotation matrix around normal vector at center point
@@ -570,15 +678,12 @@ def draw_segments(context, myobj, op, region, rv3d):
                             vi = vn * ms.glspace
 
                             p2_ = (p2[0] + vi[0], p2[1] + vi[1], p2[2] + vi[2])
-                            # convert to screen coordinates
-                            screen_point_p1 = get_2d_point(region, rv3d, p1_)
-                            screen_point_p2 = get_2d_point(region, rv3d, p2_)
                             if i == 0:
-                                draw_arrow(screen_point_p1, screen_point_p2, rgba, ms.glarc_s, ms.glarc_a, "99")
+                                overlay.arrow(p1_, p2_, rgba, width, ms.glarc_s, ms.glarc_a, "99")
                             elif i == int(n_step) - 1:
-                                draw_arrow(screen_point_p1, screen_point_p2, rgba, ms.glarc_s, "99", ms.glarc_b)
+                                overlay.arrow(p1_, p2_, rgba, width, ms.glarc_s, "99", ms.glarc_b)
                             else:
-                                draw_line(screen_point_p1, screen_point_p2, rgba)
+                                overlay.line(p1_, p2_, rgba, width)
 
                             p1 = p2.copy()
 
@@ -589,16 +694,10 @@ def draw_segments(context, myobj, op, region, rv3d):
 
                         # Draw close lines
                         if ms.glarc_full is False:
-                            screen_point_p1a = get_2d_point(region, rv3d, p_01a)
-                            screen_point_p1b = get_2d_point(region, rv3d, p_01b)
-                            screen_point_p2a = get_2d_point(region, rv3d, p_02a)
-                            screen_point_p2b = get_2d_point(region, rv3d, p_02b)
-
-                            draw_line(screen_point_p1a, screen_point_p1b, rgba)
-                            draw_line(screen_point_p2a, screen_point_p2b, rgba)
+                            overlay.line(p_01a, p_01b, rgba, width)
+                            overlay.line(p_02a, p_02b, rgba, width)
 
                     if ms.gltype == 20:  # Area
-                        obverts = get_mesh_vertices(myobj)
                         tot = 0
                         if scene.measureit_scale is True:
                             ms_scale = scene.measureit_scale_factor
@@ -610,7 +709,7 @@ def draw_segments(context, myobj, op, region, rv3d):
                             for v in face.measureit_index:
                                 myvertices.append(v.glidx)
 
-                            area = get_area_and_paint(myvertices, myobj, obverts, region, rv3d, rgba, ms_scale)
+                            area = get_area_and_paint(myvertices, myobj, obverts, overlay, rgba, ms_scale)
                             tot += area
                         # Draw Area number over first face
                         if len(ms.measureit_faces) > 0:
@@ -637,11 +736,9 @@ def draw_segments(context, myobj, op, region, rv3d):
                             if scene.measureit_gl_show_n is True and ms.glnames is True:
                                 msg += ms.gltxt
                             if scene.measureit_gl_show_d is True or scene.measureit_gl_show_n is True:
-                                tmp_point = get_2d_point(region, rv3d, midpoint3d)
-                                if tmp_point is not None:
-                                    txtpoint2d = tmp_point[0] + ms.glfontx, tmp_point[1] + ms.glfonty
-                                    # todo: swap ms.glcolorarea with ms.glcolor ?
-                                    draw_text(myobj, txtpoint2d, msg, ms.glcolorarea, fsize, faln, fang)
+                                # todo: swap ms.glcolorarea with ms.glcolor ?
+                                overlay.text(midpoint3d, (ms.glfontx, ms.glfonty), msg, ms.glcolorarea,
+                                             fsize, faln, fang)
 
                 except IndexError:
                     ms.glfree = True
@@ -649,14 +746,79 @@ def draw_segments(context, myobj, op, region, rv3d):
                     print("Unexpected error:" + str(exc_info()))
                     pass
 
-    return
+    return overlay
+
+
+# -------------------------------------------------------------
+# Draw a retained overlay
+#
+# All points are projected at once, then lines are submitted as one
+# batch per line width, triangles as one batch and texts in one pass.
+# -------------------------------------------------------------
+def draw_overlay(myobj, overlay, region, rv3d):
+    points2d = get_2d_points(region, rv3d, overlay.points)
+    lines = {}
+    tri_coords = []
+    tri_colors = []
+
+    def add_line(v1, v2, rgba, width):
+        coords, colors = lines.setdefault(width, ([], []))
+        coords.extend(((v1[0], v1[1], 0), (v2[0], v2[1], 0)))
+        colors.extend((rgba, rgba))
+
+    def add_triangle(v1, v2, v3, rgba):
+        tri_coords.extend(((v1[0], v1[1], 0), (v2[0], v2[1], 0), (v3[0], v3[1], 0)))
+        tri_colors.extend((rgba, rgba, rgba))
+
+    for a, b, rgba, width in overlay.lines:
+        v1 = points2d[a]
+        v2 = points2d[b]
+        if v1 is not None and v2 is not None:
+            add_line(v1, v2, rgba, width)
+
+    for a, b, rgba, width, size, a_typ, b_typ in overlay.arrows:
+        v1 = points2d[a]
+        v2 = points2d[b]
+        if v1 is not None and v2 is not None:
+            arrow_lines, arrow_tris = get_arrow_geometry(v1, v2, size, a_typ, b_typ)
+            for p1, p2 in arrow_lines:
+                add_line(p1, p2, rgba, width)
+            for p1, p2, p3 in arrow_tris:
+                add_triangle(p1, p2, p3, rgba)
+
+    for a, b, c, rgba in overlay.tris:
+        v1 = points2d[a]
+        v2 = points2d[b]
+        v3 = points2d[c]
+        if v1 is not None and v2 is not None and v3 is not None:
+            add_triangle(v1, v2, v3, rgba)
+
+    gpu.state.blend_set('ALPHA')
+    if tri_coords:
+        batch = batch_for_shader(shader_flat, 'TRIS', {"pos": tri_coords, "color": tri_colors})
+        shader_flat.bind()
+        batch.draw(shader_flat)
+
+    for width, (coords, colors) in lines.items():
+        imm_set_line_width(width)
+        batch = batch_for_shader(shader_line_flat, 'LINES', {"pos": coords, "color": colors})
+        shader_line_flat.bind()
+        shader_line_flat.uniform_float("lineWidth", imm_line_width)
+        shader_line_flat.uniform_float("viewportSize", imm_viewport)
+        batch.draw(shader_line_flat)
+
+    for idx, offset, display_text, rgba, fsize, align, text_rot in overlay.texts:
+        pos2d = points2d[idx]
+        if pos2d is not None:
+            draw_text(myobj, (pos2d[0] + offset[0], pos2d[1] + offset[1]), display_text, rgba, fsize,
+                      align, text_rot)
 
 
 # ------------------------------------------
 # Get polygon area and paint area
 #
 # ------------------------------------------
-def get_area_and_paint(myvertices, myobj, obverts, region, rv3d, rgba, ms_scale):
+def get_area_and_paint(myvertices, myobj, obverts, overlay, rgba, ms_scale):
     mymesh = myobj.data
     totarea = 0
     if len(myvertices) > 3:
@@ -676,11 +838,7 @@ def get_area_and_paint(myvertices, myobj, obverts, region, rv3d, rgba, ms_scale)
             p2 = get_point(obverts[myvertices[v2]].co, myobj)
             p3 = get_point(obverts[myvertices[v3]].co, myobj)
 
-            screen_point_p1 = get_2d_point(region, rv3d, p1)
-            screen_point_p2 = get_2d_point(region, rv3d, p2)
-            screen_point_p3 = get_2d_point(region, rv3d, p3)
-
-            draw_triangle(screen_point_p1, screen_point_p2, screen_point_p3, rgba)
+            overlay.triangle(p1, p2, p3, rgba)
 
             # Area
 
@@ -693,10 +851,7 @@ def get_area_and_paint(myvertices, myobj, obverts, region, rv3d, rgba, ms_scale)
         p2 = get_point(obverts[v2].co, myobj)
         p3 = get_point(obverts[v3].co, myobj)
 
-        screen_point_p1 = get_2d_point(region, rv3d, p1)
-        screen_point_p2 = get_2d_point(region, rv3d, p2)
-        screen_point_p3 = get_2d_point(region, rv3d, p3)
-        draw_triangle(screen_point_p1, screen_point_p2, screen_point_p3, rgba)
+        overlay.triangle(p1, p2, p3, rgba)
 
         # Area
         area = get_triangle_area(p1, p2, p3, ms_scale)
@@ -739,6 +894,31 @@ def get_2d_point(region, rv3d, point3d):
         return get_render_location(point3d)
 
 
+# ------------------------------------------
+# Get a list of points in 2d space
+#
+# Same result as get_2d_point for each point,
+# with one matrix multiply for the viewport.
+# ------------------------------------------
+def get_2d_points(region, rv3d, points3d):
+    if not points3d:
+        return []
+    if rv3d is None or region is None:
+        return get_render_locations(points3d)
+
+    coords = np.ones((len(points3d), 4))
+    coords[:, :3] = points3d
+    prj = coords @ np.array(rv3d.perspective_matrix).T
+    width_half = region.width / 2.0
+    height_half = region.height / 2.0
+    visible = prj[:, 3] > 0.0
+    w = np.where(visible, prj[:, 3], 1.0)
+    x = width_half + width_half * (prj[:, 0] / w)
+    y = height_half + height_half * (prj[:, 1] / w)
+
+    return [Vector((px, py)) if vis else None for px, py, vis in zip(x.tolist(), y.tolist(), visible.tolist())]
+
+
 # -------------------------------------------------------------
 # Get sum of a group
 #
@@ -746,24 +926,32 @@ def get_2d_point(region, rv3d, point3d):
 # Tag: group
 # -------------------------------------------------------------
 def get_group_sum(myobj, tag):
+    return get_group_sums(myobj).get(tag[2:3], " ")
+
+
+# -------------------------------------------------------------
+# Get sums of all groups in one pass
+#
+# myobj: Current object
+# return: {group letter: formatted sum}
+# -------------------------------------------------------------
+def get_group_sums(myobj):
     # noinspection PyBroadException
     try:
         tx = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q", "R", "S",
               "T", "U", "V", "W", "X", "Y", "Z"]
-        g = tag[2:3]
         mp = myobj.MeasureGenerator[0]
-        flag = False
         # -----------------
         # Sum loop segments
         # -----------------
         scale = bpy.context.scene.unit_settings.scale_length
-        tot = 0.0
+        totals = {}
         obverts = get_mesh_vertices(myobj)
         for idx in range(mp.measureit_num):
             ms = mp.measureit_segments[idx]
             if (ms.gltype == 1 or ms.gltype == 12 or
                 ms.gltype == 13 or ms.gltype == 14) and ms.gltot != '99' \
-                    and ms.glfree is False and g == tx[int(ms.gltot)]:  # only segments
+                    and ms.glfree is False:  # only segments
                 if ms.glpointa <= len(obverts) and ms.glpointb <= len(obverts):
                     p1 = get_point(obverts[ms.glpointa].co, myobj)
                     if ms.gltype == 1:
@@ -787,20 +975,17 @@ def get_group_sum(myobj, tag):
                     else:
                         usedist = distloc
                     usedist *= scale
-                    tot += usedist
-                    flag = True
+                    g = tx[int(ms.gltot)]
+                    totals[g] = totals.get(g, 0.0) + usedist
 
-        if flag is True:
-            # Return value
-            pr = bpy.context.scene.measureit_gl_precision
-            fmt = "%1." + str(pr) + "f"
-            units = bpy.context.scene.measureit_units
+        # Return values
+        pr = bpy.context.scene.measureit_gl_precision
+        fmt = "%1." + str(pr) + "f"
+        units = bpy.context.scene.measureit_units
 
-            return format_distance(fmt, units, tot)
-        else:
-            return " "
+        return {g: format_distance(fmt, units, tot) for g, tot in totals.items()}
     except:
-        return " "
+        return {}
 
 
 # -------------------------------------------------------------
@@ -913,6 +1098,18 @@ def draw_arrow(v1, v2, rgba, size=20, a_typ="1", b_typ="1"):
     if v1 is None or v2 is None:
         return
 
+    lines, tris = get_arrow_geometry(v1, v2, size, a_typ, b_typ)
+    for p1, p2, p3 in tris:
+        draw_triangle(p1, p2, p3, rgba)
+    for p1, p2 in lines:
+        draw_line(p1, p2, rgba)
+
+
+# -------------------------------------------------------------
+# Get lines and triangles of an Arrow in 2d space
+#
+# -------------------------------------------------------------
+def get_arrow_geometry(v1, v2, size=20, a_typ="1", b_typ="1"):
     rad45 = radians(45)
     rad315 = radians(315)
     rad90 = radians(90)
@@ -951,21 +1148,25 @@ def draw_arrow(v1, v2, rgba, size=20, a_typ="1", b_typ="1"):
     v2b = (int(v2i[0] * cos(rad_b) - v2i[1] * sin(rad_b) + v2[0]),
            int(v2i[1] * cos(rad_b) + v2i[0] * sin(rad_b) + v2[1]))
 
+    lines = []
+    tris = []
     # Triangle o Lines
     if a_typ == "1" or a_typ == "3":
-        draw_line(v1, v1a, rgba)
-        draw_line(v1, v1b, rgba)
+        lines.append((v1, v1a))
+        lines.append((v1, v1b))
 
     if b_typ == "1" or b_typ == "3":
-        draw_line(v2, v2a, rgba)
-        draw_line(v2, v2b, rgba)
+        lines.append((v2, v2a))
+        lines.append((v2, v2b))
 
     if a_typ == "2":
-        draw_triangle(v1, v1a, v1b, rgba)
+        tris.append((v1, v1a, v1b))
     if b_typ == "2":
-        draw_triangle(v2, v2a, v2b, rgba)
+        tris.append((v2, v2a, v2b))
+
+    lines.append((v1, v2))
 
-    draw_line(v1, v2, rgba)
+    return lines, tris
 
 
 # -------------------------------------------------------------
@@ -1343,6 +1544,45 @@ def get_render_location(mypoint):
     return [round(co_2d.x * render_size[0]), round(co_2d.y * render_size[1])]
 
 
+# --------------------------------------------------------------------
+# Get positions of a list of points in final render image
+# Same maths as world_to_camera_view, for all points at once
+#
+# return list of 2d positions
+# --------------------------------------------------------------------
+def get_render_locations(points3d):
+    scene = bpy.context.scene
+    camera = scene.camera
+    coords = np.ones((len(points3d), 4))
+    coords[:, :3] = points3d
+    co_local = coords @ np.array(camera.matrix_world.normalized().inverted()).T
+    z = -co_local[:, 2]
+    frame = [np.array(v) for v in camera.data.view_frame(scene=scene)[:3]]
+    if camera.data.type != 'ORTHO':
+        # scale the frame to the depth of each point
+        depth = np.where(z == 0.0, 1.0, z)
+        min_x = -frame[2][0] * depth / frame[2][2]
+        max_x = -frame[1][0] * depth / frame[1][2]
+        min_y = -frame[1][1] * depth / frame[1][2]
+        max_y = -frame[0][1] * depth / frame[0][2]
+    else:
+        min_x, max_x = frame[2][0], frame[1][0]
+        min_y, max_y = frame[1][1], frame[0][1]
+
+    x = (co_local[:, 0] - min_x) / (max_x - min_x)
+    y = (co_local[:, 1] - min_y) / (max_y - min_y)
+    if camera.data.type != 'ORTHO':
+        x = np.where(z == 0.0, 0.5, x)
+        y = np.where(z == 0.0, 0.5, y)
+
+    # Get pixel coords
+    render_scale = scene.render.resolution_percentage / 100
+    render_size = (int(scene.render.resolution_x * render_scale),
+                   int(scene.render.resolution_y * render_scale))
+
+    return [[round(px * render_size[0]), round(py * render_size[1])] for px, py in zip(x.tolist(), y.tolist())]
+
+
 # ---------------------------------------------------------
 # Get center of circle base on 3 points
 #
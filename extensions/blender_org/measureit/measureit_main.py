@@ -30,6 +30,29 @@ from .measureit_render import *
 @persistent
 def load_handler(dummy):
     MEASUREIT_OT_RunHintDisplay.handle_remove(None, bpy.context)
+    invalidate_overlay_cache()
+
+
+# ------------------------------------------------------
+# Handler to detect changes in objects and meshes
+# Drop the cached overlays of updated objects
+#
+# ------------------------------------------------------
+# noinspection PyUnusedLocal
+@persistent
+def depsgraph_handler(scene, depsgraph):
+    invalidate_overlay_cache(depsgraph)
+
+
+# ------------------------------------------------------
+# Handler to detect frame changes
+# Drop the cached overlays of animated objects
+#
+# ------------------------------------------------------
+# noinspection PyUnusedLocal
+@persistent
+def frame_change_handler(scene, depsgraph):
+    invalidate_animated_overlays(scene)
 
 
 # ------------------------------------------------------
@@ -65,6 +88,8 @@ def save_handler(dummy):
 
 bpy.app.handlers.load_post.append(load_handler)
 bpy.app.handlers.save_pre.append(save_handler)
+bpy.app.handlers.depsgraph_update_post.append(depsgraph_handler)
+bpy.app.handlers.frame_change_post.append(frame_change_handler)
 
 
 # ------------------------------------------------------------------
@@ -1734,18 +1759,7 @@ class MEASUREIT_OT_RenderSegment(Operator):
         # Animation
         # -----------------------------
         if scene.measureit_render_type == "2":
-            oldframe = scene.frame_current
-            flag = False
-            # loop frames
-            for frm in range(scene.frame_start, scene.frame_end + 1):
-                scene.frame_set(frm)
-                print("MeasureIt: Rendering frame %04d" % frm)
-                flag = render_main(self, context, True)
-                if flag is False:
-                    break
-
-            scene.frame_current = oldframe
-            if flag is True:
+            if render_animation(self, context) is True:
                 self.report({'INFO'}, msg)
 
         return {'FINISHED'}
@@ -12,6 +12,8 @@ import bpy
 import gpu
 # noinspection PyUnresolvedReferences
 import blf
+import numpy as np
+from time import perf_counter
 from os import path, remove
 from sys import exc_info
 # noinspection PyUnresolvedReferences
@@ -40,14 +42,127 @@ def render_main(self, context, animation=False):
     # --------------------
     # Get resolution
     # --------------------
-    render_scale = scene.render.resolution_percentage / 100
-    width = int(scene.render.resolution_x * render_scale)
-    height = int(scene.render.resolution_y * render_scale)
+    width, height = get_render_size(scene)
 
     # --------------------------------------
     # Loop to draw all lines in Offsecreen
     # --------------------------------------
     offscreen = gpu.types.GPUOffScreen(width, height)
+    items = [(myobj, None) for myobj in objlist if 'MeasureGenerator' in myobj]
+    buffer = draw_offscreen(context, offscreen, width, height, items)
+    offscreen.free()
+
+    # -----------------------------
+    # Create image
+    # -----------------------------
+    image = update_output_image(width, height, np.frombuffer(buffer, dtype=np.uint8))
+
+    # Saves image
+    if image is not None and (scene.measureit_render is True or animation is True):
+        outpath = get_output_path(scene)
+        save_image(self, outpath, image)
+
+    # restore default value
+    settings.color_depth = depth
+
+
+# -------------------------------------------------------------
+# Render all frames of the animation
+#
+# Geometry of objects that do not move is built once and reused
+# for every frame. Frames are saved like a single render, so the
+# scene color management is applied.
+# -------------------------------------------------------------
+def render_animation(self, context):
+    scene = context.scene
+    width, height = get_render_size(scene)
+    oldframe = scene.frame_current
+
+    # -----------------------------
+    # Split static and animated
+    # -----------------------------
+    objlist = [myobj for myobj in scene.objects if 'MeasureGenerator' in myobj]
+    animated = get_animated_objects(scene, objlist)
+    static = {}
+    for myobj in objlist:
+        if myobj not in animated:
+            static[myobj.name] = get_overlay(myobj, myobj.MeasureGenerator[0])
+    print("MeasureIt: %d animated and %d static objects with measures" % (len(animated), len(static)))
+
+    offscreen = gpu.types.GPUOffScreen(width, height)
+    frames = 0
+    start = perf_counter()
+    try:
+        for frm in range(scene.frame_start, scene.frame_end + 1):
+            frame_start = perf_counter()
+            scene.frame_set(frm)
+            items = [(myobj, static.get(myobj.name)) for myobj in objlist]
+            buffer = draw_offscreen(context, offscreen, width, height, items)
+            image = update_output_image(width, height, np.frombuffer(buffer, dtype=np.uint8))
+            if save_image(self, get_output_path(scene), image) is not True:
+                return False
+            frames += 1
+            print("MeasureIt: Frame %04d rendered in %.3f s" % (frm, perf_counter() - frame_start))
+    finally:
+        offscreen.free()
+        scene.frame_set(oldframe)
+
+    total = perf_counter() - start
+    print("MeasureIt: %d frames rendered in %.3f s (%.3f s per frame)"
+          % (frames, total, total / max(frames, 1)))
+
+    return True
+
+
+# -------------------------------------------------------------
+# Get objects whose measures can change between frames
+#
+# -------------------------------------------------------------
+def get_animated_objects(scene, objlist):
+    if scene.animation_data is not None:
+        return set(objlist)
+
+    def is_animated(myobj):
+        while myobj is not None:
+            if myobj.animation_data is not None or len(myobj.constraints) > 0:
+                return True
+            myobj = myobj.parent
+        return False
+
+    animated = set()
+    for myobj in objlist:
+        if is_animated(myobj):
+            animated.add(myobj)
+            continue
+        # measures linked to another object move with it
+        for ms in myobj.MeasureGenerator[0].measureit_segments:
+            linkobj = bpy.data.objects.get(ms.gllink) if ms.gllink else None
+            if linkobj is not None and is_animated(linkobj):
+                animated.add(myobj)
+                break
+
+    return animated
+
+
+# -------------------------------------------------------------
+# Get render resolution
+#
+# -------------------------------------------------------------
+def get_render_size(scene):
+    render_scale = scene.render.resolution_percentage / 100
+    width = int(scene.render.resolution_x * render_scale)
+    height = int(scene.render.resolution_y * render_scale)
+
+    return width, height
+
+
+# -------------------------------------------------------------
+# Draw all measures in Offscreen and read the pixels back
+#
+# items: list of (object, cached overlay or None)
+# -------------------------------------------------------------
+def draw_offscreen(context, offscreen, width, height, items):
+    scene = context.scene
     view_matrix = Matrix([
         [2 / width, 0, 0, -1],
         [0, 2 / height, 0, -1],
@@ -64,11 +179,10 @@ def render_main(self, context, animation=False):
         # -----------------------------
         # Loop to draw all objects
         # -----------------------------
-        for myobj in objlist:
+        for myobj, overlay in items:
             if myobj.visible_get() is True:
-                if 'MeasureGenerator' in myobj:
-                    op = myobj.MeasureGenerator[0]
-                    draw_segments(context, myobj, op, None, None)
+                op = myobj.MeasureGenerator[0]
+                draw_segments(context, myobj, op, None, None, overlay)
         # -----------------------------
         # Loop to draw all debug
         # -----------------------------
@@ -105,35 +219,41 @@ def render_main(self, context, animation=False):
         buffer = fb.read_color(0, 0, width, height, 4, 0, 'UBYTE')
         buffer.dimensions = width * height * 4
 
-    offscreen.free()
+    return buffer
 
-    # -----------------------------
-    # Create image
-    # -----------------------------
+
+# -------------------------------------------------------------
+# Copy pixels (0-255 RGBA bytes) in the output image
+#
+# -------------------------------------------------------------
+def update_output_image(width, height, pixels):
     image_name = "measureit_output"
     if not image_name in bpy.data.images:
         bpy.data.images.new(image_name, width, height)
 
     image = bpy.data.images[image_name]
     image.scale(width, height)
-    image.pixels = [v / 255 for v in buffer]
+    image.pixels.foreach_set(pixels.astype(np.float32) / 255)
 
-    # Saves image
-    if image is not None and (scene.measureit_render is True or animation is True):
-        ren_path = bpy.context.scene.render.filepath
-        filename = "mit_frame"
-        if len(ren_path) > 0:
-            if ren_path.endswith(path.sep):
-                initpath = path.realpath(ren_path) + path.sep
-            else:
-                (initpath, filename) = path.split(ren_path)
-
-        ftxt = "%04d" % scene.frame_current
-        outpath = path.realpath(path.join(initpath, filename + ftxt + ".png"))
-        save_image(self, outpath, image)
+    return image
 
-    # restore default value
-    settings.color_depth = depth
+
+# -------------------------------------------------------------
+# Get file path of the current frame
+#
+# -------------------------------------------------------------
+def get_output_path(scene):
+    ren_path = scene.render.filepath
+    initpath = ""
+    filename = "mit_frame"
+    if len(ren_path) > 0:
+        if ren_path.endswith(path.sep):
+            initpath = path.realpath(ren_path) + path.sep
+        else:
+            (initpath, filename) = path.split(ren_path)
+
+    ftxt = "%04d" % scene.frame_current
+    return path.realpath(path.join(initpath, filename + ftxt + ".png"))
 
 
 # -------------------------------------
@@ -163,4 +283,6 @@ def save_image(self, filepath, myimage):
     except:
         print("Unexpected error:" + str(exc_info()))
         self.report({'ERROR'}, "MeasureIt: Unable to save render image")
-        return
+        return False
+
+    return True
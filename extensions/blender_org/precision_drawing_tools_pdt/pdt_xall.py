@@ -10,8 +10,8 @@
 #
 import bpy
 import bmesh
+import numpy as np
 from mathutils.geometry import intersect_line_line as LineIntersect
-import itertools
 from collections import defaultdict
 from . import pdt_cad_module as cm
 from .pdt_functions import oops
@@ -33,32 +33,33 @@ def order_points(edge, point_list):
     return [v1] + point_list + [v2]
 
 
-def remove_permutations_that_share_a_vertex(bm, permutations):
-    """Get useful Permutations.
+def get_edge_bounds(bm, edge_indices, margin=1.0e-5):
+    """Get Edge Vertex Indices and Bounding Boxes.
 
     Args:
         bm: Object's Bmesh
-        permutations: Possible Intersection Edges as a list
+        edge_indices: List of indices of Edges to consider
+        margin: Padding added to each bounding box
 
     Returns:
-        List of Edges.
+        Arrays of Vertex Indices (n, 2), Box Minima (n, 3) and Box Maxima (n, 3).
     """
 
-    final_permutations = []
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        if len(set(raw_vert_indices)) < 4:
-            continue
-
-        # reaches this point if they do not share.
-        final_permutations.append(edges)
-
-    return final_permutations
+    edges = [bm.edges[idx] for idx in edge_indices]
+    vert_indices = np.array([[v.index for v in edge.verts] for edge in edges], dtype=np.int64)
+    coords = np.array([[v.co for v in edge.verts] for edge in edges], dtype=np.float64)
+    return vert_indices, coords.min(axis=1) - margin, coords.max(axis=1) + margin
 
 
 def get_valid_permutations(bm, edge_indices):
     """Get useful Permutations.
 
+    Note:
+        Sweep-line broad phase: edges are sorted by the start of their bounding box
+        along the axis of greatest spread, so each edge is only paired with the edges
+        whose boxes start before its own box ends. Pairs whose boxes do not overlap
+        on the remaining axes, or that share a vertex, are discarded.
+
     Args:
         bm: Object's Bmesh
         edge_indices: List of indices of Edges to consider
@@ -67,9 +68,33 @@ def get_valid_permutations(bm, edge_indices):
         List of suitable Edges.
     """
 
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(bm, permutations)
+    if len(edge_indices) < 2:
+        return []
+
+    edge_indices = np.asarray(edge_indices, dtype=np.int64)
+    vert_indices, box_min, box_max = get_edge_bounds(bm, edge_indices)
+
+    axis = int(np.argmax(box_max.max(axis=0) - box_min.min(axis=0)))
+    order = np.argsort(box_min[:, axis], kind="stable")
+    edge_indices = edge_indices[order]
+    vert_indices = vert_indices[order]
+    box_min = box_min[order]
+    box_max = box_max[order]
+    sweep_end = np.searchsorted(box_min[:, axis], box_max[:, axis], side="right")
+
+    permutations = []
+    for i in range(len(edge_indices) - 1):
+        others = slice(i + 1, sweep_end[i])
+        overlap = np.all(
+            (box_min[others] <= box_max[i]) & (box_max[others] >= box_min[i]), axis=1
+        )
+        verts = vert_indices[others]
+        overlap &= ~np.any(np.isin(verts, vert_indices[i]), axis=1)
+        for other in edge_indices[others][overlap]:
+            pair = (int(edge_indices[i]), int(other))
+            permutations.append(pair if pair[0] < pair[1] else pair[::-1])
+
+    return permutations
 
 
 def can_skip(closest_points, vert_vectors):
@@ -153,16 +178,11 @@ def update_mesh(bm, int_dict):
     orig_e = bm.edges
     orig_v = bm.verts
 
-    new_verts = []
-    collect = new_verts.extend
-    for _, point_list in int_dict.items():
-        num_edges_to_add = len(point_list) - 1
-        for i in range(num_edges_to_add):
-            coord_a = orig_v.new(point_list[i])
-            coord_b = orig_v.new(point_list[i + 1])
+    for point_list in int_dict.values():
+        new_verts = [orig_v.new(point) for point in point_list]
+        for coord_a, coord_b in zip(new_verts, new_verts[1:]):
             orig_e.new((coord_a, coord_b))
-            bm.normal_update()
-            collect([coord_a, coord_b])
+    bm.normal_update()
 
     bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if edge.select], context="EDGES")
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from threading import Lock
 
 import bpy
@@ -12,6 +13,9 @@ GL_TRIANGLES = 5
 GL_TRIANGLE_FAN = 6
 GL_QUADS = 4
 
+# Maximum number of batches which are kept for reuse.
+BATCH_CACHE_SIZE = 256
+
 
 def primitive_mode_is_line(mode):
     return mode in [GL_LINES, GL_LINE_STRIP, GL_LINE_LOOP]
@@ -41,6 +45,7 @@ class InternalData:
         inst.line_width = 1.0
         inst.scissor = None
         inst.original_scissor = None
+        inst.batches = OrderedDict()
 
         return inst
 
@@ -116,6 +121,20 @@ class InternalData:
     def get_original_scissor(self):
         return self.original_scissor
 
+    def get_batch(self, key):
+        batch = self.batches.get(key)
+        if batch is not None:
+            self.batches.move_to_end(key)
+        return batch
+
+    def add_batch(self, key, batch):
+        self.batches[key] = batch
+        if len(self.batches) > BATCH_CACHE_SIZE:
+            self.batches.popitem(last=False)
+
+    def clear_batches(self):
+        self.batches.clear()
+
 
 # pylint: disable=C0103
 def immLineWidth(width):
@@ -203,29 +222,7 @@ def _get_shader(dims, prim_mode, has_texture, scissor_box):
         f"has_texture={has_texture}, scissor_box={scissor_box}")
 
 
-# pylint: disable=C0103
-def immEnd():
-    inst = InternalData.get_instance()
-
-    color = inst.get_color()
-    coords = inst.get_verts()
-    tex_coords = inst.get_tex_coords()
-    scissor_box = inst.get_scissor()
-    # TODO: Other than OpenGL backend, scissor is not supported.
-    #       Temporary turn off when gpu.state.scissor_set is implemented.
-    if hasattr(gpu, "platform") and \
-            hasattr(gpu.platform, "backend_type_get") and \
-            gpu.platform.backend_type_get() != 'OPENGL':
-        scissor_box = None
-
-    has_texture = len(tex_coords) != 0
-    prim_mode = inst.get_prim_mode()
-    dims = inst.get_dims()
-
-    # Get shader.
-    shader, use_custom_shader = _get_shader(
-        dims, prim_mode, has_texture, scissor_box)
-
+def _build_batch(shader, prim_mode, coords, tex_coords):
     # Setup attributes.
     if len(tex_coords) == 0:
         data = {
@@ -267,6 +264,41 @@ def immEnd():
         raise NotImplementedError(
             f"Not supported primitive mode {prim_mode}")
 
+    return batch
+
+
+# pylint: disable=C0103
+def immEnd():
+    inst = InternalData.get_instance()
+
+    color = inst.get_color()
+    coords = inst.get_verts()
+    tex_coords = inst.get_tex_coords()
+    scissor_box = inst.get_scissor()
+    # TODO: Other than OpenGL backend, scissor is not supported.
+    #       Temporary turn off when gpu.state.scissor_set is implemented.
+    if hasattr(gpu, "platform") and \
+            hasattr(gpu.platform, "backend_type_get") and \
+            gpu.platform.backend_type_get() != 'OPENGL':
+        scissor_box = None
+
+    has_texture = len(tex_coords) != 0
+    prim_mode = inst.get_prim_mode()
+    dims = inst.get_dims()
+
+    # Get shader.
+    shader, use_custom_shader = _get_shader(
+        dims, prim_mode, has_texture, scissor_box)
+
+    # Reuse the batch if same primitives were drawn before.
+    # The shader is determined by the other items of the key.
+    batch_key = (dims, prim_mode, has_texture, scissor_box is not None,
+                 tuple(map(tuple, coords)), tuple(map(tuple, tex_coords)))
+    batch = inst.get_batch(batch_key)
+    if batch is None:
+        batch = _build_batch(shader, prim_mode, coords, tex_coords)
+        inst.add_batch(batch_key, batch)
+
     # Set parameters for shader.
     shader.bind()
     if prim_mode in [GL_LINES, GL_LINE_STRIP, GL_LINE_LOOP]:
@@ -306,7 +338,6 @@ def immEnd():
     # Draw.
     batch.draw(shader)
 
-    del batch
     inst.clear()
 
 
@@ -336,6 +367,12 @@ def immSetTexture(texture):
     inst.set_tex(texture)
 
 
+# pylint: disable=C0103
+def immClearBatchCache():
+    inst = InternalData.get_instance()
+    inst.clear_batches()
+
+
 # pylint: disable=C0103
 def immSetScissor(scissor_box):
     inst = InternalData.get_instance()
@@ -24,6 +24,7 @@ import platform
 import math
 import collections
 import enum
+import functools
 import time
 
 import blf
@@ -49,6 +50,35 @@ EventType = enum.IntEnum(
 )
 EventType.names = {e.identifier: e.name for e in event_type_enum_items}
 
+# Maximum number of cached text dimensions.
+TEXT_DIMENSIONS_CACHE_SIZE = 1024
+
+# Font size which is set by set_font_size.
+# Format: {font_id: (font_size, dpi)}
+font_sizes = {}
+# Text dimensions for each font setting.
+# Format: {(font_id, (font_size, dpi), text): (width, height)}
+text_dimensions_cache = {}
+
+
+def set_font_size(font_id, font_size, dpi):
+    compat.blf_size(font_id, font_size, dpi)
+    font_sizes[font_id] = (font_size, dpi)
+
+
+def text_dimensions(font_id, text):
+    """Return blf.dimensions of text with the font size set by
+    set_font_size."""
+
+    key = (font_id, font_sizes.get(font_id), text)
+    dims = text_dimensions_cache.get(key)
+    if dims is None:
+        if len(text_dimensions_cache) >= TEXT_DIMENSIONS_CACHE_SIZE:
+            text_dimensions_cache.clear()
+        dims = blf.dimensions(font_id, text)
+        text_dimensions_cache[key] = dims
+    return dims
+
 
 def draw_default_mouse(x, y, w, h, left_button_status,
                        right_button_status, middle_button_status,
@@ -221,14 +251,9 @@ def draw_custom_mouse(x, y, w, h, left_button_status,
             draw_image(bpy.data.images[image_name_base], positions, tex_coords)
 
 
-def draw_rounded_box(x, y, w, h, round_radius, fill=False,
-                     color=None, round_corner=None, line_thickness=1):
-    """round_corner: [Right Bottom, Left Bottom, Right Top, Left Top]"""
-
-    if color is None:
-        color = [1.0, 1.0, 1.0, 1.0]
-    if round_corner is None:
-        round_corner = [True, True, True, True]
+@functools.lru_cache(maxsize=256)
+def rounded_box_verts(x, y, w, h, round_radius, round_corner):
+    """round_corner: (Right Bottom, Left Bottom, Right Top, Left Top)"""
 
     def circle_verts_num(r):
         """Get number of verticies for circle optimized for drawing."""
@@ -267,6 +292,26 @@ def draw_rounded_box(x, y, w, h, round_radius, fill=False,
         math.pi * 0.5,
     ]
 
+    verts = []
+    for x0, y0, angle, r in zip(x_origin, y_origin, angle_start, radius):
+        for _ in range(n):
+            verts.append((x0 + r * math.cos(angle), y0 + r * math.sin(angle)))
+            angle += dangle
+
+    return tuple(verts)
+
+
+def draw_rounded_box(x, y, w, h, round_radius, fill=False,
+                     color=None, round_corner=None, line_thickness=1):
+    """round_corner: [Right Bottom, Left Bottom, Right Top, Left Top]"""
+
+    if color is None:
+        color = [1.0, 1.0, 1.0, 1.0]
+    if round_corner is None:
+        round_corner = [True, True, True, True]
+
+    verts = rounded_box_verts(x, y, w, h, round_radius, tuple(round_corner))
+
     original_state = gpu.state.blend_get()
     gpu.state.blend_set('ALPHA')
     imm.immColor4f(*color)
@@ -276,15 +321,11 @@ def draw_rounded_box(x, y, w, h, round_radius, fill=False,
         imm.immBegin(imm.GL_TRIANGLE_FAN)
     else:
         imm.immBegin(imm.GL_LINE_LOOP)
-    for x0, y0, angle, r in zip(x_origin, y_origin, angle_start, radius):
-        for _ in range(n):
-            x = x0 + r * math.cos(angle)
-            y = y0 + r * math.sin(angle)
-            if not fill:
-                imm.immVertex3f(x, y, 0)
-            else:
-                imm.immVertex2f(x, y)
-            angle += dangle
+    for x, y in verts:
+        if not fill:
+            imm.immVertex3f(x, y, 0)
+        else:
+            imm.immVertex2f(x, y)
     imm.immEnd()
 
     imm.immLineWidth(1.0)
@@ -307,8 +348,8 @@ def draw_rect(x1, y1, x2, y2, color):
 
 def draw_text_background(text, font_id, x, y, background_color,
                          margin=0, round_radius=0):
-    width = blf.dimensions(font_id, text)[0]
-    height = blf.dimensions(font_id, "Hy|")[1]
+    width = text_dimensions(font_id, text)[0]
+    height = text_dimensions(font_id, "Hy|")[1]
     correction = height * 0.2
 
     if round_radius == 0:
@@ -534,6 +575,13 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
     # Operator history.
     # Format: [time, bl_label, idname_py, addr]
     operator_history = []
+    # Incremented when an item of event/operator history is added or updated.
+    event_history_version = 0
+    operator_history_version = 0
+
+    # Draw area size calculated at last time.
+    # Format: (key, (width, height))
+    draw_area_size_cache = (None, None)
 
     MODIFIER_EVENT_TYPES = [
         EventType.LEFT_SHIFT,
@@ -711,7 +759,7 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
 
     @classmethod
     def get_text_offset_for_alignment(cls, context, font_id, text, margin=0):
-        tw = blf.dimensions(font_id, text)[0]
+        tw = cls.text_area_width(text, font_id)
 
         return cls.get_alignment_offset(context, tw, margin)
 
@@ -847,11 +895,11 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
 
     @classmethod
     def text_area_width(cls, text, font_id):
-        return blf.dimensions(font_id, text)[0]
+        return text_dimensions(font_id, text)[0]
 
     @classmethod
     def text_area_height(cls, font_id):
-        return blf.dimensions(font_id, "Hy|")[1]
+        return text_dimensions(font_id, "Hy|")[1]
 
     @classmethod
     def _area_size_last_operator_layer(cls, context, font_id):
@@ -1020,6 +1068,42 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
 
         return 0, 0
 
+    @classmethod
+    def draw_area_size_key(cls, context):
+        """Return key which changes when draw area size may be changed."""
+
+        user_prefs = context.preferences
+        prefs = user_prefs.addons[__package__].preferences
+
+        # Expired events are always removed from the oldest one, so the
+        # number of displayed events identifies them in each version.
+        num_events = len(cls.removed_old_event_history())
+
+        show_operator = False
+        operator_history = cls.removed_old_operator_history()
+        if operator_history:
+            time_, _, _, _ = operator_history[-1]
+            show_operator = time.time() - time_ <= prefs.display_time
+
+        return (
+            cls.event_history_version,
+            num_events,
+            cls.operator_history_version,
+            show_operator,
+            tuple(cls.hold_modifier_keys),
+            prefs.font_size,
+            user_prefs.system.dpi,
+            prefs.margin,
+            prefs.align,
+            prefs.show_last_operator,
+            prefs.last_operator_show_mode,
+            show_mouse_hold_status(prefs),
+            prefs.use_custom_mouse_image,
+            tuple(prefs.custom_mouse_size),
+            prefs.mouse_size,
+            bpy.app.translations.locale,
+        )
+
     @classmethod
     def draw_area_size(cls, context):
         """Return draw area size.
@@ -1052,7 +1136,13 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
         font_size = prefs.font_size
         font_id = 0         # TODO: font_id should be constant.
         dpi = user_prefs.system.dpi
-        compat.blf_size(font_id, font_size, dpi)
+        set_font_size(font_id, font_size, dpi)
+
+        # Reuse the size if nothing is changed since last time.
+        key = cls.draw_area_size_key(context)
+        cached_key, cached_size = cls.draw_area_size_cache
+        if key == cached_key:
+            return cached_size
 
         # Calculate width/height of draw area.
         draw_area_width = 0
@@ -1079,6 +1169,9 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
         draw_area_height += \
             cls.DRAW_AREA_MARGIN_TOP + cls.DRAW_AREA_MARGIN_BOTTOM
 
+        cls.draw_area_size_cache = \
+            (key, (draw_area_width, draw_area_height))
+
         return draw_area_width, draw_area_height
 
     @classmethod
@@ -1196,7 +1289,7 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
         operator_height = sh + sh * cls.HEIGHT_RATIO_FOR_SEPARATOR * 0.2
         separator_start_x = operator_start_x
         separator_start_y = operator_start_y + operator_height
-        separator_line_width = blf.dimensions(font_id, "Left Mouse")[0]
+        separator_line_width = cls.text_area_width("Left Mouse", font_id)
         separator_width = separator_line_width + prefs.margin * 2
         separator_height = sh * cls.HEIGHT_RATIO_FOR_SEPARATOR * 0.8
 
@@ -1484,7 +1577,7 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
         font_size = prefs.font_size
         font_id = 0
         dpi = user_prefs.system.dpi
-        compat.blf_size(font_id, font_size, dpi)
+        set_font_size(font_id, font_size, dpi)
 
         # Clip 'TOOLS' and 'UI' region from 'WINDOW' region if need.
         # This prevents from drawing multiple time when
@@ -1814,10 +1907,13 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
                         delta_time < prefs.display_time:
                     last_event[0] = current_time
                     last_event[-1] += 1
+                    self.__class__.event_history_version += 1
                 else:
                     self.event_history.append(current_event)
+                    self.__class__.event_history_version += 1
             else:
                 self.event_history.append(current_event)
+                self.__class__.event_history_version += 1
         self.event_history[:] = self.removed_old_event_history()
 
         # Update operator history.
@@ -1840,6 +1936,7 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
                 idname_py = "{}.{}".format(op_prefix.lower(), op_name)
                 self.operator_history.append(
                     [current_time, op.bl_label, idname_py, op.as_pointer()])
+                self.__class__.operator_history_version += 1
         self.operator_history[:] = self.removed_old_operator_history()
 
         # Redraw regions which we want.
@@ -1930,6 +2027,10 @@ class SK_OT_ScreencastKeys(bpy.types.Operator):
         self.event_history.clear()
         self.operator_history.clear()
         self.draw_regions_prev.clear()
+        cls.draw_area_size_cache = (None, None)
+        text_dimensions_cache.clear()
+        rounded_box_verts.cache_clear()
+        imm.immClearBatchCache()
         context.area.tag_redraw()
 
         cls.running = False
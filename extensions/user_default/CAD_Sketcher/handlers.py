@@ -63,10 +63,14 @@ def unregister_handlers():
 
 def _setup_builtin_handlers():
     from .versioning import write_addon_version, do_versioning
+    from .utilities.dependency_index import reset_dependency_index
 
     add_builtin_handler("version_update", do_versioning)
     add_builtin_handler("save_pre", write_addon_version)
 
+    for event in ("load_post", "undo_post", "redo_post"):
+        add_builtin_handler(event, reset_dependency_index)
+
 
 def register():
     _setup_builtin_handlers()
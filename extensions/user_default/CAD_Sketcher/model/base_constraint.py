@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 from bpy.props import StringProperty, BoolProperty
 from bpy.types import UILayout, Property, Context
@@ -12,6 +12,7 @@ from .base_entity import SlvsGenericEntity
 from ..utilities.view import update_cb, refresh
 from ..utilities.solver import update_system_cb
 from ..utilities.bpy import setprop
+from .utilities import remap_pointer_props
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class GenericConstraint:
     is_reference = False  # Only DimensionalConstraint can be reference
     signature = ()
     props = ()
+    pointer_props = ()  # Index properties of entity pointers, see slvs_entity_pointer
 
     def needs_wp(args):
         return WpReq.OPTIONAL
@@ -55,10 +57,10 @@ class GenericConstraint:
 
     def entities(self):
         props = []
-        for prop_name in dir(self):
-            if prop_name.endswith("_i") or not prop_name.startswith("entity"):
+        for prop_name in self.pointer_props:
+            if not prop_name.startswith("entity"):
                 continue
-            entity = getattr(self, prop_name)
+            entity = getattr(self, prop_name[:-2])
             if not entity:
                 continue
             props.append(entity)
@@ -72,23 +74,11 @@ class GenericConstraint:
                 deps.append(s)
         return deps
 
-    # TODO: avoid duplicating code
+    def remap_pointers(self, mapping: Dict[int, int]):
+        remap_pointer_props(self, mapping)
+
     def update_pointers(self, index_old, index_new):
-        def _update(name):
-            prop = getattr(self, name)
-            if prop == index_old:
-                logger.debug(
-                    "Update reference {} of {} to {}: ".format(name, self, index_new)
-                )
-                setattr(self, name, index_new)
-
-        if hasattr(self, "sketch_i"):
-            _update("sketch_i")
-
-        for prop_name in dir(self):
-            if not prop_name.startswith("entity") or not prop_name.endswith("_i"):
-                continue
-            _update(prop_name)
+        self.remap_pointers({index_old: index_new})
 
     def is_visible(self, context):
         if hasattr(self, "sketch"):
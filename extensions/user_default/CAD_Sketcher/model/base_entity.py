@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 import gpu
 from bpy.props import IntProperty, StringProperty, BoolProperty
@@ -13,6 +13,7 @@ from ..utilities.preferences import get_prefs
 from ..utilities.index import index_to_rgb, breakdown_index
 from ..utilities.view import update_cb
 from ..utilities.solver import update_system_cb
+from .utilities import remap_pointer_props
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,7 @@ class SlvsGenericEntity:
     origin: BoolProperty(name="Origin")
     construction: BoolProperty(name="Construction")
     props = ()
+    pointer_props = ()  # Index properties of entity pointers, see slvs_entity_pointer
     dirty: BoolProperty(name="Needs Update", default=True, options={"SKIP_SAVE"})
 
     @classmethod
@@ -271,24 +273,16 @@ class SlvsGenericEntity:
         """Update parameters from the solvespace entity"""
         pass
 
-    def update_pointers(self, index_old, index_new):
-        def _update(name):
-            prop = getattr(self, name)
-            if prop == index_old:
-                logger.debug(
-                    "Update reference {} of {} to {}: ".format(name, self, index_new)
-                )
-                setattr(self, name, index_new)
-
-        for prop_name in dir(self):
-            if not prop_name.endswith("_i"):
-                continue
-            _update(prop_name)
+    def remap_pointers(self, mapping: Dict[int, int]):
+        remap_pointer_props(self, mapping)
 
         if hasattr(self, "target_object") and self.target_object:
             ob = self.target_object
-            if ob.sketch_index == index_old:
-                ob.sketch_index = index_new
+            if ob.sketch_index in mapping:
+                ob.sketch_index = mapping[ob.sketch_index]
+
+    def update_pointers(self, index_old, index_new):
+        self.remap_pointers({index_old: index_new})
 
     def connection_points(self):
         return []
@@ -5,6 +5,7 @@ from bpy.types import PropertyGroup
 from bpy.props import CollectionProperty
 from bpy.utils import register_classes_factory
 
+from ..utilities.dependency_index import dependency_index
 from .base_entity import SlvsGenericEntity
 from .sketch import SlvsSketch
 
@@ -130,7 +131,17 @@ class SlvsConstraints(PropertyGroup):
             constr: Constraint to be removed.
         """
         i = self.get_index(constr)
-        self.get_list(constr.type).remove(i)
+        self.remove_from_type_index(constr.type, i)
+
+    def remove_from_type_index(self, type: str, index: int):
+        """Remove a constraint by type and local index.
+
+        Arguments:
+            type: Constraint's type.
+            index: Constraint's local index.
+        """
+        dependency_index.remove_constraint(self.id_data, type.lower(), index)
+        self.get_list(type).remove(index)
 
     @property
     def dimensional(self):
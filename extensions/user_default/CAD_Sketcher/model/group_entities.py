@@ -11,9 +11,10 @@ from mathutils import Vector, Euler, Quaternion
 from .. import global_data
 from ..utilities.constants import QUARTER_TURN
 from ..utilities.index import breakdown_index, assemble_index
+from ..utilities.dependency_index import dependency_index
 
 from .base_entity import SlvsGenericEntity
-from .utilities import slvs_entity_pointer, update_pointers
+from .utilities import slvs_entity_pointer, remap_pointers
 from .point_3d import SlvsPoint3D
 from .line_3d import SlvsLine3D
 from .normal_3d import SlvsNormal3D
@@ -143,27 +144,55 @@ class SlvsEntities(PropertyGroup):
             index: The global index of the entity.
         """
         assert isinstance(index, int)
+        self.remove_many((index,))
 
-        if self.get(index).origin:
-            return
-
-        entity_list, i = self._get_list_and_index(index)
-        entity_list.remove(i)
+    def remove_many(self, indices):
+        """Remove multiple entities by index
 
-        # Put last item to removed index and update all pointers to it
-        last_index = len(entity_list) - 1
-
-        if last_index < 0:
-            return
-        if i > last_index:
-            return
+        Each removed entity is replaced by the last item of its collection, references
+        to all moved entities are then updated in a single pass.
 
-        if not i == last_index:  # second last item was deleted
-            entity_list.move(last_index, i)
+        Arguments:
+            indices: The global indices of the entities.
+        """
+        scene = bpy.context.scene
 
-        new_item = entity_list[i]
-        update_pointers(bpy.context.scene, new_item.slvs_index, index)
-        new_item.slvs_index = index
+        local_indices = {}
+        for index in indices:
+            if self.get(index).origin:
+                continue
+            type_index, i = self._breakdown_index(index)
+            local_indices.setdefault(type_index, set()).add(i)
+
+        mapping = {}
+        for type_index, removed in local_indices.items():
+            entity_list = getattr(self, _entity_collections[type_index])
+
+            # Original local index of the item at each position
+            positions = list(range(len(entity_list)))
+
+            for i in sorted(removed, reverse=True):
+                dependency_index.remove_entity(scene, assemble_index(type_index, i))
+                entity_list.remove(i)
+
+                # Put last item to removed index
+                last = positions.pop()
+                if i == len(positions):
+                    continue
+                if i != len(positions) - 1:  # second last item was deleted
+                    entity_list.move(len(positions) - 1, i)
+                positions[i] = last
+
+            for i, old in enumerate(positions):
+                if i == old:
+                    continue
+                index_old = assemble_index(type_index, old)
+                index_new = assemble_index(type_index, i)
+                dependency_index.move_entity(index_old, index_new)
+                entity_list[i].slvs_index = index_new
+                mapping[index_old] = index_new
+
+        remap_pointers(scene, mapping)
 
     def _init_entity(self, entity, fixed, construction, index_reference, visible=True):
         """Initializes all shared entity properties"""
@@ -1,4 +1,5 @@
 import logging
+from typing import Dict
 
 import bpy
 from bpy.props import IntProperty
@@ -6,6 +7,8 @@ from bpy.types import Context
 import math
 from mathutils import Vector, Matrix
 
+from ..utilities.dependency_index import dependency_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +20,10 @@ def slvs_entity_pointer(cls, name, **kwargs):
     annotations[index_prop] = IntProperty(name=name + " index", default=-1, **kwargs)
     setattr(cls, "__annotations__", annotations)
 
+    # Keep a schema of pointer properties to remap indices without inspecting instances
+    pointer_props = getattr(cls, "pointer_props", ())
+    setattr(cls, "pointer_props", (*pointer_props, index_prop))
+
     @property
     def func(self):
         index = getattr(self, index_prop)
@@ -27,6 +34,7 @@ def slvs_entity_pointer(cls, name, **kwargs):
     def setter(self, entity):
         index = entity.slvs_index if entity else -1
         setattr(self, index_prop, index)
+        dependency_index.invalidate()
 
     setattr(cls, name, setter)
 
@@ -138,23 +146,48 @@ def make_coincident(solvesys, point_handle, e2, wp, group, entity_type=None):
     return func(point_handle, handle, **kwargs)
 
 
-def update_pointers(scene, index_old, index_new):
-    """Replaces all references to an entity index with its new index"""
-    logger.debug("Update references {} -> {}".format(index_old, index_new))
-    # NOTE: this should go through all entity pointers and update them if necessary.
-    # It might be possible to use the msgbus to notify and update the IntProperty pointers
+def remap_pointer_props(element, mapping: Dict[int, int]):
+    """Replaces entity indices in the pointer properties of an entity or constraint"""
+    for prop_name in element.pointer_props:
+        index = getattr(element, prop_name)
+        if index not in mapping:
+            continue
+        logger.debug(
+            "Update reference {} of {} to {}: ".format(prop_name, element, mapping[index])
+        )
+        setattr(element, prop_name, mapping[index])
 
-    if scene.sketcher.active_sketch_i == index_old:
+
+def remap_pointers(scene, mapping: Dict[int, int]):
+    """Replaces all references to entity indices in a single pass
+
+    Arguments:
+        scene: Scene to update.
+        mapping: Map of old to new entity indices.
+    """
+    if not mapping:
+        return
+
+    sketcher = scene.sketcher
+    if sketcher.active_sketch_i in mapping:
+        index_new = mapping[sketcher.active_sketch_i]
         logger.debug(
             "Update reference {} of {} to {}: ".format(
-                "active_sketch", scene.sketcher, index_new
+                "active_sketch", sketcher, index_new
             )
         )
-        scene.sketcher.active_sketch_i = index_new
+        sketcher.active_sketch_i = index_new
 
-    for o in scene.sketcher.all:
-        if not hasattr(o, "update_pointers"):
+    for o in sketcher.all:
+        if not hasattr(o, "remap_pointers"):
             continue
-        o.update_pointers(index_old, index_new)
+        o.remap_pointers(mapping)
+
+    dependency_index.remap(scene, mapping)
+    sketcher.purge_stale_data()
 
-    scene.sketcher.purge_stale_data()
+
+def update_pointers(scene, index_old, index_new):
+    """Replaces all references to an entity index with its new index"""
+    logger.debug("Update references {} -> {}".format(index_old, index_new))
+    remap_pointers(scene, {index_old: index_new})
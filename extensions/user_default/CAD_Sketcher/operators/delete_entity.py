@@ -50,9 +50,10 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
             entity.remove_objects()
 
             deps = get_sketch_deps_indicies(entity, context)
+            deps.appendleft(entity.slvs_index)
 
-            for i in reversed(deps):
-                operator.delete(entities.get(i), context)
+            operator.delete_many([entities.get(i) for i in reversed(deps)], context)
+            return
 
         elif is_entity_dependency(entity, context):
             if operator.do_report:
@@ -73,21 +74,32 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
 
     @staticmethod
     def delete(entity, context: Context):
-        entity.selected = False
+        View3D_OT_slvs_delete_entity.delete_many((entity,), context)
 
-        # Delete constraints that depend on entity
+    @staticmethod
+    def delete_many(entities, context: Context):
+        """Delete entities and the constraints that depend on them, references to
+        entities that get a new index are updated once at the end"""
         constraints = context.scene.sketcher.constraints
+        indices = []
 
-        for data_coll, indices in get_constraint_local_indices(entity, context):
-            if not indices:
-                continue
-            for i in reversed(indices):
-                logger.debug("Delete: {}, {}".format(data_coll, i))
-                data_coll.remove(i)
+        for entity in entities:
+            entity.selected = False
 
-        logger.debug("Delete: {}".format(entity))
-        entities = context.scene.sketcher.entities
-        entities.remove(entity.slvs_index)
+            # Delete constraints that depend on entity
+            for data_coll, local_indices in get_constraint_local_indices(
+                entity, context
+            ):
+                if not local_indices:
+                    continue
+                for i in reversed(local_indices):
+                    logger.debug("Delete: {}, {}".format(data_coll, i))
+                    constraints.remove_from_type_index(data_coll[i].type, i)
+
+            logger.debug("Delete: {}".format(entity))
+            indices.append(entity.slvs_index)
+
+        context.scene.sketcher.entities.remove_many(indices)
 
     def execute(self, context: Context):
         index = self.index
@@ -106,13 +118,18 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
                 indices.append(e.slvs_index)
 
             indices.sort(reverse=True)
+            deleted = set()
             for i in indices:
                 e = context.scene.sketcher.entities.get(i)
 
-                # NOTE: this might be slow when a lot of entities are selected, improve!
-                if is_entity_dependency(e, context):
+                # Entities that get deleted along with it don't count as dependents
+                if is_entity_dependency(e, context, ignore=deleted):
                     continue
-                self.delete(e, context)
+                deleted.add(e.slvs_index)
+            self.delete_many(
+                [context.scene.sketcher.entities.get(i) for i in indices if i in deleted],
+                context,
+            )
 
         solve_system(context, context.scene.sketcher.active_sketch)
         refresh(context)
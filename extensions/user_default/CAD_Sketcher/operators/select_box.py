@@ -1,4 +1,5 @@
 import bpy, gpu
+import numpy as np
 from bpy.types import Operator, Context, Event
 from bpy.utils import register_classes_factory
 from mathutils import Vector
@@ -6,9 +7,9 @@ from gpu_extras.batch import batch_for_shader
 
 from .. import global_data
 from ..declarations import Operators
-from ..utilities.index import rgb_to_index
+from ..utilities.index import decode_index_buffer
 from ..utilities.view import refresh
-from ..utilities.select import mode_property, deselect_all
+from ..utilities.select import mode_property, apply_selection_mode
 
 
 def get_start_dist(value1, value2, invert: bool = False):
@@ -65,6 +66,9 @@ class View3D_OT_slvs_select_box(Operator):
         start_x, width = get_start_dist(self.start_coords.x, self.end_coords.x)
         start_y, height = get_start_dist(self.start_coords.y, self.end_coords.y)
 
+        if not width or not height:
+            return False
+
         offscreen = global_data.offscreen
         if not offscreen:
             return False
@@ -72,40 +76,13 @@ class View3D_OT_slvs_select_box(Operator):
             fb = gpu.state.active_framebuffer_get()
             buffer = fb.read_color(start_x, start_y, width, height, 4, 0, "FLOAT")
 
-        if not width or not height:
-            return False
-
-        buffer.dimensions = (width * height, 4)
-
-        # Filter out empty pixels
-        pixels = [p for p in buffer if p[3] > 0]
-
-        # Remove duplicates
-        unique_pixels = []
-        [unique_pixels.append(p[:-1]) for p in pixels if p[:-1] not in unique_pixels]
-
-        entities = []
-        for pixel in unique_pixels:
-            r, g, b = pixel
-
-            index = rgb_to_index(r, g, b)
-            entity = context.scene.sketcher.entities.get(index)
-            entities.append(entity)
-
-        mode = self.mode
-        if mode == "SET":
-            deselect_all(context)
-
-        value = True
-        toggle = mode == "TOGGLE"
-        if mode == "SUBTRACT":
-            value = False
+        entities = context.scene.sketcher.entities
+        indices = [
+            i for i in decode_index_buffer(np.asarray(buffer)).tolist() if entities.get(i)
+        ]
 
-        for e in entities:
-            if toggle:
-                e.selected = not e.selected
-                continue
-            e.selected = value
+        selected = global_data.selected
+        selected[:] = apply_selection_mode(selected, indices, self.mode)
 
         refresh(context)
         return True
@@ -6,6 +6,7 @@ from typing import Dict
 from bpy.types import Scene
 
 from .utilities.index import breakdown_index, assemble_index
+from .utilities.dependency_index import dependency_index
 
 
 def dict_extend(original_dict, other):
@@ -50,6 +51,9 @@ def scene_from_dict(scene: Scene, elements: Dict):
     original.update(elements)
     apply_dict(scene["sketcher"], original)
 
+    # Raw property writes bypass the index bookkeeping
+    dependency_index.invalidate()
+
 
 def _extend_element_dict(scene, elements):
     """Returns dictionary representation of scene with extended entities and constraints"""
@@ -1,7 +1,7 @@
 from unittest import skip
 from testing.utils import BgsTestCase
 from CAD_Sketcher.model.types import SlvsPoint3D
-from CAD_Sketcher.model.utilities import slvs_entity_pointer
+from CAD_Sketcher.model.utilities import slvs_entity_pointer, remap_pointers
 
 from sys import float_info
 
@@ -16,6 +16,19 @@ class TestEntities(BgsTestCase):
         self.assertIsInstance(p1, SlvsPoint3D)
         self.assertEqual(tuple(p1.location), (0, 0, 0))
 
+    def test_remap_pointers(self):
+        entities = self.entities
+
+        p1 = entities.add_point_3d((0, 0, 0))
+        p2 = entities.add_point_3d((1, 1, 1))
+        i1, i2 = p1.slvs_index, p2.slvs_index
+        line = entities.add_line_3d(i1, i2)
+        self.assertEqual(type(line).pointer_props, ("p1_i", "p2_i"))
+
+        # Indices are swapped at once rather than one after the other
+        remap_pointers(self.context.scene, {i1: i2, i2: i1})
+        self.assertEqual((line.p1_i, line.p2_i), (i2, i1))
+
     def test_entity_pointer(self):
         import bpy
         from bpy.types import PropertyGroup
@@ -34,6 +47,7 @@ class TestEntities(BgsTestCase):
         scene = bpy.context.scene
 
         self.assertIsInstance(PointerTest.pointer, property)
+        self.assertEqual(PointerTest.pointer_props, ("pointer_i",))
         self.assertEqual(scene.test_group.rna_type.properties["pointer_i"].type, "INT")
         self.assertEqual(scene.test_group.pointer_i, -1)
         self.assertEqual(scene.test_group.pointer, None)
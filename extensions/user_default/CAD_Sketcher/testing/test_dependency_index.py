@@ -0,0 +1,237 @@
+from time import perf_counter
+
+from testing.utils import BgsTestCase
+from CAD_Sketcher.operators.delete_entity import View3D_OT_slvs_delete_entity
+from CAD_Sketcher.utilities.data_handling import (
+    get_constraint_local_indices,
+    get_flat_deps,
+    get_scoped_constraints,
+    is_entity_dependency,
+)
+
+
+class TestDependencyIndex(BgsTestCase):
+    def new_sketch(self):
+        self.entities.ensure_origin_elements(self.context)
+        return self.entities.add_sketch(self.entities.origin_plane_XY)
+
+    def add_polyline(self, sketch, count):
+        entities = self.entities
+        constraints = self.constraints
+
+        points = [entities.add_point_2d((i, i % 2), sketch) for i in range(count + 1)]
+        lines = []
+        for p1, p2 in zip(points[:-1], points[1:]):
+            line = entities.add_line_2d(p1, p2, sketch)
+            constraints.add_distance(p1, p2, sketch=sketch)
+            lines.append(line)
+        return points, lines
+
+    def assert_matches_scene(self):
+        context = self.context
+        sketcher = self.sketcher
+
+        for entity in sketcher.entities.all:
+            expected = any(
+                entity in get_flat_deps(e)
+                for e in sketcher.entities.all
+                if e != entity
+            )
+            self.assertEqual(is_entity_dependency(entity, context), expected)
+
+            expected = sorted(
+                (c.type, sketcher.constraints.get_index(c))
+                for c in sketcher.constraints.all
+                if entity in c.dependencies()
+            )
+            found = sorted(
+                (data_coll[i].type, i)
+                for data_coll, indices in get_constraint_local_indices(entity, context)
+                for i in indices
+            )
+            self.assertEqual(found, expected)
+
+    def test_lookup(self):
+        sketch = self.new_sketch()
+        points, lines = self.add_polyline(sketch, 4)
+
+        self.assert_matches_scene()
+        self.assertTrue(is_entity_dependency(points[0], self.context))
+        self.assertFalse(is_entity_dependency(lines[0], self.context))
+
+    def test_remove(self):
+        entities = self.entities
+        sketch = self.new_sketch()
+        points, lines = self.add_polyline(sketch, 6)
+        point_indices = [p.slvs_index for p in points]
+        line_indices = [line.slvs_index for line in lines]
+
+        # Removing from the middle of a collection moves the last item
+        View3D_OT_slvs_delete_entity.delete(entities.get(line_indices[2]), self.context)
+        self.assert_matches_scene()
+
+        View3D_OT_slvs_delete_entity.delete(entities.get(line_indices[0]), self.context)
+        View3D_OT_slvs_delete_entity.delete(entities.get(point_indices[0]), self.context)
+        self.assert_matches_scene()
+
+    def test_remove_many(self):
+        entities = self.entities
+        sketch = self.new_sketch()
+        points, lines = self.add_polyline(sketch, 8)
+        kept = [(line.p1.location[:], line.p2.location[:]) for line in lines[4:7]]
+
+        # Removed items from the middle and the tail of the same collection
+        View3D_OT_slvs_delete_entity.delete_many(
+            [lines[1], lines[2], lines[7], lines[3], lines[0]], self.context
+        )
+        self.assert_matches_scene()
+
+        remaining = [line for line in entities.lines2D if line.sketch == sketch]
+        found = [(line.p1.location[:], line.p2.location[:]) for line in remaining]
+        self.assertEqual(sorted(found), sorted(kept))
+        for line in entities.lines2D:
+            self.assertEqual(entities.get(line.slvs_index), line)
+
+    def test_repoint(self):
+        entities = self.entities
+        sketch = self.new_sketch()
+        _, lines = self.add_polyline(sketch, 2)
+        line_index = lines[0].slvs_index
+
+        p = entities.add_point_2d((5, 5), sketch)
+        self.assertFalse(is_entity_dependency(p, self.context))
+
+        entities.get(line_index).p1 = p
+        self.assertTrue(is_entity_dependency(p, self.context))
+        self.assert_matches_scene()
+
+    def test_scoped_constraints(self):
+        sketcher = self.sketcher
+        sketch = self.new_sketch()
+        points, lines = self.add_polyline(sketch, 6)
+        self.constraints.add_horizontal(lines[1], sketch=sketch)
+        self.constraints.add_coincident(points[0], lines[4], sketch=sketch)
+
+        scopes = (
+            [],
+            points[:3],
+            points[:3] + lines[:2],
+            [points[0], lines[4]],
+            points + lines,
+        )
+        for scope in scopes:
+            expected = [
+                c
+                for c in sketcher.constraints.all
+                if all(e in scope for e in c.entities())
+            ]
+            self.assertEqual(get_scoped_constraints(self.context, scope), expected)
+
+
+class TestDeleteSketchBenchmark(BgsTestCase):
+    sizes = (1000, 10000)
+
+    def new_sketch(self, count):
+        entities = self.entities
+        constraints = self.constraints
+
+        sketch = entities.add_sketch(entities.origin_plane_XY)
+
+        # Chain of lines, each point shared by two lines
+        p1 = entities.add_point_2d((0, 0), sketch)
+        for i in range(1, count // 2):
+            p2 = entities.add_point_2d((i, i % 2), sketch)
+            entities.add_line_2d(p1, p2, sketch)
+            constraints.add_distance(p1, p2, sketch=sketch)
+            p1 = p2
+        return sketch
+
+    def test_delete_sketch(self):
+        context = self.context
+        entities = self.entities
+        entities.ensure_origin_elements(context)
+
+        for count in self.sizes:
+            entity_count = sum(entities.collection_offsets().values())
+            sketch = self.new_sketch(count)
+
+            start = perf_counter()
+            View3D_OT_slvs_delete_entity.main(
+                context, sketch.slvs_index, View3D_OT_slvs_delete_entity
+            )
+            elapsed = perf_counter() - start
+
+            print("Delete sketch of {} entities: {:.3f}s".format(count, elapsed))
+            self.assertEqual(
+                sum(entities.collection_offsets().values()), entity_count
+            )
+
+    def test_delete_sketch_followed_by_sketch(self):
+        context = self.context
+        entities = self.entities
+        entities.ensure_origin_elements(context)
+
+        for count in self.sizes:
+            entity_count = sum(entities.collection_offsets().values())
+            sketch = self.new_sketch(count)
+            sketch_count = sum(entities.collection_offsets().values()) - entity_count
+
+            # Entities of the second sketch get moved into the freed slots
+            self.new_sketch(count)
+
+            start = perf_counter()
+            View3D_OT_slvs_delete_entity.main(
+                context, sketch.slvs_index, View3D_OT_slvs_delete_entity
+            )
+            elapsed = perf_counter() - start
+
+            print(
+                "Delete sketch of {} entities followed by another sketch: {:.3f}s".format(
+                    count, elapsed
+                )
+            )
+            self.assertEqual(
+                sum(entities.collection_offsets().values()),
+                entity_count + sketch_count,
+            )
+
+            sketches = set()
+            for entity in entities.all:
+                self.assertEqual(entities.get(entity.slvs_index), entity)
+                if hasattr(entity, "sketch_i"):
+                    sketches.add(entity.sketch_i)
+            self.assertEqual(len(sketches), 1)
+
+            View3D_OT_slvs_delete_entity.main(
+                context, sketches.pop(), View3D_OT_slvs_delete_entity
+            )
+
+
+class TestScopedConstraintsBenchmark(BgsTestCase):
+    sizes = (1000, 10000)
+
+    def test_scoped_constraints(self):
+        context = self.context
+        entities = self.entities
+        constraints = self.constraints
+        entities.ensure_origin_elements(context)
+
+        for count in self.sizes:
+            sketch = entities.add_sketch(entities.origin_plane_XY)
+
+            # Chain of points with a distance constraint between neighbours
+            points = [entities.add_point_2d((i, i % 2), sketch) for i in range(count)]
+            for p1, p2 in zip(points[:-1], points[1:]):
+                constraints.add_distance(p1, p2, sketch=sketch)
+            scope = points[: count // 2]
+
+            start = perf_counter()
+            scoped = get_scoped_constraints(context, scope)
+            elapsed = perf_counter() - start
+
+            print(
+                "Scope {} of {} constraints: {:.3f}s".format(
+                    len(scope), count - 1, elapsed
+                )
+            )
+            self.assertEqual(len(scoped), len(scope) - 1)
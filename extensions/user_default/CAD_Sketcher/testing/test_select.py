@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import numpy as np
+
+from CAD_Sketcher.utilities.index import (
+    decode_index_buffer,
+    index_to_rgb,
+    rgb_to_index,
+)
+from CAD_Sketcher.utilities.select import apply_selection_mode
+
+
+def pixel_buffer(indices, width, height):
+    """Create a RGBA float buffer filled with the color of given indices,
+    -1 leaves a pixel empty"""
+    buffer = np.zeros((width * height, 4), dtype=np.float32)
+    for i, index in enumerate(indices):
+        if index == -1:
+            continue
+        buffer[i] = (*index_to_rgb(index), 1.0)
+    return buffer
+
+
+class TestDecodeIndexBuffer(TestCase):
+    def test_decode(self):
+        indices = [0, 1, 255, 256, 5 << 20 | 3, 9 << 20 | 0xFFFFF]
+        buffer = pixel_buffer(indices, len(indices), 1)
+        self.assertEqual(decode_index_buffer(buffer).tolist(), sorted(indices))
+
+    def test_matches_rgb_to_index(self):
+        for index in (3, 1 << 20, 6 << 20 | 1234):
+            r, g, b = index_to_rgb(index)
+            buffer = pixel_buffer([index], 1, 1)
+            self.assertEqual(decode_index_buffer(buffer).tolist(), [rgb_to_index(r, g, b)])
+
+    def test_empty_and_duplicates(self):
+        indices = [-1, 7, 7, -1, 3, 7, -1, -1, 3]
+        buffer = pixel_buffer(indices, 3, 3)
+        self.assertEqual(decode_index_buffer(buffer).tolist(), [3, 7])
+
+        empty = np.zeros((4 * 4, 4), dtype=np.float32)
+        self.assertEqual(decode_index_buffer(empty).tolist(), [])
+
+    def test_buffer_shape(self):
+        buffer = pixel_buffer([1, 2, 3, 4], 2, 2).reshape(2, 2, 4)
+        self.assertEqual(decode_index_buffer(buffer).tolist(), [1, 2, 3, 4])
+
+
+class TestSelectionMode(TestCase):
+    selected = [5, 1, 3]
+    hits = [1, 2]
+
+    def test_set(self):
+        self.assertEqual(apply_selection_mode(self.selected, self.hits, "SET"), [1, 2])
+
+    def test_extend(self):
+        result = apply_selection_mode(self.selected, self.hits, "EXTEND")
+        self.assertEqual(result, [5, 1, 3, 2])
+
+    def test_subtract(self):
+        result = apply_selection_mode(self.selected, self.hits, "SUBTRACT")
+        self.assertEqual(result, [5, 3])
+
+    def test_toggle(self):
+        result = apply_selection_mode(self.selected, self.hits, "TOGGLE")
+        self.assertEqual(result, [5, 3, 2])
+
+    def test_empty(self):
+        self.assertEqual(apply_selection_mode([], [], "EXTEND"), [])
+        self.assertEqual(apply_selection_mode([4], [], "TOGGLE"), [4])
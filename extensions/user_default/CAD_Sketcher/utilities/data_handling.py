@@ -1,9 +1,10 @@
 from collections import deque
-from typing import Generator, Deque, List, Sequence
+from typing import Generator, Deque, Iterable, List, Sequence
 
 from bpy.types import Scene, Context
 
 from ..model.types import SlvsGenericEntity, SlvsSketch, GenericConstraint
+from .dependency_index import dependency_index
 
 
 def to_list(value):
@@ -61,27 +62,25 @@ def get_scene_entities(scene: Scene):
 def get_entity_deps(
     entity: SlvsGenericEntity, context: Context
 ) -> Generator[SlvsGenericEntity, None, None]:
-    for scene_entity in get_scene_entities(context.scene):
-        deps = set(get_flat_deps(scene_entity))
-        if entity in deps:
-            yield scene_entity
+    """Yield entities that directly or indirectly depend on given entity"""
+    entities = context.scene.sketcher.entities
+    for i in dependency_index.all_dependents(context.scene, entity.slvs_index):
+        yield entities.get(i)
 
 
 def _is_referenced_by_constraint(entity, context):
-    for c in context.scene.sketcher.constraints.all:
-        if entity in c.dependencies():
-            return True
-    return False
+    return dependency_index.has_constraints(context.scene, entity.slvs_index)
 
 
-def is_entity_dependency(entity: SlvsGenericEntity, context: Context) -> bool:
-    """Check if entity is a dependency of another entity"""
-    deps = get_entity_deps(entity, context)
-    try:
-        next(deps)
-    except StopIteration:
-        return False
-    return True
+def is_entity_dependency(
+    entity: SlvsGenericEntity, context: Context, ignore: Iterable[int] = ()
+) -> bool:
+    """Check if entity is a dependency of another entity, entities with an index in
+    ignore don't count"""
+    if not ignore:
+        return dependency_index.has_dependents(context.scene, entity.slvs_index)
+    dependents = dependency_index.dependents(context.scene, entity.slvs_index)
+    return not dependents.issubset(ignore)
 
 
 def is_entity_referenced(entity: SlvsGenericEntity, context: Context) -> bool:
@@ -107,15 +106,14 @@ def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context):
 def get_constraint_local_indices(
     entity: SlvsGenericEntity, context: Context
 ) -> Deque[int]:
+    """Return the constraint collections and sorted local indices of constraints
+    that depend on given entity"""
     constraints = context.scene.sketcher.constraints
     ret_list = deque()
 
-    for data_coll in constraints.get_lists():
-        indices = deque()
-        for c in data_coll:
-            if entity in c.dependencies():
-                indices.append(constraints.get_index(c))
-        ret_list.append((data_coll, indices))
+    indices = dependency_index.constraint_indices(context.scene, entity.slvs_index)
+    for name, local_indices in indices.items():
+        ret_list.append((constraints.get_list(name), deque(local_indices)))
     return ret_list
 
 
@@ -124,11 +122,15 @@ def get_scoped_constraints(
 ) -> List[GenericConstraint]:
     """Return a list of constraints that are in the scope of a set of entities"""
 
+    indices = {e.slvs_index for e in entities}
+    scoped = dependency_index.scoped_constraint_indices(context.scene, indices)
+
     constraints = []
-    for constraint in context.scene.sketcher.constraints.all:
-        if not all([e in entities for e in constraint.entities()]):
+    for data_coll in context.scene.sketcher.constraints.get_lists():
+        if not len(data_coll):
             continue
-        constraints.append(constraint)
+        for i in scoped.get(data_coll[0].type.lower(), ()):
+            constraints.append(data_coll[i])
     return constraints
 
 
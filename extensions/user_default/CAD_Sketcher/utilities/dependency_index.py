@@ -0,0 +1,232 @@
+import logging
+from bisect import bisect_left
+from collections import deque
+from itertools import count
+from typing import Dict, List, Set
+
+from bpy.types import Scene
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyIndex:
+    """Reverse lookup of entity references.
+
+    Maps an entity index to the entities and constraints that directly depend on it.
+    The index is built lazily from the scene, entity and constraint removal keep it
+    up to date while any other change of references invalidates it.
+    Code writing raw "_i" pointer properties has to call invalidate().
+    """
+
+    def __init__(self):
+        self._keys = count()
+        self.invalidate()
+
+    def invalidate(self):
+        # (scene pointer, entity count, constraint count) the index was built for
+        self._stamp = None
+
+        # entity index -> indices of direct dependencies
+        self._deps = {}
+        # entity index -> indices of entities that directly depend on it
+        self._dependents = {}
+
+        # constraint collection name -> constraint keys in collection order,
+        # keys are increasing so the local index of a key can be bisected
+        self._constraint_keys = {}
+        # constraint key -> (collection name, indices of dependencies, number of
+        # leading dependencies that are constrained entities rather than the sketch)
+        self._constraint_deps = {}
+        # entity index -> keys of constraints that depend on it
+        self._constraint_refs = {}
+        # keys of constraints without any constrained entity
+        self._unscoped_constraints = set()
+
+    @staticmethod
+    def _get_stamp(scene: Scene):
+        sketcher = scene.sketcher
+        entity_count = sum(sketcher.entities.collection_offsets().values())
+        constraint_count = sum(len(coll) for coll in sketcher.constraints.get_lists())
+        return scene.as_pointer(), entity_count, constraint_count
+
+    def _is_current(self, scene: Scene) -> bool:
+        return self._stamp is not None and self._stamp == self._get_stamp(scene)
+
+    def _shift_stamp(self, entities: int = 0, constraints: int = 0):
+        ptr, entity_count, constraint_count = self._stamp
+        self._stamp = (ptr, entity_count + entities, constraint_count + constraints)
+
+    def _build(self, scene: Scene):
+        self.invalidate()
+        sketcher = scene.sketcher
+
+        for entity in sketcher.entities.all:
+            deps = tuple(e.slvs_index for e in entity.dependencies() if e is not None)
+            self._deps[entity.slvs_index] = deps
+            for dep in deps:
+                self._dependents.setdefault(dep, set()).add(entity.slvs_index)
+
+        for data_coll in sketcher.constraints.get_lists():
+            if not len(data_coll):
+                continue
+            name = data_coll[0].type.lower()
+            keys = self._constraint_keys[name] = []
+            for c in data_coll:
+                key = next(self._keys)
+                keys.append(key)
+                deps = tuple(e.slvs_index for e in c.dependencies() if e is not None)
+                entity_count = len(c.entities())
+                self._constraint_deps[key] = (name, deps, entity_count)
+                if not entity_count:
+                    self._unscoped_constraints.add(key)
+                for dep in deps:
+                    self._constraint_refs.setdefault(dep, set()).add(key)
+
+        self._stamp = self._get_stamp(scene)
+        logger.debug(
+            "Build dependency index: {} entities, {} constraints".format(
+                len(self._deps), len(self._constraint_deps)
+            )
+        )
+
+    def ensure(self, scene: Scene):
+        """Rebuild the index if it doesn't match the scene's data"""
+        if not self._is_current(scene):
+            self._build(scene)
+
+    # Lookups
+    def dependents(self, scene: Scene, index: int) -> Set[int]:
+        """Indices of entities that directly depend on the entity with given index"""
+        self.ensure(scene)
+        return set(self._dependents.get(index, ()))
+
+    def all_dependents(self, scene: Scene, index: int) -> List[int]:
+        """Sorted indices of entities that directly or indirectly depend on the entity"""
+        self.ensure(scene)
+        found = set()
+        queue = deque((index,))
+        while queue:
+            for d in self._dependents.get(queue.popleft(), ()):
+                if d in found or d == index:
+                    continue
+                found.add(d)
+                queue.append(d)
+        return sorted(found)
+
+    def has_dependents(self, scene: Scene, index: int) -> bool:
+        self.ensure(scene)
+        return bool(self._dependents.get(index))
+
+    def has_constraints(self, scene: Scene, index: int) -> bool:
+        self.ensure(scene)
+        return bool(self._constraint_refs.get(index))
+
+    def constraint_indices(self, scene: Scene, index: int) -> Dict[str, List[int]]:
+        """Sorted local indices of constraints that depend on the entity,
+        grouped by constraint collection name"""
+        self.ensure(scene)
+        ret = {}
+        for key in self._constraint_refs.get(index, ()):
+            self._add_local_index(ret, key)
+        for indices in ret.values():
+            indices.sort()
+        return ret
+
+    def scoped_constraint_indices(
+        self, scene: Scene, indices: Set[int]
+    ) -> Dict[str, List[int]]:
+        """Sorted local indices of constraints whose entities are all within the given
+        entity indices, grouped by constraint collection name"""
+        self.ensure(scene)
+
+        # Only constraints that reference one of the entities can be in scope
+        candidates = set(self._unscoped_constraints)
+        for index in indices:
+            candidates.update(self._constraint_refs.get(index, ()))
+
+        ret = {}
+        for key in candidates:
+            _, deps, entity_count = self._constraint_deps[key]
+            if not indices.issuperset(deps[:entity_count]):
+                continue
+            self._add_local_index(ret, key)
+        for local_indices in ret.values():
+            local_indices.sort()
+        return ret
+
+    def _add_local_index(self, ret: Dict[str, List[int]], key: int):
+        name, _, _ = self._constraint_deps[key]
+        local_index = bisect_left(self._constraint_keys[name], key)
+        ret.setdefault(name, []).append(local_index)
+
+    # Updates
+    def remove_entity(self, scene: Scene, index: int):
+        """Drop an entity, call before it's removed from its collection"""
+        if not self._is_current(scene):
+            self.invalidate()
+            return
+        if self._dependents.get(index) or self._constraint_refs.get(index):
+            # Removal leaves dangling references, rebuild on next lookup
+            self.invalidate()
+            return
+
+        self._dependents.pop(index, None)
+        self._constraint_refs.pop(index, None)
+        for dep in self._deps.pop(index, ()):
+            self._dependents[dep].discard(index)
+        self._shift_stamp(entities=-1)
+
+    def move_entity(self, index_old: int, index_new: int):
+        """Move the dependencies of an entity which got a new index"""
+        if self._stamp is None:
+            return
+
+        deps = self._deps.pop(index_old, ())
+        self._deps[index_new] = deps
+        for dep in deps:
+            dependents = self._dependents[dep]
+            dependents.discard(index_old)
+            dependents.add(index_new)
+
+    def remap(self, scene: Scene, mapping: Dict[int, int]):
+        """Redirect all references to entity indices based on an old to new index map"""
+        if not self._is_current(scene):
+            self.invalidate()
+            return
+
+        dependents = {old: self._dependents.pop(old, set()) for old in mapping}
+        for d in set().union(*dependents.values()):
+            self._deps[d] = tuple(mapping.get(i, i) for i in self._deps[d])
+        for old, entities in dependents.items():
+            if entities:
+                self._dependents.setdefault(mapping[old], set()).update(entities)
+
+        refs = {old: self._constraint_refs.pop(old, set()) for old in mapping}
+        for key in set().union(*refs.values()):
+            name, deps, entity_count = self._constraint_deps[key]
+            deps = tuple(mapping.get(i, i) for i in deps)
+            self._constraint_deps[key] = (name, deps, entity_count)
+        for old, keys in refs.items():
+            if keys:
+                self._constraint_refs.setdefault(mapping[old], set()).update(keys)
+
+    def remove_constraint(self, scene: Scene, name: str, local_index: int):
+        """Drop a constraint, call before it's removed from its collection"""
+        if not self._is_current(scene):
+            self.invalidate()
+            return
+
+        key = self._constraint_keys[name].pop(local_index)
+        _, deps, _ = self._constraint_deps.pop(key)
+        self._unscoped_constraints.discard(key)
+        for dep in deps:
+            self._constraint_refs[dep].discard(key)
+        self._shift_stamp(constraints=-1)
+
+
+dependency_index = DependencyIndex()
+
+
+def reset_dependency_index(*args):
+    """Handler to drop the index when data gets reloaded"""
+    dependency_index.invalidate()
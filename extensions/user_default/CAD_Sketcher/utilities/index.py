@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def index_to_rgb(i: int):
     r = (i & int("0x000000FF", 16)) / 255
     g = ((i & int("0x0000FF00", 16)) >> 8) / 255
@@ -10,6 +13,22 @@ def rgb_to_index(r: int, g: int, b: int) -> int:
     return i
 
 
+def decode_index_buffer(pixels) -> np.ndarray:
+    """Decode pixels of the selection framebuffer into entity indices
+
+    Arguments:
+        pixels: Array like of RGBA float values in range 0-1 with shape (n, 4),
+            pixels with zero alpha are ignored.
+
+    Returns:
+        np.ndarray: Sorted unique indices, see rgb_to_index for the single pixel case.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32).reshape(-1, 4)
+    channels = np.rint(pixels[pixels[:, 3] > 0, :3] * 255).astype(np.int64)
+    indices = channels[:, 0] | channels[:, 1] << 8 | channels[:, 2] << 16
+    return np.unique(indices)
+
+
 def breakdown_index(index: int):
     # See SlvsEntities._set_index for the reverse operation
     type_index = index >> 20
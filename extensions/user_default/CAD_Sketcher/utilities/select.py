@@ -1,5 +1,7 @@
 import logging
+from typing import List, Sequence
 
+import numpy as np
 from bpy.props import EnumProperty
 from bpy.types import Context
 
@@ -33,6 +35,38 @@ def deselect_all(context: Context):
     global_data.selected.clear()
 
 
+def apply_selection_mode(
+    selected: Sequence[int], indices: Sequence[int], mode: str
+) -> List[int]:
+    """Combine the current selection with a set of hit entity indices
+
+    Arguments:
+        selected: Indices of currently selected entities.
+        indices: Unique indices of entities hit by the selection.
+        mode: One of the items of mode_property.
+
+    Returns:
+        List[int]: Indices of the new selection, existing items keep their order.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if mode == "SET":
+        return indices.tolist()
+
+    selected = np.asarray(selected, dtype=np.int64)
+    is_hit = np.isin(selected, indices)
+    new = indices[~np.isin(indices, selected)]
+
+    if mode == "EXTEND":
+        result = np.concatenate((selected, new))
+    elif mode == "SUBTRACT":
+        result = selected[~is_hit]
+    elif mode == "TOGGLE":
+        result = np.concatenate((selected[~is_hit], new))
+    else:
+        raise ValueError("Unknown selection mode: {}".format(mode))
+    return result.tolist()
+
+
 mode_property = EnumProperty(
     name="Mode",
     items=[
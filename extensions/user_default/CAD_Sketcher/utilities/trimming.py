@@ -182,7 +182,7 @@ class TrimSegment:
                 else:
                     # if the original segment doesn't get reused the original constraints
                     # have to be remapped to the new segment
-                    setattr(c, "entity{}_i".format(i + 1), new_segment.slvs_index)
+                    setattr(c, "entity{}".format(i + 1), new_segment)
 
         def _get_msg_obsolete():
             msg = "Remove obsolete intersections:"
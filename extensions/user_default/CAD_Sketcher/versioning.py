@@ -20,9 +20,10 @@ def recalc_pointers(scene):
     """Updates type index of entities keeping local index as is"""
 
     # TODO: Move to utilities.data_handling
-    from .model.utilities import update_pointers
+    from .model.utilities import remap_pointers
 
     msg = ""
+    mapping = {}
     entities = list(scene.sketcher.entities.all)
     for e in reversed(entities):
         i = e.slvs_index
@@ -31,7 +32,9 @@ def recalc_pointers(scene):
 
         if i != e.slvs_index:
             msg += "\n - {}: {} -> {}".format(e, i, e.slvs_index)
-            update_pointers(scene, i, e.slvs_index)
+            mapping[i] = e.slvs_index
+
+    remap_pointers(scene, mapping)
 
     if msg:
         logger.debug("Update entity indices:" + msg)